@@ -5,40 +5,26 @@ Created on Tue May  9 08:34:37 2023
 @author: ardya
 """
 
-from aeropy.xfoil_module import call, output_reader, create_input
 import numpy as np
 import matplotlib.pyplot as plt
-import openmdao.api as om
+import airfoilgeometry as ag
+import xfoilrunner as xr
 
 airfoil_name = 'airfoiltest'
-x_array = np.arange(0, 1.01, .01)
-x_list = x_array.tolist()
 thickness = .15
-y_u_array = np.sqrt(thickness**2 - (x_array - 0.5)
-                    ** 2 * (thickness**2 / 0.5**2))
-y_u_list = y_u_array.tolist()
-y_l_array = -y_u_array
-y_l_list = y_l_array.tolist()
+coordinates = ag.EllipseAirfoils(thickness)[0]
 
-create_input(x_list, y_u_list, y_l=y_l_list, filename=airfoil_name)
 alpha_list = np.arange(start=0, stop=20, step=.5)
 reynolds = 1e6
 mach = 0
-aoa_start = 0.0
-aoa_end = max(alpha_list)
 n_crit = 9
-call(airfoil_name, alfas=alpha_list, output='Polar',
-     Reynolds=reynolds, NACA=False, iteration=100, PANE=True,
-     NORM=True, )
-data = output_reader(
-    f'Polar_{airfoil_name}_{reynolds}_{aoa_start}_{aoa_end}', separator='\t', rows_to_skip=10)
 
-L_D = []
-for a, b in zip(data['CL'], data['CD']):
-    L_D.append(a / b)
+job = xr.PolarJob(coordinates, reynolds, mach=mach, n_crit=n_crit, alphas=tuple(alpha_list), iteration=100,
+                  pane=True, norm=True, name=airfoil_name)
+data = xr.RunPolar(job).polar
 
-L_D_array = np.array(L_D)
+L_D_array = data['CL'] / data['CD']
 
-plt.plot(x_array, y_u_array)
+plt.plot(coordinates[:, 0], coordinates[:, 1])
 plt.xlim(0, 1)
 plt.ylim(0, 1)
@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Tue Oct 20 11:02:58 2026
+
+Batched parametric airfoil geometry. Every family returns one contiguous (n_airfoils, n_coordinates, 2) array
+in XFOIL order on a cosine-clustered grid, ready for panelmethod.PanelPolar or xfoilrunner.PolarJob.
+@author: ardya
+"""
+
+from math import comb
+import numpy as np
+
+# NACA 5-digit mean lines by the second and third digit: (m, k1, k2/k1), for a design lift coefficient of 0.3
+NACA5_MEANLINES = {
+    (1, 0): (0.0580, 361.4, 0.0),
+    (2, 0): (0.1260, 51.64, 0.0),
+    (3, 0): (0.2025, 15.957, 0.0),
+    (4, 0): (0.2900, 6.643, 0.0),
+    (5, 0): (0.3910, 3.230, 0.0),
+    (2, 1): (0.1300, 51.99, 0.000764),
+    (3, 1): (0.2170, 15.793, 0.00677),
+    (4, 1): (0.3180, 6.520, 0.0303),
+    (5, 1): (0.4410, 3.191, 0.1355),
+}
+
+
+def CosineSpacing(n_points):
+    """
+    Function to generate chordwise stations clustered at the leading and trailing edge.
+
+    Parameters
+    ----------
+    n_points : int
+        Number of stations.
+
+    Returns
+    -------
+    x : array of floats
+        Stations from 0 to 1.
+
+    """
+    return 0.5 * (1 - np.cos(np.linspace(0, np.pi, n_points)))
+
+
+def AssembleAirfoils(x_u, y_u, x_l, y_l):
+    """
+    Function to join upper and lower surfaces, given from the leading edge to the trailing edge, into XFOIL ordered
+    coordinates, trailing edge over the upper surface to the leading edge and back over the lower surface.
+
+    Parameters
+    ----------
+    x_u, y_u, x_l, y_l : array of floats
+        Surface coordinates of shape (n_airfoils, n_points) or (n_points,).
+
+    Returns
+    -------
+    coordinates : array of floats
+        Coordinates of shape (n_airfoils, 2*n_points - 1, 2), the leading edge point shared.
+
+    """
+    x_u, y_u, x_l, y_l = np.broadcast_arrays(*(np.atleast_2d(value) for value in (x_u, y_u, x_l, y_l)))
+    coordinates = np.empty(x_u.shape[:-1] + (2 * x_u.shape[-1] - 1, 2))
+    coordinates[:, :x_u.shape[-1], 0] = x_u[:, ::-1]
+    coordinates[:, :x_u.shape[-1], 1] = y_u[:, ::-1]
+    coordinates[:, x_u.shape[-1]:, 0] = x_l[:, 1:]
+    coordinates[:, x_u.shape[-1]:, 1] = y_l[:, 1:]
+    return coordinates
+
+
+def _CamberedAirfoils(x, yc, dyc, thickness):
+    # thickness applied normal to the mean line
+    angle = np.arctan(dyc)
+    return AssembleAirfoils(x - thickness * np.sin(angle), yc + thickness * np.cos(angle),
+                            x + thickness * np.sin(angle), yc - thickness * np.cos(angle))
+
+
+def NACAThickness(x, t):
+    """
+    Function to calculate the NACA 4-digit half thickness distribution with a closed trailing edge.
+
+    Parameters
+    ----------
+    x : array of floats
+        Chordwise stations.
+    t : float or array of floats
+        Maximum thickness to chord ratio, one value per airfoil.
+
+    Returns
+    -------
+    array of floats
+        Half thickness of shape (n_airfoils, n_points).
+
+    """
+    t = np.atleast_1d(np.asarray(t, dtype=float))[:, None]
+    return 5 * t * (0.2969 * np.sqrt(x) - 0.1260 * x - 0.3516 * x**2 + 0.2843 * x**3 - 0.1036 * x**4)
+
+
+def NACA4Airfoils(m, p, t, n_points=101):
+    """
+    Function to generate NACA 4-digit airfoils.
+
+    Parameters
+    ----------
+    m : float or array of floats
+        Maximum camber to chord ratio, e.g. 0.02 for a NACA 2412.
+    p : float or array of floats
+        Chordwise position of maximum camber, e.g. 0.4 for a NACA 2412.
+    t : float or array of floats
+        Maximum thickness to chord ratio, e.g. 0.12 for a NACA 2412.
+    n_points : int, optional
+        Number of cosine spaced stations per surface.
+
+    Returns
+    -------
+    coordinates : array of floats
+        Coordinates of shape (n_airfoils, 2*n_points - 1, 2) in XFOIL order.
+
+    """
+    m, p, t = np.broadcast_arrays(*(np.atleast_1d(np.asarray(value, dtype=float)) for value in (m, p, t)))
+    x = CosineSpacing(n_points)
+    m, p = m[:, None], np.where(m > 0, p, 0.5)[:, None]
+    front = x < p
+    yc = np.where(front, m / p**2 * (2 * p * x - x**2), m / (1 - p)**2 * (1 - 2 * p + 2 * p * x - x**2))
+    dyc = np.where(front, 2 * m / p**2 * (p - x), 2 * m / (1 - p)**2 * (p - x))
+    return _CamberedAirfoils(x, yc, dyc, NACAThickness(x, t))
+
+
+def NACA5Airfoils(designations, n_points=101):
+    """
+    Function to generate NACA 5-digit airfoils.
+
+    Parameters
+    ----------
+    designations : str or list of str
+        Five digit designations, e.g. '23012'.
+    n_points : int, optional
+        Number of cosine spaced stations per surface.
+
+    Returns
+    -------
+    coordinates : array of floats
+        Coordinates of shape (n_airfoils, 2*n_points - 1, 2) in XFOIL order.
+
+    """
+    if isinstance(designations, str):
+        designations = [designations]
+    x = CosineSpacing(n_points)
+    yc = np.empty((len(designations), n_points))
+    dyc = np.empty((len(designations), n_points))
+    t = np.empty(len(designations))
+    for i, designation in enumerate(designations):
+        if len(designation) != 5 or not designation.isdigit():
+            raise ValueError(f'{designation!r} is not a NACA 5-digit designation.')
+        L, P, Q = int(designation[0]), int(designation[1]), int(designation[2])
+        if (P, Q) not in NACA5_MEANLINES:
+            raise ValueError(f'NACA {designation} has no tabulated mean line.')
+        m, k1, k2_k1 = NACA5_MEANLINES[P, Q]
+        # the tabulated mean lines are for a design lift coefficient of 0.3, scaled by 0.15*L
+        scale = 0.15 * L / 0.3
+        front = x < m
+        if Q == 0:
+            yc[i] = np.where(front, k1 / 6 * (x**3 - 3 * m * x**2 + m**2 * (3 - m) * x), k1 * m**3 / 6 * (1 - x))
+            dyc[i] = np.where(front, k1 / 6 * (3 * x**2 - 6 * m * x + m**2 * (3 - m)), -k1 * m**3 / 6)
+        else:
+            yc[i] = np.where(front, k1 / 6 * ((x - m)**3 - k2_k1 * (1 - m)**3 * x - m**3 * x + m**3),
+                             k1 / 6 * (k2_k1 * (x - m)**3 - k2_k1 * (1 - m)**3 * x - m**3 * x + m**3))
+            dyc[i] = np.where(front, k1 / 6 * (3 * (x - m)**2 - k2_k1 * (1 - m)**3 - m**3),
+                              k1 / 6 * (3 * k2_k1 * (x - m)**2 - k2_k1 * (1 - m)**3 - m**3))
+        yc[i] *= scale
+        dyc[i] *= scale
+        t[i] = int(designation[3:]) / 100
+    return _CamberedAirfoils(x, yc, dyc, NACAThickness(x, t))
+
+
+def CSTAirfoils(upper, lower, n_points=101, N1=0.5, N2=1.0, te_thickness=0.0):
+    """
+    Function to generate airfoils from Kulfan's class-shape transformation.
+
+    Parameters
+    ----------
+    upper : array of floats
+        Bernstein weights of the upper surface, of shape (n_airfoils, n_weights) or (n_weights,).
+    lower : array of floats
+        Bernstein weights of the lower surface, negative for a surface below the chord line.
+    n_points : int, optional
+        Number of cosine spaced stations per surface.
+    N1, N2 : float, optional
+        Class function exponents, 0.5 and 1 for a round nose and sharp trailing edge.
+    te_thickness : float or array of floats, optional
+        Trailing edge thickness to chord ratio.
+
+    Returns
+    -------
+    coordinates : array of floats
+        Coordinates of shape (n_airfoils, 2*n_points - 1, 2) in XFOIL order.
+
+    """
+    upper, lower = np.atleast_2d(np.asarray(upper, dtype=float)), np.atleast_2d(np.asarray(lower, dtype=float))
+    x = CosineSpacing(n_points)
+    te = np.atleast_1d(np.asarray(te_thickness, dtype=float))[:, None]
+
+    def surface(weights):
+        order = weights.shape[-1] - 1
+        bernstein = np.stack([comb(order, i) * x**i * (1 - x)**(order - i) for i in range(order + 1)])
+        return x**N1 * (1 - x)**N2 * (weights @ bernstein)
+
+    return AssembleAirfoils(x, surface(upper) + 0.5 * te * x, x, surface(lower) - 0.5 * te * x)
+
+
+def EllipseAirfoils(thickness, n_points=101):
+    """
+    Function to generate symmetric elliptical sections, the form airfoil_optimization.py started from.
+
+    Parameters
+    ----------
+    thickness : float or array of floats
+        Half thickness to chord ratio, the section is 2*thickness thick at mid chord.
+    n_points : int, optional
+        Number of cosine spaced stations per surface.
+
+    Returns
+    -------
+    coordinates : array of floats
+        Coordinates of shape (n_airfoils, 2*n_points - 1, 2) in XFOIL order.
+
+    """
+    thickness = np.atleast_1d(np.asarray(thickness, dtype=float))[:, None]
+    x = CosineSpacing(n_points)
+    y_u = np.sqrt(np.maximum(thickness**2 - (x - 0.5)**2 * (thickness**2 / 0.5**2), 0))
+    return AssembleAirfoils(x, y_u, x, -y_u)
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Wed Oct 21 14:31:07 2026
+
+International Standard Atmosphere through the mesosphere, from a precomputed table or the exact layer equations.
+@author: ardya
+"""
+
+from collections import namedtuple
+import numpy as np
+
+G0 = 9.80665 # m/s2
+R = 287.05287 # J/kgK
+GAMMA = 1.4
+T0 = 288.15 # K
+P0 = 101325.0 # Pa
+RHO0 = P0 / (R * T0) # 1.225 kg/m3
+
+# Geopotential base altitude in m and temperature lapse rate in K/m of every ISA layer
+LAYER_BASES = np.array([0.0, 11000.0, 20000.0, 32000.0, 47000.0, 51000.0, 71000.0])
+LAPSE_RATES = np.array([-6.5e-3, 0.0, 1.0e-3, 2.8e-3, 0.0, -2.8e-3, -2.0e-3])
+MIN_ALTITUDE = -5000.0
+MAX_ALTITUDE = 84852.0
+
+AtmosphereState = namedtuple('AtmosphereState', ['rho', 'p', 'T', 'a', 'sigma'])
+AtmosphereState.__doc__ = """
+Atmosphere at an altitude, density rho in kg/m3, pressure p in Pa, temperature T in K, speed of sound a in m/s
+and density ratio sigma to the standard sea level density of 1.225 kg/m3.
+"""
+
+_TABLE = None
+
+
+def _LayerBases():
+    # temperature and pressure at the base of every layer, integrated upwards from sea level
+    T = [T0]
+    p = [P0]
+    for base, top, lapserate in zip(LAYER_BASES[:-1], LAYER_BASES[1:], LAPSE_RATES[:-1]):
+        T_top = T[-1] + lapserate * (top - base)
+        if lapserate == 0:
+            p.append(p[-1] * np.exp(-G0 * (top - base) / (R * T[-1])))
+        else:
+            p.append(p[-1] * (T_top / T[-1])**(-G0 / (R * lapserate)))
+        T.append(T_top)
+    return np.array(T), np.array(p)
+
+
+BASE_TEMPERATURES, BASE_PRESSURES = _LayerBases()
+
+
+def _CheckAltitude(altitude):
+    if np.any(altitude < MIN_ALTITUDE) or np.any(altitude > MAX_ALTITUDE):
+        raise ValueError(f'Altitude must be between {MIN_ALTITUDE:g} and {MAX_ALTITUDE:g} m.')
+
+
+def Layer(altitude):
+    """
+    Function to find the ISA layer of an altitude, the layer below sea level extends the troposphere.
+
+    Parameters
+    ----------
+    altitude : float or array of floats
+        Geopotential altitude in m.
+
+    Returns
+    -------
+    layer : int or array of ints
+        Index into LAYER_BASES and LAPSE_RATES.
+
+    """
+    return np.clip(np.searchsorted(LAYER_BASES, altitude, side='right') - 1, 0, len(LAYER_BASES) - 1)
+
+
+def StandardConditions(altitude):
+    """
+    Function to calculate the standard temperature and pressure from the layer equations.
+
+    Parameters
+    ----------
+    altitude : float or array of floats
+        Geopotential altitude in m.
+
+    Returns
+    -------
+    T : float or array of floats
+        Standard temperature in K.
+    p : float or array of floats
+        Standard pressure in Pa.
+
+    """
+    altitude = np.asarray(altitude, dtype=float)
+    layer = Layer(altitude)
+    height = altitude - LAYER_BASES[layer]
+    lapserate = LAPSE_RATES[layer]
+    T_base = BASE_TEMPERATURES[layer]
+    T = T_base + lapserate * height
+
+    isothermal = lapserate == 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        exponent = np.where(isothermal, -G0 * height / (R * T_base),
+                            -G0 / (R * np.where(isothermal, 1, lapserate)) * np.log(T / T_base))
+    return T, BASE_PRESSURES[layer] * np.exp(exponent)
+
+
+def AtmosphereTable(step=1.0):
+    """
+    Function to tabulate the standard temperature and the logarithm of pressure on a uniform altitude grid, the
+    table ISA interpolates. Temperature is linear within each layer and ln(p) nearly so, the interpolation error
+    of a 1 m table is below 1e-9.
+
+    Parameters
+    ----------
+    step : float, optional
+        Altitude step of the table in m.
+
+    Returns
+    -------
+    table : dict
+        Grid start and step in m, and the T and ln(p) columns.
+
+    """
+    global _TABLE
+
+    altitude = np.arange(MIN_ALTITUDE, MAX_ALTITUDE + step, step)
+    T, p = StandardConditions(np.minimum(altitude, MAX_ALTITUDE))
+    _TABLE = {'start': MIN_ALTITUDE, 'step': float(step), 'T': T, 'log_p': np.log(p)}
+    return _TABLE
+
+
+def ISA(altitude, deltaT=0.0, exact=False):
+    """
+    Function to calculate the atmosphere at a given altitude and temperature difference from standard, vectorized
+    over both. The temperature offset keeps the standard pressure at the altitude, the pressure altitude
+    convention of performance charts.
+
+    Parameters
+    ----------
+    altitude : float or array of floats
+        Geopotential altitude in m, between MIN_ALTITUDE and MAX_ALTITUDE.
+    deltaT : float or array of floats, optional
+        Difference in temperature from ISA standard, 15 degrees C on sea level.
+    exact : bool, optional
+        Evaluate the layer equations instead of interpolating the table, for validation.
+
+    Returns
+    -------
+    AtmosphereState
+        Density, pressure, temperature, speed of sound and density ratio.
+
+    """
+    altitude = np.asarray(altitude, dtype=float)
+    _CheckAltitude(altitude)
+
+    if exact:
+        T_standard, p = StandardConditions(altitude)
+    else:
+        table = _TABLE if _TABLE is not None else AtmosphereTable()
+        position = (altitude - table['start']) / table['step']
+        # a NaN altitude indexes the first row and gets a NaN fraction, so only its own state is NaN
+        finite = np.isfinite(position)
+        i = np.minimum(np.where(finite, position, 0).astype(int), len(table['T']) - 2)
+        fraction = np.where(finite, position - i, np.nan)
+        T_standard = table['T'][i] + fraction * (table['T'][i + 1] - table['T'][i])
+        p = np.exp(table['log_p'][i] + fraction * (table['log_p'][i + 1] - table['log_p'][i]))
+
+    T = T_standard + deltaT
+    rho = p / (R * T)
+    return AtmosphereState(rho, p, T, np.sqrt(GAMMA * R * T), rho / RHO0)
@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 21:02:37 2026
+
+Headless batch runner for matching chart solves, reads a file of requirement cases and
+streams the optimal W/S and W/P of each case as it finishes.
+@author: ardya
+"""
+
+import csv
+import os
+import sys
+import numpy as np
+import performancesizing as pf
+import matchingchart as mc
+import instrumentation as it
+
+# Requirement columns of a case file, with the units the interactive scripts prompt for
+CASE_FIELDS = ('altitude',     # runway altitude in ft
+               'deltaT',       # temperature difference from ISA in C
+               'Vs',           # stall speed in kts, empty for no stall requirement
+               'sweep',        # wing sweep angle in degrees
+               'Clmax',        # 2D maximum lift coefficient of the high lift system
+               'criteria',     # takeoff criteria, one of performancesizing.TOP_CRITERIA
+               'TOdistance',   # takeoff distance or balanced field length in m
+               'Slanding',     # landing distance in m
+               'Sa',           # obstacle-clearance distance in ft
+               'ceiling',      # service ceiling in ft
+               'Vcruise',      # cruise speed at service ceiling in kts
+               'AR', 'e', 'CD0')
+
+RESULT_FIELDS = ('case', 'W_S', 'W_P', 'feasible', 'active')
+
+# Matching chart bounds of W/S in lb/ft2 and W/P in lb/hp
+BOUNDS = mc.BOUNDS
+
+# Results appended to a results store at once
+STORE_CHUNK = 65536
+
+
+def ReadCases(filename):
+    """
+    Function to read requirement cases from a CSV file with a header of CASE_FIELDS.
+
+    Parameters
+    ----------
+    filename : str
+        Path to the case file.
+
+    Returns
+    -------
+    cases : list of dict
+        Requirement cases, numbers converted to float and empty stall speeds to None.
+
+    """
+    cases = []
+    with open(filename, newline='') as file:
+        for row in csv.DictReader(file):
+            case = {}
+            for field in CASE_FIELDS:
+                value = row.get(field, '').strip()
+                if field == 'criteria':
+                    case[field] = value
+                elif value == '':
+                    if field != 'Vs':
+                        raise ValueError(f'Case {len(cases)} is missing {field}.')
+                    case[field] = None
+                else:
+                    case[field] = float(value)
+            cases.append(case)
+    return cases
+
+
+def CaseConstraints(cases):
+    """
+    Function to build the matching chart constraints of a list of requirement cases, converted from the units of
+    CASE_FIELDS.
+
+    Parameters
+    ----------
+    cases : list of dict
+        Requirement cases with CASE_FIELDS keys.
+
+    Returns
+    -------
+    limits, curves : dict
+        Constraints of every case, see matchingchart.MatchingChartConstraints.
+
+    """
+    columns = {field: np.array([np.nan if case[field] is None else case[field] for case in cases])
+               for field in CASE_FIELDS if field != 'criteria'}
+    CLmax = 0.9 * columns['Clmax'] * np.cos(np.radians(columns['sweep']))
+    TOP = pf.TOP([case['criteria'] for case in cases], columns['TOdistance'] * 3.28084)
+
+    return mc.MatchingChartConstraints(columns['altitude'] * .3048, columns['deltaT'], CLmax, TOP,
+                                       columns['Slanding'] * 3.28084, columns['Sa'],
+                                       columns['ceiling'] * 0.3048, columns['Vcruise'] * 1.687664,
+                                       columns['AR'], columns['e'], columns['CD0'], Vs=columns['Vs'] * 1.687664)
+
+
+@it.Traced('batchsizing.solve_chunk')
+def SolveChunk(cases):
+    """
+    Function to solve the matching charts of a list of requirement cases in one vectorized pass.
+
+    Parameters
+    ----------
+    cases : list of dict
+        Requirement cases with CASE_FIELDS keys.
+
+    Returns
+    -------
+    results : list of dict
+        W_S and W_P of the design point farthest from the origin, feasible flag and the active constraints
+        joined by '|', one per case.
+
+    """
+    solution = mc.SolveMatchingChart(*CaseConstraints(cases), bounds=BOUNDS)
+
+    results = []
+    for i in range(len(cases)):
+        active = '|'.join(name for name, flags in solution.active.items() if flags[i])
+        results.append({'W_S': solution.W_S[i], 'W_P': solution.W_P[i],
+                        'feasible': bool(solution.feasible[i]), 'active': active})
+    return results
+
+
+def SolveCase(case):
+    """
+    Function to solve the matching chart of one requirement case, see SolveChunk.
+
+    Parameters
+    ----------
+    case : dict
+        Requirement case with CASE_FIELDS keys.
+
+    Returns
+    -------
+    result : dict
+        W_S, W_P, feasible and active constraints of the design point.
+
+    """
+    return SolveChunk([case])[0]
+
+
+def _CaseByCase(function, cases, failed):
+    # a chunk function of a list of cases, run one case at a time when the chunk fails so a bad case does not
+    # take its whole chunk down, failed gives the result of a case from its exception
+    try:
+        return function(cases)
+    except Exception:
+        results = []
+        for case in cases:
+            try:
+                results.extend(function([case]))
+            except Exception as error:
+                results.append(failed(error))
+        return results
+
+
+def _SolveIndexed(chunk):
+    start, cases = chunk
+    results = _CaseByCase(SolveChunk, cases, lambda error: {'W_S': np.nan, 'W_P': np.nan, 'feasible': False,
+                                                           'active': f'{type(error).__name__}: {error}'})
+    return [dict(result, case=start + i) for i, result in enumerate(results)]
+
+
+def _Chunks(cases, chunksize):
+    chunk = []
+    start = 0
+    for case in cases:
+        chunk.append(case)
+        if len(chunk) == chunksize:
+            yield start, chunk
+            start += len(chunk)
+            chunk = []
+    if chunk:
+        yield start, chunk
+
+
+def _InitWorker(TOP_cache):
+    pf.LoadTOPCoefficients(cache=TOP_cache)
+
+
+def SolveCases(cases, workers=None, chunksize=256, TOP_cache=None):
+    """
+    Function to solve many requirement cases over a process pool, yielding each result as soon as its chunk
+    finishes. Every chunk is solved in one vectorized pass.
+
+    Parameters
+    ----------
+    cases : iterable of dict
+        Requirement cases with CASE_FIELDS keys.
+    workers : int, optional
+        Number of worker processes, the CPU count by default. With 1 the cases are solved in this process.
+    chunksize : int, optional
+        Number of cases sent to a worker and solved together.
+    TOP_cache : str, optional
+        Persisted TOP coefficient file shared by the workers, see performancesizing.LoadTOPCoefficients.
+
+    Yields
+    ------
+    result : dict
+        Case index in the input order, W_S, W_P, feasible and active, in order of completion.
+
+    """
+    chunks = _Chunks(cases, chunksize)
+    if workers == 1:
+        _InitWorker(TOP_cache)
+        for results in map(_SolveIndexed, chunks):
+            yield from results
+        return
+
+    import multiprocessing
+
+    with multiprocessing.Pool(workers, initializer=_InitWorker, initargs=(TOP_cache,)) as pool:
+        for results in pool.imap_unordered(_SolveIndexed, chunks):
+            yield from results
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Solve the matching chart of every requirement case in a CSV file.')
+    parser.add_argument('cases', help=f'CSV file with the columns {", ".join(CASE_FIELDS)}')
+    parser.add_argument('-o', '--output', help='CSV file for the results, standard output by default')
+    parser.add_argument('-w', '--workers', type=int, default=None, help='number of worker processes')
+    parser.add_argument('-c', '--chunksize', type=int, default=256, help='cases solved together by a worker')
+    parser.add_argument('--top-cache', default=pf.TOP_CACHE, help='persisted TOP coefficient file')
+    parser.add_argument('--store', help='results store directory the cases and results are appended to, the CSV '
+                                        'is then only written with --output')
+    args = parser.parse_args(argv)
+
+    cases = ReadCases(args.cases)
+    output = open(args.output, 'w', newline='') if args.output else None if args.store else sys.stdout
+    store = None
+    if args.store:
+        import resultsstore as rs
+
+        store = rs.ResultsStore(args.store, inputs={'bounds': BOUNDS},
+                                metadata={'source': 'batchsizing', 'cases': os.path.abspath(args.cases)})
+    try:
+        # fit once here so the workers only load the persisted coefficients
+        pf.LoadTOPCoefficients(cache=args.top_cache)
+        if output is not None:
+            writer = csv.DictWriter(output, fieldnames=RESULT_FIELDS)
+            writer.writeheader()
+        records = []
+        for result in SolveCases(cases, args.workers, args.chunksize, args.top_cache):
+            if output is not None:
+                writer.writerow(result)
+                output.flush()
+            if store is not None:
+                # each row holds its requirement case beside the result
+                records.append(dict(cases[result['case']], **result))
+                if len(records) == STORE_CHUNK:
+                    store.append(records)
+                    records = []
+        if store is not None:
+            store.append(records)
+    finally:
+        if output is not None and output is not sys.stdout:
+            output.close()
+
+
+if __name__ == '__main__':
+    main()
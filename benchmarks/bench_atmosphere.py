@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 24 10:41:07 2026
+
+Benchmarks of the atmosphere model.
+@author: ardya
+"""
+
+import atmosphere as at
+import performancesizing as pf
+
+
+def bench_AirDensity(bench, size, sample):
+    bench(pf.AirDensity, sample(size, 0, 11000), sample(size, -10, 30))
+
+
+def bench_ISA(bench, size, sample):
+    bench(at.ISA, sample(size, 0, 20000), sample(size, -10, 30))
+
+
+def bench_ISA_exact(bench, size, sample):
+    bench(at.ISA, sample(size, 0, 20000), sample(size, -10, 30), exact=True)
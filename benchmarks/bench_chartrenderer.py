@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Tue Oct 27 11:02:36 2026
+
+Benchmarks of rendering one matching chart page, reusing the renderer against a fresh pyplot figure.
+@author: ardya
+"""
+
+import io
+import numpy as np
+import pytest
+
+pytest.importorskip('matplotlib')
+import chartrenderer as cr
+
+CHART = {'limits': {'Landing': 30.0, 'Stall': 40.0},
+         'curves': {'Takeoff': lambda W_S: 400 / W_S, 'Ceiling': lambda W_S: 60 / np.sqrt(W_S)},
+         'design': (30.0, 13.3)}
+
+
+@pytest.mark.parametrize('format', cr.PAGE_FORMATS)
+def bench_MatchingChartRenderer(bench, format):
+    renderer = cr.MatchingChartRenderer()
+
+    def Render():
+        renderer.draw(**CHART)
+        renderer.save(io.BytesIO(), format)
+
+    bench(Render)
+
+
+def bench_pyplot_figure(bench):
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    import matplotlib.patheffects as patheffects
+
+    W_S = np.linspace(1, 50, 50)
+
+    def Render():
+        # the per case figure of transportaircraft.py
+        plt.figure(figsize=(8, 4.5), dpi=300)
+        plt.axis([0, 50, 0, 50])
+        plt.vlines(CHART['limits']['Landing'], 0, 50, 'r', label='Landing',
+                   path_effects=[patheffects.withTickedStroke(angle=-135)])
+        for name, color in (('Takeoff', 'g'), ('Ceiling', 'c')):
+            plt.plot(W_S, CHART['curves'][name](W_S), color, label=name,
+                     path_effects=[patheffects.withTickedStroke(angle=135)])
+        plt.plot(*CHART['design'], 'ro')
+        plt.figlegend()
+        plt.title('Matching Chart', loc='center')
+        plt.savefig(io.BytesIO(), format='png')
+        plt.close()
+
+    bench(Render)
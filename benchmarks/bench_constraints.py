@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 24 10:52:18 2026
+
+Benchmarks of every matching chart constraint in performancesizing, W/S in lb/ft2, W/P in lb/hp and speeds in ft/s.
+@author: ardya
+"""
+
+import performancesizing as pf
+
+
+def bench_StallWingLoading(bench, size, sample):
+    bench(pf.StallWingLoading, sample(size, 0, 3000), sample(size, -10, 30), sample(size, 150, 250),
+          sample(size, 1.4, 2.8))
+
+
+def bench_TakeoffWingLoading(bench, size, sample):
+    bench(pf.TakeoffWingLoading, sample(size, 100, 300), sample(size, 0, 3000), sample(size, -10, 30),
+          sample(size, 1.2, 2.2), sample(size, 1, 50))
+
+
+def bench_LandingWingLoading(bench, size, sample):
+    bench(pf.LandingWingLoading, sample(size, 3000, 8000), sample(size, 450, 1000), sample(size, 0, 3000),
+          sample(size, -10, 30), sample(size, 1.4, 2.8))
+
+
+def bench_CruiseWingLoadingOpt(bench, size, sample):
+    bench(pf.CruiseWingLoadingOpt, sample(size, 3000, 11000), sample(size, 300, 800), sample(size, 6, 10),
+          sample(size, 0.7, 0.85), sample(size, 0.015, 0.03))
+
+
+def bench_LoiterWingLoadingOpt(bench, size, sample):
+    bench(pf.LoiterWingLoadingOpt, sample(size, 3000, 11000), sample(size, 200, 400), sample(size, 6, 10),
+          sample(size, 0.7, 0.85), sample(size, 0.015, 0.03))
+
+
+def bench_InstantTurnWingLoading(bench, size, sample):
+    bench(pf.InstantTurnWingLoading, sample(size, 3000, 11000), sample(size, 0.2, 0.4), sample(size, 400, 600),
+          sample(size, 0.6, 1.5))
+
+
+def bench_SustainedTurnWingLoading(bench, size, sample):
+    bench(pf.SustainedTurnWingLoading, sample(size, 3000, 11000), sample(size, 400, 800), sample(size, 3, 7),
+          sample(size, 3, 6), sample(size, 0.7, 0.85), sample(size, 0.015, 0.03), sample(size, 5, 20))
+
+
+def bench_ClimbWingLoading(bench, size, sample):
+    bench(pf.ClimbWingLoading, sample(size, 0.02, 0.1), sample(size, 150, 300), sample(size, 6, 10),
+          sample(size, 0.7, 0.85), sample(size, 0.015, 0.03), sample(size, 1, 50))
+
+
+def bench_CeilingWingLoading(bench, size, sample):
+    bench(pf.CeilingWingLoading, sample(size, 3000, 11000), sample(size, 300, 800), sample(size, 6, 10),
+          sample(size, 0.7, 0.85), sample(size, 0.015, 0.03), sample(size, 1, 50))
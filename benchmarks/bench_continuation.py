@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Fri Oct 30 10:02:31 2026
+
+Benchmarks of continuation sweeps of the matching chart, warm started along each requirement. Fails when the
+warm started sweep needs more than WARM_RATIO of the SLSQP iterations of cold solves at the same steps.
+@author: ardya
+"""
+
+import numpy as np
+import pytest
+import performancesizing as pf
+
+pytest.importorskip('scipy')
+import continuation as ct
+
+# Largest share of the cold SLSQP iterations a warm started sweep may take
+WARM_RATIO = 0.35
+
+INPUTS = dict(altitude=300.0, CLmax=2.0, criteria=pf.TOP_CRITERIA[4], TOdistance=6000.0, Slanding=5000.0,
+              Sa=1000.0, ceiling=11000.0, Vcruise=750.0, AR=9.0, e=0.8, CD0=0.018, Vs=200.0, K_LD=15.5,
+              WettedAreaRatio=6.0, R=1.5e7, E=1800.0, C_cruise=0.5 / 3600, C_loiter=0.4 / 3600, reserve=0.06,
+              W_crew=800.0, W_payload=20000.0, A=1.02, C=-0.06)
+
+STEPS = {'Vs': np.linspace(150, 260, 23), 'Slanding': np.linspace(3000, 9000, 25),
+         'ceiling': np.linspace(8000, 14000, 25), 'TOdistance': np.linspace(4000, 9000, 21),
+         'Vcruise': np.linspace(500, 900, 41)}
+
+
+@pytest.mark.parametrize('requirement', list(STEPS))
+def bench_ContinuationSweep(bench, requirement):
+    steps = {requirement: STEPS[requirement]}
+    warm = ct.ContinuationSweep(INPUTS, steps)
+    cold = ct.ContinuationSweep(INPUTS, steps, warm=False)
+    np.testing.assert_allclose(warm['W_P'], cold['W_P'], rtol=1e-6)
+    ratio = warm['iterations'].sum() / cold['iterations'].sum()
+    assert ratio <= WARM_RATIO, f'warm started {requirement} sweep took {ratio:.0%} of the cold iterations'
+    bench(ct.ContinuationSweep, INPUTS, steps)
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 26 09:25:52 2026
+
+Import time budget of the headless compute layer, each check in a fresh interpreter. Fails when importing
+sizingcore, or running a sizing number through it, takes longer than the budget on top of NumPy or loads a
+plotting, Excel, image or optimization package.
+@author: ardya
+"""
+
+import json
+import os
+import subprocess
+import sys
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Seconds allowed on top of the NumPy import
+IMPORT_BUDGET = 0.05
+
+HEAVY_MODULES = ('matplotlib', 'scipy', 'pandas', 'openpyxl', 'PIL', 'openmdao')
+
+SCRIPT = """
+import json, sys, time
+import numpy
+start = time.perf_counter()
+import sizingcore as sc
+{use}
+elapsed = time.perf_counter() - start
+print(json.dumps({{'seconds': elapsed, 'modules': sorted(sys.modules)}}))
+"""
+
+USES = {
+    'import': '',
+    'weight': 'sc.SolveTakeoffWeight(400, 2000, 0.2, 1.02, -0.06)',
+    'matching_chart': 'sc.SolveMatchingChart(*sc.MatchingChartConstraints(300, 15, 2.0, sc.TOP(sc.TOP_CRITERIA[2], '
+                      '5000), 5000, 450, 9000, 700, 8, 0.8, 0.02))',
+    'mission': 'sc.MissionFuelFraction([sc.Takeoff(), sc.Cruise(6e6, 1.4e-4, 15, 700), sc.Land()])',
+}
+
+
+def _Run(use):
+    output = subprocess.run([sys.executable, '-c', SCRIPT.format(use=use)], cwd=ROOT, capture_output=True,
+                            text=True, check=True).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+@pytest.mark.parametrize('use', list(USES))
+def bench_import_budget(use):
+    # best of a few interpreters, the first one pays for the disk cache
+    runs = [_Run(USES[use]) for _ in range(3)]
+    seconds = min(run['seconds'] for run in runs)
+    heavy = sorted({module.split('.')[0] for module in runs[0]['modules']} & set(HEAVY_MODULES))
+    assert not heavy, f'sizingcore {use} imported {", ".join(heavy)}'
+    assert seconds <= IMPORT_BUDGET, f'sizingcore {use} took {seconds * 1e3:.1f} ms, the budget is ' \
+                                     f'{IMPORT_BUDGET * 1e3:.0f} ms'
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 24 11:34:52 2026
+
+Benchmarks of full matching chart solves, the constraints of every case and the design point search.
+@author: ardya
+"""
+
+import numpy as np
+import pytest
+import performancesizing as pf
+import matchingchart as mc
+import batchsizing as bs
+
+# Cases solved together, SolveMatchingChart holds a grid of n_points per case
+CHUNKSIZE = 4096
+
+
+def _Cases(size, sample):
+    return dict(altitude=sample(size, 0, 3000), deltaT=sample(size, -10, 30), CLmax=sample(size, 1.6, 2.6),
+                TOP=pf.TOP(pf.TOP_CRITERIA[2], sample(size, 4000, 10000)), Slanding=sample(size, 4000, 10000),
+                Sa=450.0, ServiceCeiling=sample(size, 6000, 11000), Vcruise=sample(size, 300, 800),
+                AR=sample(size, 6, 10), e=sample(size, 0.7, 0.85), CD0=sample(size, 0.015, 0.03),
+                Vs=sample(size, 150, 250))
+
+
+def _Solve(cases, size):
+    n = 1 if size is None else size
+    for start in range(0, n, CHUNKSIZE):
+        chunk = {name: value if np.ndim(value) == 0 else value[start:start + CHUNKSIZE]
+                 for name, value in cases.items()}
+        mc.SolveMatchingChart(*mc.MatchingChartConstraints(**chunk))
+
+
+@pytest.mark.max_size(10**6)
+def bench_SolveMatchingChart(bench, size, sample):
+    bench(_Solve, _Cases(size, sample), size)
+
+
+@pytest.mark.max_size(10**3)
+def bench_SolveMatchingChartSLSQP(bench, size, sample):
+    pytest.importorskip('scipy')
+    cases = _Cases(size, sample)
+
+    def Solve():
+        for i in range(1 if size is None else size):
+            case = {name: value if np.ndim(value) == 0 else value[i] for name, value in cases.items()}
+            mc.SolveMatchingChartSLSQP(mc.MatchingChartConstraintSet(**case))
+
+    bench(Solve)
+
+
+@pytest.mark.max_size(10**3)
+def bench_SolveChunk(bench, size):
+    case = {'altitude': 1000.0, 'deltaT': 15.0, 'Vs': 110.0, 'sweep': 25.0, 'Clmax': 2.2,
+            'criteria': pf.TOP_CRITERIA[2], 'TOdistance': 2000.0, 'Slanding': 1500.0, 'Sa': 1000.0,
+            'ceiling': 30000.0, 'Vcruise': 450.0, 'AR': 8.0, 'e': 0.8, 'CD0': 0.02}
+    bench(bs.SolveChunk, [case] * (1 if size is None else size))
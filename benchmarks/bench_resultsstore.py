@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 31 10:36:05 2026
+
+Benchmarks of appending sweep results to the results store and of filtered queries over its memory maps.
+@author: ardya
+"""
+
+import numpy as np
+import resultsstore as rs
+
+ACTIVE = np.array(['Landing|Takeoff', 'Ceiling|W_S bound', 'Landing', 'Stall|Ceiling'])
+
+
+def _Chunk(size, sample):
+    n = 1 if size is None else size
+    return {'W_S': sample(n, 20, 50), 'W_P': sample(n, 5, 20), 'W0': sample(n, 20000, 80000),
+            'feasible': sample(n, 0, 1) > 0.1, 'active': ACTIVE[(sample(n, 0, 1) * len(ACTIVE)).astype(int)]}
+
+
+def bench_append(bench, size, sample, tmp_path):
+    store = rs.ResultsStore(str(tmp_path / 'store'))
+    bench(store.append, _Chunk(size, sample))
+
+
+def bench_where(bench, size, sample, tmp_path):
+    store = rs.ResultsStore(str(tmp_path / 'store'))
+    store.append(_Chunk(size, sample))
+    bench(store.where, W0__lt=40000, active__contains='Landing', feasible=True)
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 24 11:20:35 2026
+
+Benchmarks of loading the SizingData.xlsx tables, from the workbook, from the .npz cache and from memory.
+@author: ardya
+"""
+
+import os
+import shutil
+import numpy as np
+import pytest
+import sizingdata as sd
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    filename = str(tmp_path / 'SizingData.xlsx')
+    shutil.copy2(sd.SIZING_DATA_FILE, filename)
+    return filename
+
+
+def bench_LoadSizingData_workbook(bench, workbook):
+    pytest.importorskip('openpyxl')
+
+    def Load():
+        sd._LOADED.clear()
+        os.remove(os.path.splitext(workbook)[0] + '.npz')
+        return sd.LoadSizingData(workbook)
+
+    sd.LoadSizingData(workbook)
+    bench(Load)
+
+
+def bench_LoadSizingData_cache(bench, workbook):
+    pytest.importorskip('openpyxl')
+    sd.LoadSizingData(workbook)
+
+    def Load():
+        sd._LOADED.clear()
+        return sd.LoadSizingData(workbook)
+
+    bench(Load)
+
+
+def bench_LoadSizingData_memory(bench, workbook):
+    pytest.importorskip('openpyxl')
+    sd.LoadSizingData(workbook)
+    bench(sd.LoadSizingData, workbook)
+
+
+def bench_lookup(bench, size):
+    table = sd.LoadSizingData()['EmptyWeightFraction']
+    rows = table.index[0] if size is None else np.resize(np.array(table.index), size)
+    bench(table.lookup, rows, 'A')
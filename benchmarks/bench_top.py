@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 24 11:03:46 2026
+
+Benchmarks of the takeoff parameter fit and its evaluation.
+@author: ardya
+"""
+
+import numpy as np
+import performancesizing as pf
+
+
+def bench_FitTOP(bench):
+    bench(pf.FitTOP, pf.TOP_FILE)
+
+
+def bench_FitTOP_dig(bench):
+    # the curves come from the .dig cache after the first call
+    bench(pf.FitTOP, pf.TOP_DIG_FILE)
+
+
+def bench_TOP(bench, size, sample):
+    bench(pf.TOP, pf.TOP_CRITERIA[2], sample(size, 3000, 10000))
+
+
+def bench_TOP_mixed_criteria(bench, size, sample):
+    criteria = pf.TOP_CRITERIA[0] if size is None else np.resize(np.array(pf.TOP_CRITERIA), size)
+    bench(pf.TOP, criteria, sample(size, 3000, 10000))
@@ -0,0 +1,14 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 24 11:12:09 2026
+
+Benchmarks of the takeoff weight convergence.
+@author: ardya
+"""
+
+import weightestimation as we
+
+
+def bench_SolveTakeoffWeight(bench, size, sample):
+    bench(we.SolveTakeoffWeight, sample(size, 200, 800), sample(size, 1000, 40000), sample(size, 0.15, 0.4),
+          sample(size, 0.9, 1.2), sample(size, -0.1, -0.05))
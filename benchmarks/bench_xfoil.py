@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 24 11:56:03 2026
+
+Benchmarks of the XFOIL path through the local stub executable, the runner, cache and parsing overhead.
+@author: ardya
+"""
+
+import os
+import sys
+import time
+import numpy as np
+import pytest
+import airfoilgeometry as ag
+import polarcache as pc
+import xfoilrunner as xr
+
+STUB = [sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'xfoil_stub.py')]
+
+# Airfoil name the stub hangs on, see xfoil_stub.py
+HANG_NAME = 'hang'
+
+
+def _Jobs(n):
+    airfoils = ag.NACA4Airfoils(np.full(n, 0.02), np.full(n, 0.4), np.linspace(0.08, 0.16, n))
+    return [xr.PolarJob(coordinates, 1e6, name=f'naca{i}') for i, coordinates in enumerate(airfoils)]
+
+
+def bench_RunPolar(bench):
+    result = bench(xr.RunPolar, _Jobs(1)[0], STUB)
+    assert len(result.polar) == len(xr.PolarJob._field_defaults['alphas'])
+
+
+@pytest.mark.parametrize('n_jobs', [8, 64])
+def bench_RunPolars(bench, n_jobs):
+    bench(lambda: list(xr.RunPolars(_Jobs(n_jobs), STUB)))
+
+
+def _Alive(pid):
+    # a killed process whose parent is gone may linger as a zombie until it is reaped
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    try:
+        with open(f'/proc/{pid}/stat') as file:
+            return file.read().rsplit(')', 1)[1].split()[0] != 'Z'
+    except OSError:
+        return True
+
+
+@pytest.mark.skipif(os.name == 'nt', reason='process groups are POSIX only')
+def bench_RunPolar_timeout():
+    job = _Jobs(1)[0]._replace(name=HANG_NAME)
+    start = time.perf_counter()
+    result = xr.RunPolar(job, STUB, timeout=2)
+    assert time.perf_counter() - start < 10, 'the hung run was not killed at its timeout'
+    assert result.timed_out and result.returncode == -9
+    # the angles written before the hang are kept
+    assert len(result.polar) == len(job.alphas) // 2
+    child = int(result.output.split('child ')[1].split()[0])
+    deadline = time.perf_counter() + 5
+    while _Alive(child) and time.perf_counter() < deadline:
+        time.sleep(0.05)
+    assert not _Alive(child), f'child process {child} of the hung run is still running'
+
+
+def bench_RunPolar_cached(bench, tmp_path):
+    cache = pc.PolarCache(str(tmp_path))
+    job = _Jobs(1)[0]
+    xr.RunPolar(job, STUB, cache=cache)
+    result = bench(xr.RunPolar, job, STUB, cache=cache)
+    assert result.returncode is None
+
+
+def bench_ReadPolar(bench, tmp_path):
+    filename = str(tmp_path / xr.POLAR_FILE)
+    with open(filename, 'w') as file:
+        file.write(' XFOIL\n\n   alpha    CL        CD       CDp       CM     Top_Xtr  Bot_Xtr\n'
+                   '  ------ -------- --------- --------- -------- -------- --------\n')
+        for alpha in xr.PolarJob._field_defaults['alphas']:
+            file.write(f'  {alpha:6.3f} {0.11 * alpha:8.4f} {0.006:9.5f} {0.001:9.5f} {0.0:8.4f} 1.0000 1.0000\n')
+    bench(xr.ReadPolar, filename)
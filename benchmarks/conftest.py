@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 24 10:14:32 2026
+
+Timing harness of the benchmark suite. Every benchmark calls the bench fixture, which times the call over
+several rounds and keeps the best time per call, and the size fixture, which runs it at every input size.
+
+Usage, from the repository root:
+    python -m pytest benchmarks                                  scalar, 10^3 and 10^6 inputs
+    python -m pytest benchmarks --bench-sizes all                also 10^7 inputs
+    python -m pytest benchmarks --bench-save main                store the times as the main baseline
+    python -m pytest benchmarks --bench-compare main             fail benchmarks slower than the baseline
+@author: ardya
+"""
+
+import json
+import os
+import platform
+import sys
+import time
+import numpy as np
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+# Stored baselines, one JSON file of seconds per call by benchmark id with the machine it was recorded on. main.json
+# is the reference committed with the suite, compare against it only on a similar machine or record your own.
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines')
+
+# Input sizes, None for scalar inputs
+SIZES = {'scalar': None, '1e3': 10**3, '1e6': 10**6, '1e7': 10**7}
+DEFAULT_SIZES = 'scalar,1e3,1e6'
+
+# Times of this session by benchmark id
+_RESULTS = {}
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup('benchmarks')
+    group.addoption('--bench-sizes', default=DEFAULT_SIZES,
+                    help=f'comma separated input sizes out of {", ".join(SIZES)}, or all')
+    group.addoption('--bench-rounds', type=int, default=5, help='timed rounds of every benchmark')
+    group.addoption('--bench-min-time', type=float, default=0.05, help='minimum seconds of one round')
+    group.addoption('--bench-max-time', type=float, default=2.0,
+                    help='seconds after which no further rounds are timed, for the largest inputs')
+    group.addoption('--bench-save', metavar='NAME', help='store the times as baseline NAME')
+    group.addoption('--bench-compare', metavar='NAME', help='compare the times with baseline NAME')
+    group.addoption('--bench-threshold', type=float, default=1.25,
+                    help='slowdown ratio over the baseline that fails a benchmark')
+
+
+def pytest_generate_tests(metafunc):
+    if 'size' in metafunc.fixturenames:
+        selected = metafunc.config.getoption('--bench-sizes')
+        names = list(SIZES) if selected == 'all' else selected.split(',')
+        unknown = set(names) - set(SIZES)
+        if unknown:
+            raise pytest.UsageError(f'Unknown benchmark sizes {", ".join(sorted(unknown))}.')
+        marker = metafunc.definition.get_closest_marker('max_size')
+        limit = marker.args[0] if marker else None
+        names = [name for name in names if limit is None or (SIZES[name] or 1) <= limit]
+        metafunc.parametrize('size', [SIZES[name] for name in names], ids=names)
+
+
+def _BaselineFile(name):
+    return os.path.join(BASELINE_DIR, f'{name}.json')
+
+
+@pytest.fixture(scope='session')
+def baseline(pytestconfig):
+    name = pytestconfig.getoption('--bench-compare')
+    if name is None:
+        return None
+    with open(_BaselineFile(name)) as file:
+        return json.load(file)['times']
+
+
+@pytest.fixture
+def bench(request, baseline):
+    """
+    Fixture timing a call, bench(function, *args, **kwargs) returns the result of one call.
+
+    The number of calls per round is calibrated to last --bench-min-time, the best round over --bench-rounds,
+    or fewer rounds past --bench-max-time, gives the time per call. With --bench-compare the benchmark fails when
+    it is slower than the baseline by more than --bench-threshold.
+    """
+    config = request.config
+
+    def Bench(function, *args, **kwargs):
+        result = function(*args, **kwargs)
+        # calibrate the loop count, one warm call is already done
+        loops = 1
+        while True:
+            start = time.perf_counter()
+            for _ in range(loops):
+                function(*args, **kwargs)
+            elapsed = time.perf_counter() - start
+            if elapsed >= config.getoption('--bench-min-time'):
+                break
+            loops *= 10 if elapsed < config.getoption('--bench-min-time') / 10 else 2
+        best = elapsed / loops
+        total = elapsed
+        for _ in range(config.getoption('--bench-rounds') - 1):
+            if total >= config.getoption('--bench-max-time'):
+                break
+            start = time.perf_counter()
+            for _ in range(loops):
+                function(*args, **kwargs)
+            elapsed = time.perf_counter() - start
+            best = min(best, elapsed / loops)
+            total += elapsed
+
+        _RESULTS[request.node.nodeid] = best
+        if baseline is not None and request.node.nodeid in baseline:
+            ratio = best / baseline[request.node.nodeid]
+            if ratio > config.getoption('--bench-threshold'):
+                pytest.fail(f'{ratio:.2f} times slower than the baseline '
+                            f'({best:.3e} s against {baseline[request.node.nodeid]:.3e} s per call)')
+        return result
+
+    return Bench
+
+
+@pytest.fixture
+def sample():
+    """Fixture drawing seeded inputs, sample(size, low, high) is a float for scalar size and an array otherwise."""
+    rng = np.random.default_rng(0)
+
+    def Sample(size, low, high):
+        return float(rng.uniform(low, high)) if size is None else rng.uniform(low, high, size)
+
+    return Sample
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not _RESULTS:
+        return
+    terminalreporter.section('benchmarks')
+    width = max(len(name) for name in _RESULTS)
+    for name, seconds in _RESULTS.items():
+        terminalreporter.write_line(f'{name:<{width}}  {seconds:.3e} s')
+
+
+def pytest_sessionfinish(session):
+    name = session.config.getoption('--bench-save')
+    if name is None or not _RESULTS:
+        return
+    os.makedirs(BASELINE_DIR, exist_ok=True)
+    stored = {'machine': platform.node(), 'platform': platform.platform(), 'processor': platform.processor(),
+              'cpus': os.cpu_count(), 'python': platform.python_version(), 'numpy': np.__version__,
+              'created': time.strftime('%Y-%m-%d %H:%M:%S'), 'times': _RESULTS}
+    # merge into an existing baseline so a partial run only updates its own benchmarks
+    if os.path.exists(_BaselineFile(name)):
+        with open(_BaselineFile(name)) as file:
+            stored['times'] = dict(json.load(file)['times'], **_RESULTS)
+    with open(_BaselineFile(name), 'w') as file:
+        json.dump(stored, file, indent=1)
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 24 11:48:27 2026
+
+Stand-in for the XFOIL executable in the benchmarks. Reads the command stream of xfoilrunner from stdin, checks
+that the geometry was written and answers every ALFA command with a thin airfoil polar line, so the benchmarks
+time the process, file and parsing overhead of the XFOIL path without XFOIL installed.
+
+An airfoil named HANG_NAME hangs like a stalled XFOIL halfway through its angles of attack, after writing the
+polar lines of the first half and starting a sleeping child process, whose pid it prints as 'child <pid>'.
+@author: ardya
+"""
+
+import math
+import os
+import subprocess
+import sys
+import time
+
+# Airfoil name of a run that hangs
+HANG_NAME = 'hang'
+
+geometry = None
+polar = None
+alphas = []
+lines = sys.stdin.read().splitlines()
+for i, line in enumerate(lines):
+    if line.startswith('LOAD'):
+        geometry = line.split()[1]
+        if not os.path.exists(geometry):
+            sys.exit(f'{geometry} not found')
+    elif line == 'PACC' and polar is None:
+        polar = lines[i + 1]
+    elif line.startswith('ALFA'):
+        alphas.append(float(line.split()[1]))
+
+with open(geometry) as file:
+    hang = file.readline().strip() == HANG_NAME
+
+with open(polar, 'w') as file:
+    file.write(' XFOIL stub\n\n'
+               '   alpha    CL        CD       CDp       CM     Top_Xtr  Bot_Xtr\n'
+               '  ------ -------- --------- --------- -------- -------- --------\n')
+    for i, alpha in enumerate(alphas):
+        if hang and i == len(alphas) // 2:
+            # XFOIL appends each converged angle to the polar file as it goes
+            file.flush()
+            # the child does not hold the output pipe, so a run whose child survives the kill still returns
+            child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(3600)'],
+                                     stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            print(f'child {child.pid}', flush=True)
+            while True:
+                time.sleep(3600)
+        file.write(f'  {alpha:6.3f} {2 * math.pi * math.radians(alpha):8.4f} {0.006 + 1e-4 * alpha**2:9.5f} '
+                   f'{0.001:9.5f} {0.0:8.4f} {1.0:8.4f} {1.0:8.4f}\n')
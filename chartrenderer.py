@@ -0,0 +1,359 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Tue Oct 27 09:18:44 2026
+
+Headless batch renderer of matching charts for design review packages. The figure, axes, ticked constraint lines
+and legend are built once, each case only updates the line data and the design point, and cases are rendered in
+parallel worker processes.
+@author: ardya
+"""
+
+import os
+import sys
+import numpy as np
+import performancesizing as pf
+import matchingchart as mc
+import batchsizing as bs
+import instrumentation as it
+
+# Line color of each constraint, vertical W/S limits and W/P curves alike
+COLORS = {'Stall': 'b', 'Takeoff': 'g', 'Landing': 'r', 'Ceiling': 'c', 'Climb': 'm', 'Cruise': 'y'}
+
+# Formats written as one file per case, a PDF output holds every case as a page
+PAGE_FORMATS = ('png', 'svg', 'pdf')
+
+# Renderer of each worker process, built once by the pool initializer
+_RENDERER = None
+
+
+class MatchingChartRenderer:
+    """
+    Reusable Agg matching chart. Needs no display and touches no pyplot state, so any number can live in one
+    process.
+
+    Parameters
+    ----------
+    constraints : sequence of str, optional
+        Constraint names drawn, the COLORS keys by default. Constraints a case does not give are hidden.
+    bounds : tuple, optional
+        (min, max) of W/S and of W/P, the axis limits.
+    figsize : tuple, optional
+        Figure size in inches.
+    dpi : int, optional
+        Resolution of raster output.
+    n_points : int, optional
+        Number of W/S points the W/P curves are drawn with.
+    title : str, optional
+        Chart title, a case can replace it.
+    compress_level : int, optional
+        zlib level of PNG pages, 1 encodes about twice as fast as the usual 6 for slightly larger files.
+
+    """
+
+    def __init__(self, constraints=tuple(COLORS), bounds=mc.BOUNDS, figsize=(8, 4.5), dpi=300, n_points=50,
+                 title='Matching Chart', compress_level=1):
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        import matplotlib.patheffects as patheffects
+
+        (W_Smin, W_Smax), (W_Pmin, W_Pmax) = bounds
+        self.bounds = bounds
+        self.title = title
+        self.compress_level = compress_level
+        self.W_S = np.linspace(W_Smin, W_Smax, n_points)
+        self.figure = Figure(figsize=figsize, dpi=dpi)
+        FigureCanvasAgg(self.figure)
+        self.axes = self.figure.add_subplot()
+        self.axes.axis([W_Smin, W_Smax, W_Pmin, W_Pmax])
+        self.axes.set_xlabel('Wing Loading\n[lb/ft2]')
+        self.axes.set_ylabel('Power Loading\n[lb/hp]')
+        self._title = self.axes.set_title(title, loc='center')
+
+        self.lines = {}
+        for name in constraints:
+            self.lines[name], = self.axes.plot([], [], COLORS.get(name, 'k'), label=name)
+        self._effects = {'limit': [patheffects.withTickedStroke(angle=-135)],
+                         'curve': [patheffects.withTickedStroke(angle=135)]}
+        self.design, = self.axes.plot([], [], 'ro')
+        self._message = self.axes.text(0.5, 0.5, '', transform=self.axes.transAxes, ha='center', va='center',
+                                       wrap=True)
+        self.figure.tight_layout()
+        # legend and raster background of each set of constraints shown, the background holds the pixels of
+        # everything but the case artists and what a full draw puts over them, the spines and the legend
+        self._legends = {}
+        self._backgrounds = {}
+        self._shown = None
+        # in the zorder of a full draw, the spines over the lines
+        self._dynamic = (list(self.lines.values()) + [self.design] + list(self.axes.spines.values())
+                         + [self._title, self._message])
+
+    def draw(self, limits=None, curves=None, design=None, title=None, message=None):
+        """
+        Function to update the chart with one case.
+
+        Parameters
+        ----------
+        limits : dict, optional
+            Constraint name to its W/S limit in lb/ft2.
+        curves : dict, optional
+            Constraint name to its W/P limit in lb/hp at every renderer W_S point, or a function of W/S.
+        design : tuple of floats, optional
+            W/S and W/P of the design point, not drawn when missing or NaN.
+        title : str, optional
+            Title of this case, the renderer title by default.
+        message : str, optional
+            Text in the middle of the chart, e.g. why a case has no constraints.
+
+        """
+        limits, curves = limits or {}, curves or {}
+        (W_Smin, W_Smax), (W_Pmin, W_Pmax) = self.bounds
+        shown = []
+        for name, line in self.lines.items():
+            if name in limits and np.isfinite(limits[name]):
+                line.set_data([limits[name], limits[name]], [W_Pmin, W_Pmax])
+                line.set_path_effects(self._effects['limit'])
+            elif name in curves:
+                W_P = curves[name](self.W_S) if callable(curves[name]) else curves[name]
+                line.set_data(self.W_S, np.broadcast_to(W_P, self.W_S.shape))
+                line.set_path_effects(self._effects['curve'])
+            else:
+                line.set_visible(False)
+                continue
+            line.set_visible(True)
+            shown.append(name)
+
+        if design is not None and np.all(np.isfinite(design)):
+            self.design.set_data([design[0]], [design[1]])
+        else:
+            self.design.set_data([], [])
+        self._title.set_text(self.title if title is None else title)
+        self._message.set_text(message or '')
+
+        # the legend only changes with the set of constraints shown
+        shown = tuple(shown)
+        if shown != self._shown:
+            if self._shown is not None:
+                self._legends[self._shown].set_visible(False)
+            if shown not in self._legends:
+                self._legends[shown] = self.figure.legend([self.lines[name] for name in shown], shown)
+            self._legends[shown].set_visible(True)
+            self._shown = shown
+
+    def _Raster(self):
+        # pixels of the chart, the case artists drawn over the cached background and the legend over them, as a
+        # full draw layers them
+        canvas = self.figure.canvas
+        dynamic = self._dynamic + ([self._legends[self._shown]] if self._shown in self._legends else [])
+        for artist in dynamic:
+            artist.set_animated(True)
+        try:
+            if self._shown not in self._backgrounds:
+                canvas.draw()
+                self._backgrounds[self._shown] = canvas.copy_from_bbox(self.figure.bbox)
+            else:
+                canvas.restore_region(self._backgrounds[self._shown])
+            for artist in dynamic:
+                self.figure.draw_artist(artist)
+        finally:
+            for artist in dynamic:
+                artist.set_animated(False)
+        return canvas.buffer_rgba()
+
+    def save(self, target, format=None):
+        """
+        Function to render the chart to a file, a file object or a matplotlib PdfPages.
+
+        Parameters
+        ----------
+        target : str, file object or PdfPages
+            Output of the page.
+        format : str, optional
+            png, svg or pdf, by default from the file name and png for file objects.
+
+        """
+        if hasattr(target, 'savefig'):
+            format = 'pdf'
+        elif format is None:
+            format = os.path.splitext(target)[1][1:].lower() if isinstance(target, str) else 'png'
+
+        with it.Span('chartrenderer.save', format=format):
+            if format == 'png':
+                from PIL import Image
+
+                pixels = self._Raster()
+                image = Image.frombuffer('RGBA', self.figure.canvas.get_width_height(), pixels, 'raw', 'RGBA', 0, 1)
+                image.save(target, format='png', compress_level=self.compress_level,
+                           dpi=(self.figure.dpi, self.figure.dpi))
+            elif hasattr(target, 'savefig'):
+                target.savefig(self.figure)
+            else:
+                self.figure.savefig(target, format=format)
+        it.Count('chartrenderer.pages')
+
+
+def ChartData(cases, n_points=50, bounds=mc.BOUNDS):
+    """
+    Function to compute the drawn data of a list of requirement cases in one vectorized pass, the constraint
+    lines and the design point.
+
+    Parameters
+    ----------
+    cases : list of dict
+        Requirement cases with batchsizing.CASE_FIELDS keys.
+    n_points : int, optional
+        Number of W/S points of the W/P curves, as in MatchingChartRenderer.
+    bounds : tuple, optional
+        (min, max) of W/S and of W/P.
+
+    Returns
+    -------
+    charts : list of dict
+        limits, curves and design keyword arguments of MatchingChartRenderer.draw, one per case. A case that
+        cannot be solved, e.g. of an unknown takeoff criteria, has no constraints and the exception under 'error'.
+
+    """
+    return bs._CaseByCase(lambda cases: _ChartData(cases, n_points, bounds), cases,
+                          lambda error: {'limits': {}, 'curves': {}, 'design': None,
+                                         'error': f'{type(error).__name__}: {error}'})
+
+
+def _ChartData(cases, n_points, bounds):
+    limits, curves = bs.CaseConstraints(cases)
+    solution = mc.SolveMatchingChart(limits, curves, bounds=bounds)
+    W_S = np.broadcast_to(np.linspace(bounds[0][0], bounds[0][1], n_points), (len(cases), n_points))
+    limits = {name: np.broadcast_to(limit, (len(cases),)) for name, limit in limits.items()}
+    curves = {name: np.broadcast_to(curve(W_S), W_S.shape) for name, curve in curves.items()}
+    return [{'limits': {name: limit[i] for name, limit in limits.items()},
+             'curves': {name: curve[i] for name, curve in curves.items()},
+             'design': (solution.W_S[i], solution.W_P[i])} for i in range(len(cases))]
+
+
+def _InitWorker(options, TOP_cache):
+    global _RENDERER
+    bs._InitWorker(TOP_cache)
+    _RENDERER = MatchingChartRenderer(**options)
+
+
+def _ChartDataIndexed(chunk):
+    start, cases = chunk
+    return start, ChartData(cases, len(_RENDERER.W_S), _RENDERER.bounds)
+
+
+def _Draw(renderer, chart, case):
+    # a failed case is drawn as an empty chart showing its error, so pages keep their case numbers
+    chart = dict(chart)
+    error = chart.pop('error', None)
+    with it.Span('chartrenderer.draw'):
+        renderer.draw(title=f'{renderer.title}, case {case}', message=error, **chart)
+    if error is not None:
+        it.Count('chartrenderer.failed_cases')
+    return error is not None
+
+
+def _RenderIndexed(job):
+    (start, cases), directory, format = job
+    failed = 0
+    for i, chart in enumerate(ChartData(cases, len(_RENDERER.W_S), _RENDERER.bounds)):
+        failed += _Draw(_RENDERER, chart, start + i)
+        _RENDERER.save(os.path.join(directory, f'case-{start + i:06d}.{format}'), format)
+    return len(cases), failed
+
+
+def RenderCases(cases, output, format=None, workers=None, chunksize=64, TOP_cache=None, **options):
+    """
+    Function to render the matching chart of every requirement case.
+
+    PNG and SVG pages are rendered and written by the worker processes, one file per case in the output directory.
+    A PDF output is one multi-page document, the workers compute the chart data in parallel and the pages are
+    drawn in case order into it by this process.
+
+    Parameters
+    ----------
+    cases : iterable of dict
+        Requirement cases with batchsizing.CASE_FIELDS keys.
+    output : str
+        PDF file, or directory of the case-NNNNNN.png or .svg pages.
+    format : str, optional
+        One of PAGE_FORMATS, pdf for a .pdf output and png otherwise by default.
+    workers : int, optional
+        Number of worker processes, the CPU count by default. With 1 the cases are rendered in this process.
+    chunksize : int, optional
+        Number of cases a worker computes together.
+    TOP_cache : str, optional
+        Persisted TOP coefficient file shared by the workers, see performancesizing.LoadTOPCoefficients.
+    **options
+        MatchingChartRenderer options.
+
+    Returns
+    -------
+    pages : int
+        Number of charts rendered.
+    failed : int
+        Number of cases that could not be solved, rendered as empty charts showing their error.
+
+    """
+    if format is None:
+        format = 'pdf' if output.lower().endswith('.pdf') else 'png'
+    if format not in PAGE_FORMATS:
+        raise ValueError(f'Format must be one of {", ".join(PAGE_FORMATS)}, not {format}.')
+    chunks = bs._Chunks(cases, chunksize)
+
+    if workers == 1:
+        _InitWorker(options, TOP_cache)
+        pool = None
+    else:
+        import multiprocessing
+        pool = multiprocessing.Pool(workers, initializer=_InitWorker, initargs=(options, TOP_cache))
+
+    try:
+        if format != 'pdf':
+            os.makedirs(output, exist_ok=True)
+            jobs = ((chunk, output, format) for chunk in chunks)
+            pages = failed = 0
+            for rendered, errors in map(_RenderIndexed, jobs) if pool is None else \
+                    pool.imap_unordered(_RenderIndexed, jobs):
+                pages += rendered
+                failed += errors
+            return pages, failed
+
+        from matplotlib.backends.backend_pdf import PdfPages
+
+        renderer = MatchingChartRenderer(**options) if pool is not None else _RENDERER
+        pages = failed = 0
+        with PdfPages(output) as pdf:
+            for start, charts in map(_ChartDataIndexed, chunks) if pool is None else \
+                    pool.imap(_ChartDataIndexed, chunks):
+                for i, chart in enumerate(charts):
+                    failed += _Draw(renderer, chart, start + i)
+                    renderer.save(pdf)
+                pages += len(charts)
+        return pages, failed
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Render the matching chart of every requirement case in a CSV file.')
+    parser.add_argument('cases', help=f'CSV file with the columns {", ".join(bs.CASE_FIELDS)}')
+    parser.add_argument('-o', '--output', required=True, help='multi-page PDF file, or directory of PNG/SVG pages')
+    parser.add_argument('-f', '--format', choices=PAGE_FORMATS, help='page format, from the output by default')
+    parser.add_argument('-w', '--workers', type=int, default=None, help='number of worker processes')
+    parser.add_argument('-c', '--chunksize', type=int, default=64, help='cases computed together by a worker')
+    parser.add_argument('--dpi', type=int, default=300, help='resolution of PNG pages')
+    parser.add_argument('--top-cache', default=pf.TOP_CACHE, help='persisted TOP coefficient file')
+    args = parser.parse_args(argv)
+
+    # fit once here so the workers only load the persisted coefficients
+    pf.LoadTOPCoefficients(cache=args.top_cache)
+    pages, failed = RenderCases(bs.ReadCases(args.cases), args.output, args.format, args.workers, args.chunksize,
+                                args.top_cache, dpi=args.dpi)
+    print(f'{pages} matching charts written to {args.output}' + (f', {failed} failed cases drawn empty'
+                                                                   if failed else ''), file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
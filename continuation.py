@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Fri Oct 30 09:17:46 2026
+
+Continuation sweeps of the matching chart design point, walking requirements such as the stall speed, landing
+distance, service ceiling or takeoff distance step by step and re-solving each step with SLSQP started from the
+solution of the previous ones. Along the way the takeoff weight and installed power of every step are read from
+the sizing graph, and the non-dominated steps form the Pareto front of the trade.
+
+    path = ContinuationSweep(inputs, {'Vcruise': np.linspace(600, 900, 31)})
+    front = path.pareto(['W0', 'power'])
+@author: ardya
+"""
+
+import numpy as np
+import matchingchart as mc
+import sizinggraph as sg
+
+# Initial W/S and W/P of cold solves, the default of SolveMatchingChartSLSQP
+START = (25.0, 25.0)
+
+OUTPUTS = ('W_S', 'W_P', 'W0', 'power')
+
+
+def ContinuationModel(**inputs):
+    """
+    Function to build the sizing graph of SizingModel with the design point solved by SolveMatchingChartSLSQP from
+    the x0 input, so a sweep can warm start every solve.
+
+    Parameters
+    ----------
+    **inputs
+        Inputs of sizinggraph.SizingModel, and x0, the initial W/S and W/P, START by default.
+
+    Returns
+    -------
+    SizingGraph
+        With the constraints node, a MatchingChartConstraintSet, the SLSQP iterations and constraint evaluations
+        of the last solve, and the installed power W0/(W/P) in hp. W_S and W_P are NaN for infeasible solves.
+
+    """
+    x0 = inputs.pop('x0', START)
+    graph = sg.SizingModel(**inputs)
+    graph.input('x0', tuple(x0))
+
+    graph.define('constraints', lambda altitude, deltaT, CLmax, TOP, Slanding, Sa, ceiling, Vcruise, AR, e, CD0, Vs:
+                 mc.MatchingChartConstraintSet(altitude, deltaT, CLmax, TOP, Slanding, Sa, ceiling, Vcruise, AR, e,
+                                               CD0, Vs=Vs))
+
+    def slsqp(constraints, x0):
+        # the constraint set is kept while only x0 changes, count the work of this solve alone
+        iterations, evaluations = constraints.iterations, constraints.evaluations
+        solution = mc.SolveMatchingChartSLSQP(constraints, x0)
+        return solution, constraints.iterations - iterations, constraints.evaluations - evaluations
+
+    graph.define('slsqp', slsqp)
+    graph.define('design', lambda slsqp: slsqp[0])
+    graph.define('iterations', lambda slsqp: slsqp[1])
+    graph.define('evaluations', lambda slsqp: slsqp[2])
+    graph.define('W_S', lambda design: design.W_S[0] if design.feasible[0] else np.nan)
+    graph.define('W_P', lambda design: design.W_P[0] if design.feasible[0] else np.nan)
+    graph.define('power', lambda W0, W_P: W0 / W_P)
+    return graph
+
+
+def ParetoFront(objectives, maximize=()):
+    """
+    Function to find the non-dominated points of several objectives, the points no other point is at least as
+    good as in every objective and better in one.
+
+    Parameters
+    ----------
+    objectives : dict
+        Objective name to array of one value per point, minimized unless named in maximize.
+    maximize : sequence of str, optional
+        Objectives to maximize.
+
+    Returns
+    -------
+    front : array of bools
+        Whether each point is on the Pareto front, points with a NaN objective never are.
+
+    """
+    costs = np.column_stack([(-1 if name in maximize else 1) * np.asarray(values, dtype=float)
+                             for name, values in objectives.items()])
+    finite = np.isfinite(costs).all(axis=1)
+    points = costs[finite]
+    no_worse = (points[None, :, :] <= points[:, None, :]).all(axis=2)
+    better = (points[None, :, :] < points[:, None, :]).any(axis=2)
+    front = np.zeros(len(costs), dtype=bool)
+    front[finite] = ~(no_worse & better).any(axis=1)
+    return front
+
+
+class ContinuationPath:
+    """
+    Solutions of a continuation sweep, one entry per step.
+
+    Attributes
+    ----------
+    steps : dict
+        Walked input name to array of its value at each step.
+    data : dict
+        Output name to array of one value per step, with feasible, the active constraints joined by '|', and the
+        SLSQP iterations and constraint evaluations of each solve, 0 at steps that reused the previous solve.
+
+    """
+
+    def __init__(self, steps, data):
+        self.steps = steps
+        self.data = data
+
+    def __getitem__(self, name):
+        return self.steps[name] if name in self.steps else self.data[name]
+
+    def __len__(self):
+        return len(self.data['feasible'])
+
+    def keys(self):
+        return list(self.steps) + list(self.data)
+
+    def pareto(self, minimize, maximize=()):
+        """Whether each step is on the Pareto front of the named outputs, see ParetoFront."""
+        return ParetoFront({name: self[name] for name in list(minimize) + list(maximize)}, maximize)
+
+    def __repr__(self):
+        steps = ', '.join(f'{name}: {values[0]:g} to {values[-1]:g}' for name, values in self.steps.items())
+        return f'ContinuationPath({len(self)} steps, {steps})'
+
+
+def ContinuationSweep(inputs, steps, outputs=OUTPUTS, warm=True, secant=True):
+    """
+    Function to walk sizing inputs along a path and solve the matching chart at every step, each solve started
+    from the previous solution. A secant predictor extrapolates the last two solutions to the next step, so a
+    design point moving along an active constraint is met within a few SLSQP iterations.
+
+    SLSQP follows the branch of local optima the walk starts on, where the global optimum jumps to another corner
+    of the feasible region SolveMatchingChart finds it and the continuation does not.
+
+    Parameters
+    ----------
+    inputs : dict or SizingGraph
+        Inputs of ContinuationModel, or a graph built by it which is left at the last step.
+    steps : dict
+        Input name to 1-D array of its values along the path, all of the same length. Several inputs walk
+        together, the takeoff requirement is walked through TOdistance.
+    outputs : sequence of str, optional
+        Nodes of the graph recorded at each step.
+    warm : bool, optional
+        Start each solve from the previous solutions, or from START for cold solves.
+    secant : bool, optional
+        Extrapolate the last two feasible solutions, or restart from the last one.
+
+    Returns
+    -------
+    ContinuationPath
+
+    """
+    graph = inputs if isinstance(inputs, sg.SizingGraph) else ContinuationModel(**inputs)
+    steps = {name: np.atleast_1d(np.asarray(values, dtype=float)) for name, values in steps.items()}
+    n = {len(values) for values in steps.values()}
+    if len(n) != 1:
+        raise ValueError('Every walked input must have the same number of steps.')
+    n = n.pop()
+
+    # position along the path, each input scaled by its range
+    distance = np.zeros(n)
+    for values in steps.values():
+        span = np.ptp(values)
+        distance[1:] += (np.diff(values) / (span if span > 0 else 1))**2
+    t = np.cumsum(np.sqrt(distance))
+
+    (W_Smin, W_Smax), (W_Pmin, W_Pmax) = mc.BOUNDS
+    previous = []
+    columns = {name: [] for name in list(outputs) + ['feasible', 'active', 'iterations', 'evaluations']}
+    for k in range(n):
+        graph.update(**{name: values[k] for name, values in steps.items()})
+        if not warm or not previous:
+            x0 = np.array(START)
+        elif secant and len(previous) == 2 and previous[1][0] > previous[0][0]:
+            (t1, x1), (t2, x2) = previous
+            x0 = x2 + (x2 - x1) * (t[k] - t2) / (t2 - t1)
+            x0 = np.clip(x0, (W_Smin, W_Pmin), (W_Smax, W_Pmax))
+        else:
+            x0 = previous[-1][1]
+        graph['x0'] = tuple(x0)
+
+        solves = graph.evaluations.get('slsqp', 0)
+        design = graph['design']
+        # a step that changes neither the constraints nor x0 reuses the cached solve and runs no SLSQP
+        solved = graph.evaluations.get('slsqp', 0) > solves
+        feasible = bool(design.feasible[0])
+        for name in outputs:
+            columns[name].append(graph[name])
+        columns['feasible'].append(feasible)
+        columns['active'].append('|'.join(name for name, flags in design.active.items() if flags[0]))
+        columns['iterations'].append(graph['iterations'] if solved else 0)
+        columns['evaluations'].append(graph['evaluations'] if solved else 0)
+        if feasible:
+            previous = (previous + [(t[k], np.array([design.W_S[0], design.W_P[0]]))])[-2:]
+
+    data = {name: np.array(values) for name, values in columns.items()}
+    return ContinuationPath(steps, data)
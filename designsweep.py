@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 20:15:02 2026
+
+Design-space sweep of every performancesizing constraint over N-dimensional parameter grids.
+@author: ardya
+"""
+
+import numpy as np
+import performancesizing as pf
+import maxlift as ml
+import instrumentation as it
+
+# Atmosphere conditions shared between constraints, as (altitude, deltaT) parameter names.
+# None means the condition is fixed at that value (sea level / ISA day).
+ATMOSPHERES = {
+    'runway': ('altitude', 'deltaT'),
+    'cruise': ('cruise_altitude', None),
+    'loiter': ('loiter_altitude', None),
+    'turn': ('turn_altitude', None),
+    'climb': (None, None),
+    'ceiling': ('ceiling_altitude', None),
+}
+
+# Constraint name: (function, atmosphere, performancesizing argument -> sweep parameter name)
+CONSTRAINTS = {
+    'Stall': (pf.StallWingLoading, 'runway',
+              {'altitude': 'altitude', 'deltaT': 'deltaT', 'Vs': 'Vs', 'CLmax': 'CLmax'}),
+    'Takeoff': (pf.TakeoffWingLoading, 'runway',
+                {'TOP': 'TOP', 'altitude': 'altitude', 'deltaT': 'deltaT', 'CLTO': 'CLTO', 'W_S': 'W_S'}),
+    'Landing': (pf.LandingWingLoading, 'runway',
+                {'Slanding': 'Slanding', 'Sa': 'Sa', 'altitude': 'altitude', 'deltaT': 'deltaT', 'CLmax': 'CLmax'}),
+    'Cruise': (pf.CruiseWingLoadingOpt, 'cruise',
+               {'altitude': 'cruise_altitude', 'Vcruise': 'Vcruise', 'AR': 'AR', 'e': 'e', 'CD0': 'CD0'}),
+    'Loiter': (pf.LoiterWingLoadingOpt, 'loiter',
+               {'altitude': 'loiter_altitude', 'Vloiter': 'Vloiter', 'AR': 'AR', 'e': 'e', 'CD0': 'CD0'}),
+    'InstantTurn': (pf.InstantTurnWingLoading, 'turn',
+                    {'altitude': 'turn_altitude', 'turnrate': 'turnrate', 'Vcorner': 'Vcorner',
+                     'CLmaxcombat': 'CLmaxcombat'}),
+    'SustainedTurn': (pf.SustainedTurnWingLoading, 'turn',
+                      {'altitude': 'turn_altitude', 'Vturn': 'Vturn', 'n': 'n', 'AR': 'AR', 'e': 'e',
+                       'CD0': 'CD0', 'W_P': 'W_P'}),
+    'Climb': (pf.ClimbWingLoading, 'climb',
+              {'G': 'G', 'Vclimb': 'Vclimb', 'AR': 'AR', 'e': 'e', 'CD0': 'CD0', 'W_S': 'W_S'}),
+    'Ceiling': (pf.CeilingWingLoading, 'ceiling',
+                {'altitude': 'ceiling_altitude', 'Vceiling': 'Vceiling', 'AR': 'AR', 'e': 'e',
+                 'CD0': 'CD0', 'W_S': 'W_S'}),
+}
+
+
+class SweepResult:
+    """
+    Labelled result cube of a design-space sweep.
+
+    Every constraint array has the full grid shape, one axis per swept parameter in the order of `dims`.
+    Constraints that do not depend on a swept parameter are broadcast along its axis without copying.
+
+    Attributes
+    ----------
+    dims : tuple of str
+        Names of the swept parameters, one per axis.
+    coords : dict
+        Grid values of each swept parameter.
+    data : dict
+        Constraint name to wing loading (lb/ft2) or power loading (lb/hp) array.
+
+    """
+
+    def __init__(self, dims, coords, data):
+        self.dims = tuple(dims)
+        self.coords = coords
+        self.data = data
+
+    @property
+    def shape(self):
+        return tuple(len(self.coords[dim]) for dim in self.dims)
+
+    def __getitem__(self, name):
+        return self.data[name]
+
+    def __contains__(self, name):
+        return name in self.data
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def keys(self):
+        return self.data.keys()
+
+    def sel(self, **values):
+        """
+        Select the grid slice nearest to the given parameter values.
+
+        Parameters
+        ----------
+        **values : float
+            Swept parameter name and the value to select, the nearest grid point is taken.
+
+        Returns
+        -------
+        SweepResult
+            Result with the selected dimensions removed.
+
+        """
+        index = [slice(None)] * len(self.dims)
+        for name, value in values.items():
+            axis = self.dims.index(name)
+            index[axis] = int(np.argmin(np.abs(self.coords[name] - value)))
+        dims = [dim for dim, i in zip(self.dims, index) if isinstance(i, slice)]
+        coords = {dim: self.coords[dim] for dim in dims}
+        data = {name: array[tuple(index)] for name, array in self.data.items()}
+        return SweepResult(dims, coords, data)
+
+    def __repr__(self):
+        grid = ', '.join(f'{dim}: {len(self.coords[dim])}' for dim in self.dims)
+        return f'SweepResult({grid}; constraints: {", ".join(self.data)})'
+
+
+@it.Traced('designsweep.sweep')
+def DesignSpaceSweep(constraints=None, **parameters):
+    """
+    Function to evaluate the performance sizing constraints over an N-dimensional grid of requirements in one
+    broadcast pass. Air density is evaluated once per atmosphere condition and shared by the constraints using it.
+
+    Parameters
+    ----------
+    constraints : list of str, optional
+        Constraints to evaluate, see CONSTRAINTS. By default every constraint whose parameters are all given.
+    **parameters : float or 1-D array of floats
+        Sizing parameters under the performancesizing argument names, with altitude/deltaT for the runway and
+        cruise_altitude, loiter_altitude, turn_altitude and ceiling_altitude for the other conditions.
+        Scalars are held fixed, arrays become a grid dimension in the order they are given.
+        CLTO defaults to CLmax/1.21 when only CLmax is given. Without CLmax, sweep in degrees and flap, high lift
+        system names of maxlift or their codes, give CLmax from the maximum lift chart. A swept flap has its codes
+        as grid coordinates.
+
+    Returns
+    -------
+    SweepResult
+        Labelled constraint values over the grid.
+
+    """
+    if 'flap' in parameters:
+        parameters = dict(parameters, flap=ml.LoadCLmax().codes(parameters['flap']))
+
+    dims = [name for name, value in parameters.items() if np.ndim(value) == 1]
+    for name, value in parameters.items():
+        if np.ndim(value) > 1:
+            raise ValueError(f'Parameter {name} must be a scalar or a 1-D array.')
+
+    # Open grid, each swept parameter only spans its own axis
+    ndim = len(dims)
+    values = {}
+    for name, value in parameters.items():
+        if name in dims:
+            shape = [1] * ndim
+            shape[dims.index(name)] = -1
+            values[name] = np.asarray(value, dtype=float).reshape(shape)
+        else:
+            values[name] = value
+    if 'CLmax' not in values and 'sweep' in values and 'flap' in values:
+        values['CLmax'] = ml.LoadCLmax()(values['sweep'], values['flap'])
+    if 'CLTO' not in values and 'CLmax' in values:
+        values['CLTO'] = values['CLmax'] / 1.21
+
+    if constraints is None:
+        constraints = [name for name, (function, atmosphere, arguments) in CONSTRAINTS.items()
+                       if all(argument in values for argument in arguments.values())]
+
+    shape = tuple(len(parameters[dim]) for dim in dims)
+    sigmas = {}
+    data = {}
+    for name in constraints:
+        function, atmosphere, arguments = CONSTRAINTS[name]
+        missing = [argument for argument in arguments.values() if argument not in values]
+        if missing:
+            raise KeyError(f'Constraint {name} is missing parameters: {", ".join(missing)}')
+
+        if atmosphere not in sigmas:
+            altitude, deltaT = ATMOSPHERES[atmosphere]
+            altitude = 0 if altitude is None else values[altitude]
+            deltaT = 0 if deltaT is None else values[deltaT]
+            rho0, rho, sigmas[atmosphere] = pf.AirDensity(altitude, deltaT)
+
+        result = function(**{argument: values[parameter] for argument, parameter in arguments.items()},
+                          sigma=sigmas[atmosphere])
+        data[name] = np.broadcast_to(result, shape)
+
+    coords = {dim: np.asarray(parameters[dim], dtype=float) for dim in dims}
+    return SweepResult(dims, coords, data)
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Thu Oct 22 10:05:44 2026
+
+Streaming reader of Engauge Digitizer .dig documents, the digitized charts the sizing data is exported from.
+The embedded chart image is skipped while parsing, and the curves are cached beside the document.
+@author: ardya
+"""
+
+from collections import namedtuple
+import json
+import os
+import xml.etree.ElementTree as ET
+import numpy as np
+import instrumentation as it
+
+AXES_CURVE = 'Axes'
+
+DigitizedChart = namedtuple('DigitizedChart', ['curves', 'axes_screen', 'axes_graph', 'log_x', 'log_y'])
+DigitizedChart.__doc__ = """
+Curves of a digitized chart. curves maps each curve name to an (n_points, 2) array of graph coordinates in the
+order the points were digitized. axes_screen and axes_graph are the (n_axis_points, 2) pixel and graph coordinates
+of the axis calibration points, log_x and log_y flag logarithmic axes.
+"""
+
+# Loaded charts of each document in this session, with the source stamp they were read at
+_LOADED = {}
+
+
+class _DigTarget:
+    # XMLParser target collecting points, character data (the base64 image) is never stored
+    def __init__(self):
+        self.log_x = self.log_y = False
+        self.curves = {}
+        self.curve = None
+        self.point = None
+
+    def start(self, tag, attrib):
+        if tag == 'Coords':
+            if attrib.get('TypeString', 'Cartesian') != 'Cartesian':
+                raise ValueError(f'Only Cartesian charts are supported, not {attrib["TypeString"]}.')
+            self.log_x = attrib.get('ScaleXThetaString') == 'Log'
+            self.log_y = attrib.get('ScaleYRadiusString') == 'Log'
+        elif tag == 'Curve':
+            self.curve = attrib['CurveName']
+            self.curves[self.curve] = []
+        elif tag == 'Point' and self.curve is not None:
+            self.point = {'ordinal': float(attrib.get('Ordinal', len(self.curves[self.curve]))),
+                          'x_only': attrib.get('IsXOnly') == 'True'}
+        elif tag in ('PositionScreen', 'PositionGraph') and self.point is not None:
+            self.point[tag] = (float(attrib['X']), float(attrib['Y']))
+
+    def end(self, tag):
+        if tag == 'Point' and self.point is not None:
+            self.curves[self.curve].append(self.point)
+            self.point = None
+        elif tag == 'Curve':
+            self.curve = None
+
+    def data(self, data):
+        pass
+
+    def close(self):
+        return self
+
+
+@it.Traced('digparser.parse')
+def _Parse(filename, blocksize=1 << 16):
+    target = _DigTarget()
+    parser = ET.XMLParser(target=target)
+    with open(filename, 'rb') as file:
+        for block in iter(lambda: file.read(blocksize), b''):
+            parser.feed(block)
+    parser.close()
+
+    axes = [point for point in target.curves.pop(AXES_CURVE, [])
+            if 'PositionGraph' in point and not point['x_only']]
+    if len(axes) < 3:
+        raise ValueError(f'{filename} needs three axis points with both graph coordinates to be calibrated.')
+    axes_screen = np.array([point['PositionScreen'] for point in axes])
+    axes_graph = np.array([point['PositionGraph'] for point in axes])
+
+    # affine map from pixels to graph coordinates, in log10 space for logarithmic axes
+    log = [target.log_x, target.log_y]
+    graph = axes_graph.copy()
+    graph[:, log] = np.log10(graph[:, log])
+    transform = np.linalg.lstsq(np.column_stack([axes_screen, np.ones(len(axes))]), graph, rcond=None)[0]
+
+    curves = {}
+    for name, points in target.curves.items():
+        points = sorted(points, key=lambda point: point['ordinal'])
+        screen = np.array([point['PositionScreen'] for point in points]).reshape(-1, 2)
+        values = np.column_stack([screen, np.ones(len(screen))]) @ transform
+        values[:, log] = 10**values[:, log]
+        curves[name] = values
+    return DigitizedChart(curves, axes_screen, axes_graph, target.log_x, target.log_y)
+
+
+def _WriteCache(cache, chart, stamp):
+    arrays = {'__stamp__': np.array(json.dumps(stamp)), '__curves__': np.array(list(chart.curves), dtype=str),
+              '__axes_screen__': chart.axes_screen, '__axes_graph__': chart.axes_graph,
+              '__log__': np.array([chart.log_x, chart.log_y])}
+    for i, values in enumerate(chart.curves.values()):
+        arrays[f'curve{i}'] = values
+    # write beside and rename so a concurrent reader never sees a partial cache
+    temporary = f'{cache}.{os.getpid()}.tmp'
+    with open(temporary, 'wb') as file:
+        np.savez(file, **arrays)
+    os.replace(temporary, cache)
+
+
+def _ReadCache(cache):
+    with np.load(cache, allow_pickle=False) as data:
+        stamp = json.loads(str(data['__stamp__']))
+        curves = {str(name): data[f'curve{i}'] for i, name in enumerate(data['__curves__'])}
+        log_x, log_y = (bool(flag) for flag in data['__log__'])
+        chart = DigitizedChart(curves, data['__axes_screen__'], data['__axes_graph__'], log_x, log_y)
+    return chart, stamp
+
+
+def LoadDig(filename, cache=None):
+    """
+    Function to load the curves of an Engauge .dig document.
+
+    The first call stream-parses the document and caches the curves beside it, later calls read the cache as long
+    as the document modification time and size are unchanged, and within one session the chart is returned from
+    memory.
+
+    Parameters
+    ----------
+    filename : str
+        Path to the .dig document.
+    cache : str, optional
+        Path to the .npz cache, the document path with an .npz extension appended by default.
+
+    Returns
+    -------
+    DigitizedChart
+        Curves in graph coordinates and the axis calibration.
+
+    """
+    filename = os.path.abspath(filename)
+    if cache is None:
+        cache = filename + '.npz'
+
+    status = os.stat(filename)
+    stamp = {'mtime_ns': status.st_mtime_ns, 'size': status.st_size}
+    loaded = _LOADED.get(filename)
+    if loaded is not None and loaded[1] == stamp:
+        it.Count('digparser.memory_hits')
+        return loaded[0]
+
+    chart = None
+    if os.path.exists(cache):
+        try:
+            chart, cached = _ReadCache(cache)
+        except (OSError, ValueError, KeyError):
+            chart = None
+        else:
+            if cached != stamp:
+                chart = None
+    if chart is None:
+        chart = _Parse(filename)
+        _WriteCache(cache, chart, stamp)
+    else:
+        it.Count('digparser.cache_hits')
+
+    _LOADED[filename] = (chart, stamp)
+    return chart
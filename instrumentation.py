@@ -0,0 +1,334 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 25 09:12:40 2026
+
+Stage level instrumentation of sizing runs, named spans around the pipeline stages and counters of function
+evaluations, optimizer iterations, cache hits and subprocess wall time, exported as JSON lines or a Chrome trace.
+
+Disabled by default, Span then returns a shared no-op context and Count returns at once. Enable it in code with
+Enable(), or for a whole run, pool workers included, with the SIZING_TRACE environment variable naming a JSON
+lines file each process streams its spans to, where {pid} is replaced by the process id. The files of a run are
+merged into one Chrome trace with
+    SIZING_TRACE=trace-{pid}.jsonl python batchsizing.py cases.csv
+    python instrumentation.py trace-*.jsonl -o trace.json
+@author: ardya
+"""
+
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+
+TRACE_VARIABLE = 'SIZING_TRACE'
+
+_ENABLED = False
+_EVENTS = []
+_COUNTERS = {}
+_LOCK = threading.Lock()
+_LOCAL = threading.local()
+
+# JSON lines file of SIZING_TRACE, and the open file of this process
+_TRACE_FILE = None
+_TRACE_HANDLE = {}
+
+
+class _NullSpan:
+    # the span of the disabled mode, shared and stateless
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def set(self, **args):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        stack = getattr(_LOCAL, 'stack', None)
+        if stack is None:
+            stack = _LOCAL.stack = []
+        self.parent = stack[-1].name if stack else None
+        stack.append(self)
+        self.wall = time.time()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        end = time.perf_counter()
+        _LOCAL.stack.pop()
+        event = {'name': self.name, 'start': self.wall, 'duration': end - self.start,
+                 'pid': os.getpid(), 'tid': threading.get_ident(), 'parent': self.parent}
+        if exc_type is not None:
+            self.args['error'] = exc_type.__name__
+        if self.args:
+            event['args'] = self.args
+        _EVENTS.append(event)
+        if _TRACE_FILE is not None and not _LOCAL.stack:
+            Flush()
+        return False
+
+    def set(self, **args):
+        """Attach arguments to the span, e.g. the size of its input once known."""
+        self.args.update(args)
+
+
+def Enabled():
+    """Whether spans and counters are recorded."""
+    return _ENABLED
+
+
+def Enable():
+    """Start recording spans and counters."""
+    global _ENABLED
+    _ENABLED = True
+
+
+def Disable():
+    """Stop recording, the recorded spans and counters are kept until Reset."""
+    global _ENABLED
+    _ENABLED = False
+
+
+def Reset():
+    """Forget the recorded spans and counters."""
+    with _LOCK:
+        del _EVENTS[:]
+        _COUNTERS.clear()
+
+
+def Span(name, **args):
+    """
+    Function to time a pipeline stage, used as a context manager.
+
+        with it.Span('matchingchart.solve', cases=n) as span:
+            ...
+
+    Parameters
+    ----------
+    name : str
+        Stage name, dotted by module.
+    **args
+        JSON serializable arguments recorded with the span.
+
+    Returns
+    -------
+    context manager
+        Records the span on exit, a shared no-op when instrumentation is disabled.
+
+    """
+    if not _ENABLED:
+        return _NULL_SPAN
+    return _Span(name, args)
+
+
+def Traced(name):
+    """Decorator timing every call of a function as a span."""
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _ENABLED:
+                return function(*args, **kwargs)
+            with _Span(name, {}):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def Count(name, value=1):
+    """
+    Function to add to a counter, such as function evaluations, iterations, cache hits or seconds spent in a
+    subprocess.
+
+    Parameters
+    ----------
+    name : str
+        Counter name, dotted by module.
+    value : int or float, optional
+        Amount added.
+
+    """
+    if not _ENABLED:
+        return
+    with _LOCK:
+        _COUNTERS[name] = _COUNTERS.get(name, 0) + value
+
+
+def Events():
+    """Recorded spans, dicts of name, start time since the epoch and duration in seconds, pid, tid, parent span name
+    and args."""
+    return list(_EVENTS)
+
+
+def Counters():
+    """Counter name to its total."""
+    with _LOCK:
+        return dict(_COUNTERS)
+
+
+def Summary():
+    """
+    Function to aggregate the recorded spans by name.
+
+    Returns
+    -------
+    summary : dict
+        Span name to dict of calls, total, mean and max duration in seconds, ordered by total duration.
+
+    """
+    summary = {}
+    for event in Events():
+        stage = summary.setdefault(event['name'], {'calls': 0, 'total': 0.0, 'max': 0.0})
+        stage['calls'] += 1
+        stage['total'] += event['duration']
+        stage['max'] = max(stage['max'], event['duration'])
+    for stage in summary.values():
+        stage['mean'] = stage['total'] / stage['calls']
+    return dict(sorted(summary.items(), key=lambda item: -item[1]['total']))
+
+
+def _SpanLine(event):
+    return json.dumps(dict(event, type='span'), default=str) + '\n'
+
+
+def _CountersLine(counters):
+    return json.dumps({'type': 'counters', 'pid': os.getpid(), 'counters': counters}) + '\n'
+
+
+def Flush():
+    """
+    Function to stream the spans recorded since the last flush and the counter totals to the SIZING_TRACE file
+    of this process, done after every outermost span. The flushed spans are dropped from memory.
+    """
+    if _TRACE_FILE is None:
+        return
+    with _LOCK:
+        events = _EVENTS[:]
+        del _EVENTS[:]
+        counters = dict(_COUNTERS)
+        pid = os.getpid()
+        if pid not in _TRACE_HANDLE:
+            _TRACE_HANDLE[pid] = open(_TRACE_FILE.replace('{pid}', str(pid)), 'a')
+        file = _TRACE_HANDLE[pid]
+        file.writelines([_SpanLine(event) for event in events] + [_CountersLine(counters)])
+        file.flush()
+
+
+def WriteJSONLines(filename):
+    """
+    Function to write the recorded spans, one JSON object per line, followed by a line with the counters.
+
+    Parameters
+    ----------
+    filename : str
+        Path of the trace file.
+
+    """
+    with open(filename, 'w') as file:
+        file.writelines([_SpanLine(event) for event in Events()] + [_CountersLine(Counters())])
+
+
+def ReadJSONLines(filenames):
+    """
+    Function to read and merge JSON lines traces, such as the SIZING_TRACE files of every process of a run.
+
+    Parameters
+    ----------
+    filenames : str or list of str
+        Trace files.
+
+    Returns
+    -------
+    events : list of dict
+        Spans of every file.
+    counters : dict
+        Counter totals summed over the processes, the last totals written by each one.
+
+    """
+    events = []
+    totals = {}
+    for filename in [filenames] if isinstance(filenames, str) else filenames:
+        with open(filename) as file:
+            for line in file:
+                record = json.loads(line)
+                if record.pop('type') == 'span':
+                    events.append(record)
+                else:
+                    totals[record['pid']] = record['counters']
+    counters = {}
+    for process in totals.values():
+        for name, value in process.items():
+            counters[name] = counters.get(name, 0) + value
+    return events, counters
+
+
+def WriteChromeTrace(filename, events=None, counters=None):
+    """
+    Function to write spans and counters in the Chrome trace event format, for chrome://tracing and Perfetto.
+
+    Parameters
+    ----------
+    filename : str
+        Path of the trace file.
+    events, counters : optional
+        Spans and counters as returned by ReadJSONLines, the ones recorded in this process by default.
+
+    """
+    events, counters = (Events() if events is None else events), (Counters() if counters is None else counters)
+    trace = []
+    for event in events:
+        trace.append({'name': event['name'], 'cat': event['name'].split('.')[0], 'ph': 'X',
+                      'ts': event['start'] * 1e6, 'dur': event['duration'] * 1e6,
+                      'pid': event['pid'], 'tid': event['tid'], 'args': event.get('args', {})})
+    end = max([event['ts'] + event['dur'] for event in trace] + [0])
+    for name, value in counters.items():
+        trace.append({'name': name, 'ph': 'C', 'ts': end, 'pid': 0, 'args': {'value': value}})
+    with open(filename, 'w') as file:
+        json.dump({'traceEvents': trace, 'displayTimeUnit': 'ms'}, file, default=str)
+
+
+def _AfterFork():
+    # a forked worker starts with its own empty record, and a lock no parent thread can be holding
+    global _LOCK
+    _LOCK = threading.Lock()
+    _EVENTS.clear()
+    _COUNTERS.clear()
+    _LOCAL.stack = []
+
+
+if os.environ.get(TRACE_VARIABLE):
+    _TRACE_FILE = os.environ[TRACE_VARIABLE]
+    Enable()
+    atexit.register(Flush)
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_AfterFork)
+
+
+def main(argv=None):
+    import argparse
+    import glob
+
+    parser = argparse.ArgumentParser(description='Merge JSON lines traces of a sizing run into a Chrome trace.')
+    parser.add_argument('traces', nargs='+', help='JSON lines trace files, glob patterns are expanded')
+    parser.add_argument('-o', '--output', default='trace.json', help='Chrome trace file to write')
+    args = parser.parse_args(argv)
+
+    filenames = sorted(name for pattern in args.traces for name in glob.glob(pattern) or [pattern])
+    events, counters = ReadJSONLines(filenames)
+    WriteChromeTrace(args.output, events, counters)
+    for name, value in counters.items():
+        print(f'{name}: {value:g}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,351 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 21:40:11 2026
+
+Exact solver of the matching chart design point, batched over many requirement cases.
+@author: ardya
+"""
+
+from collections import namedtuple
+import numpy as np
+import performancesizing as pf
+import instrumentation as it
+
+# Matching chart bounds of W/S in lb/ft2 and W/P in lb/hp
+BOUNDS = ((1.0, 50.0), (1.0, 50.0))
+
+MatchingChartSolution = namedtuple('MatchingChartSolution', ['W_S', 'W_P', 'feasible', 'active'])
+
+
+def MatchingChartConstraints(altitude, deltaT, CLmax, TOP, Slanding, Sa, ServiceCeiling, Vcruise, AR, e, CD0,
+                             Vs=None):
+    """
+    Function to build the matching chart constraints of the stall, takeoff, landing and ceiling requirements.
+    Every parameter is a scalar or an array with one value per case.
+
+    Parameters
+    ----------
+    altitude : float or array of floats
+        Runway altitude in m.
+    deltaT : float or array of floats
+        Difference in sea level temperature from ISA standard of 15 degrees C.
+    CLmax : float or array of floats
+        Maximum lift coefficient of the wing, the takeoff lift coefficient is taken as CLmax/1.21.
+    TOP : float or array of floats
+        Takeoff parameter.
+    Slanding : float or array of floats
+        Landing distance in ft.
+    Sa : float or array of floats
+        Obstacle-clearance distance in ft.
+    ServiceCeiling : float or array of floats
+        Service ceiling altitude in m.
+    Vcruise : float or array of floats
+        Cruise speed at service ceiling in ft/s.
+    AR, e, CD0 : float or array of floats
+        Aspect ratio, Oswald efficiency and zero-lift drag coefficient.
+    Vs : float or array of floats, optional
+        Stall speed in ft/s, no stall constraint when not given. NaN drops it for a single case.
+
+    Returns
+    -------
+    limits : dict
+        Name to W/S limit of the vertical line constraints, one value per case.
+    curves : dict
+        Name to function of W/S returning the W/P limit, for W/S of shape (n_cases, n_points).
+
+    """
+    altitude, deltaT, CLmax, TOP, Slanding, Sa, ServiceCeiling, Vcruise, AR, e, CD0 = (
+        np.atleast_1d(np.asarray(value, dtype=float))
+        for value in (altitude, deltaT, CLmax, TOP, Slanding, Sa, ServiceCeiling, Vcruise, AR, e, CD0))
+
+    rho0, rho, sigma = pf.AirDensity(altitude, deltaT)
+    rho0, rho, sigma_ceiling = pf.AirDensity(ServiceCeiling, 0)
+    CLTO = CLmax/1.21
+
+    limits = {'Landing': pf.LandingWingLoading(Slanding, Sa, altitude, deltaT, CLmax, sigma=sigma)}
+    if Vs is not None:
+        Vs = np.atleast_1d(np.asarray(Vs, dtype=float))
+        # a missing stall requirement never limits the wing loading
+        limits['Stall'] = np.where(np.isnan(Vs), np.inf,
+                                   pf.StallWingLoading(altitude, deltaT, Vs, CLmax, sigma=sigma))
+
+    def column(value):
+        return value[:, None] if value.size > 1 else value
+
+    curves = {
+        'Takeoff': lambda W_S: pf.TakeoffWingLoading(column(TOP), None, None, column(CLTO), W_S,
+                                                     sigma=column(sigma)),
+        'Ceiling': lambda W_S: pf.CeilingWingLoading(None, column(Vcruise), column(AR), column(e), column(CD0), W_S,
+                                                     sigma=column(sigma_ceiling)),
+    }
+    return limits, curves
+
+
+def _Envelope(W_S, curves, W_Pmax):
+    it.Count('matchingchart.envelope_evaluations')
+    # W/P upper limit of every curve and the W/P bound, stacked along the first axis
+    values = np.stack(np.broadcast_arrays(*[curve(W_S) for curve in curves], W_Pmax), axis=0)
+    return values.min(axis=0), values.argmin(axis=0)
+
+
+def _Gather(mask, *arrays):
+    # Pack the flagged entries of each row to the front of an (n_cases, k) array, padding with the first entry
+    count = mask.sum(axis=1)
+    k = max(int(count.max(initial=0)), 1)
+    order = np.argsort(~mask, axis=1, kind='stable')[:, :k]
+    valid = np.arange(k) < count[:, None]
+    order = np.where(valid, order, order[:, :1])
+    return valid, [np.take_along_axis(array, order, axis=1) for array in arrays]
+
+
+@it.Traced('matchingchart.solve')
+def SolveMatchingChart(limits, curves, bounds=BOUNDS, n_points=256, xtol=1e-9):
+    """
+    Function to find the feasible matching chart point farthest from the origin, the highest wing and power loading
+    satisfying every constraint, for many cases at once.
+
+    The upper boundary of the feasible region is the lowest of the W/P curves and the W/P bound, cut off at the
+    lowest W/S limit. The optimum lies at one of its corners or at a stationary point along one curve, these are
+    located on a grid and refined by vectorized bisection of the constraint intersections and golden section search.
+
+    Parameters
+    ----------
+    limits : dict
+        Name to W/S upper limit (lb/ft2) of the vertical line constraints, scalar or one value per case.
+    curves : dict
+        Name to function returning the W/P upper limit (lb/hp) for W/S of shape (n_cases, n_points).
+    bounds : tuple, optional
+        (min, max) of W/S and of W/P.
+    n_points : int, optional
+        Number of grid points along W/S used to locate the corners.
+    xtol : float, optional
+        Absolute tolerance of the refined W/S.
+
+    Returns
+    -------
+    MatchingChartSolution
+        W_S and W_P of the design point per case (NaN when infeasible), feasible flags, and active, a dict of
+        constraint name to whether it is active at the design point. The bounds are reported as 'W_S bound' and
+        'W_P bound'.
+
+    """
+    (W_Smin, W_Smax), (W_Pmin, W_Pmax) = bounds
+    names = list(curves)
+    functions = [curves[name] for name in names]
+    n = max([np.size(limit) for limit in limits.values()] +
+            [np.shape(function(np.full((1, 1), W_Smin)))[0] for function in functions] + [1])
+
+    it.Count('matchingchart.cases', n)
+
+    W_Slimit = np.full(n, float(W_Smax))
+    for limit in limits.values():
+        W_Slimit = np.minimum(W_Slimit, limit)
+    width = np.maximum(W_Slimit - W_Smin, 0)
+
+    # grid along W/S, state changes when the active curve changes or W/P drops under its lower bound
+    t = np.linspace(0, 1, n_points)
+    W_S = W_Smin + width[:, None] * t
+    W_P, index = _Envelope(W_S, functions, W_Pmax)
+    state = np.where(W_P >= W_Pmin, index, -1)
+
+    candidates_W_S = [W_S]
+    candidates_valid = [np.ones(W_S.shape, dtype=bool)]
+
+    # corners between grid points, refined by bisection on the state of the left end
+    change = state[:, 1:] != state[:, :-1]
+    if change.any():
+        valid, (left, right, left_state) = _Gather(change, W_S[:, :-1], W_S[:, 1:], state[:, :-1])
+        for i in range(int(np.ceil(np.log2(max(width.max() / n_points, xtol) / xtol))) + 1):
+            middle = 0.5 * (left + right)
+            W_P_middle, index_middle = _Envelope(middle, functions, W_Pmax)
+            same = np.where(W_P_middle >= W_Pmin, index_middle, -1) == left_state
+            left = np.where(same, middle, left)
+            right = np.where(same, right, middle)
+        # the feasible side of a corner is the left one unless W/P only becomes feasible on the right
+        candidates_W_S += [left, right]
+        candidates_valid += [valid, valid]
+
+    # stationary points along a single curve, refined by golden section search on the distance to the origin
+    distance = W_S**2 + W_P**2
+    peak = np.zeros(W_S.shape, dtype=bool)
+    peak[:, 1:-1] = ((distance[:, 1:-1] > distance[:, :-2]) & (distance[:, 1:-1] > distance[:, 2:]) &
+                     ~change[:, :-1] & ~change[:, 1:])
+    if peak.any():
+        valid, (left, right) = _Gather(peak, np.roll(W_S, 1, axis=1), np.roll(W_S, -1, axis=1))
+        ratio = (np.sqrt(5) - 1) / 2
+
+        def objective(x):
+            return x**2 + _Envelope(x, functions, W_Pmax)[0]**2
+
+        for i in range(int(np.ceil(np.log(xtol / max(2 * width.max() / n_points, xtol)) / np.log(ratio))) + 1):
+            x1 = right - ratio * (right - left)
+            x2 = left + ratio * (right - left)
+            higher = objective(x1) > objective(x2)
+            right = np.where(higher, x2, right)
+            left = np.where(higher, left, x1)
+        candidates_W_S.append(0.5 * (left + right))
+        candidates_valid.append(valid)
+
+    W_S = np.concatenate(candidates_W_S, axis=1)
+    W_P, index = _Envelope(W_S, functions, W_Pmax)
+    admissible = np.concatenate(candidates_valid, axis=1) & (W_P >= W_Pmin)
+    distance = np.where(admissible, W_S**2 + W_P**2, -np.inf)
+    best = distance.argmax(axis=1)[:, None]
+
+    feasible = (W_Slimit >= W_Smin) & admissible.any(axis=1)
+    W_S = np.where(feasible, np.take_along_axis(W_S, best, axis=1)[:, 0], np.nan)
+    W_P = np.where(feasible, np.take_along_axis(W_P, best, axis=1)[:, 0], np.nan)
+
+    # constraints within tolerance of the design point
+    atol = 1e3 * xtol
+    active = {name: feasible & (np.abs(np.broadcast_to(limit, (n,)) - W_S) <= atol)
+              for name, limit in limits.items()}
+    for name, function in zip(names, functions):
+        W_Pcurve = function(np.where(feasible, W_S, W_Smin)[:, None])
+        active[name] = feasible & (np.abs(np.broadcast_to(W_Pcurve, (n, 1))[:, 0] - W_P) <=
+                                   atol * np.maximum(1, np.abs(W_P)))
+    active['W_S bound'] = feasible & ((np.abs(W_S - W_Smax) <= atol) | (np.abs(W_S - W_Smin) <= atol))
+    active['W_P bound'] = feasible & ((np.abs(W_P - W_Pmax) <= atol) | (np.abs(W_P - W_Pmin) <= atol))
+
+    return MatchingChartSolution(W_S, W_P, feasible, active)
+
+
+class MatchingChartConstraintSet:
+    """
+    Matching chart constraints of a single case as g(x) >= 0 with x = (W/S, W/P), for gradient based optimizers.
+    The density ratios are computed once, and the constraint values and their Jacobian are evaluated together at
+    each x, so SciPy asking for both at the same point costs one evaluation.
+
+    Parameters
+    ----------
+    altitude, deltaT, CLmax, TOP, Slanding, Sa, ServiceCeiling, Vcruise, AR, e, CD0, Vs :
+        Scalars as in MatchingChartConstraints.
+
+    Attributes
+    ----------
+    evaluations : int
+        Number of points the constraints were evaluated at.
+    iterations : int
+        Number of SLSQP iterations of the solves of SolveMatchingChartSLSQP.
+
+    """
+
+    def __init__(self, altitude, deltaT, CLmax, TOP, Slanding, Sa, ServiceCeiling, Vcruise, AR, e, CD0, Vs=None):
+        rho0, rho, self.sigma = pf.AirDensity(altitude, deltaT)
+        rho0, rho, self.sigma_ceiling = pf.AirDensity(ServiceCeiling, 0)
+        self.TOP, self.CLTO = TOP, CLmax/1.21
+        self.Vcruise, self.AR, self.e, self.CD0 = Vcruise, AR, e, CD0
+
+        self.limits = {'Landing': pf.LandingWingLoading(Slanding, Sa, altitude, deltaT, CLmax, sigma=self.sigma)}
+        if Vs is not None and not np.isnan(Vs):
+            self.limits['Stall'] = pf.StallWingLoading(altitude, deltaT, Vs, CLmax, sigma=self.sigma)
+        self.names = list(self.limits) + ['Takeoff', 'Ceiling']
+        self.evaluations = 0
+        self.iterations = 0
+        self._x = None
+
+    def evaluate(self, x):
+        """
+        Function to evaluate the constraints and their Jacobian at x = (W/S, W/P).
+
+        Returns
+        -------
+        values : array of floats
+            Constraint values in the order of names, non-negative when satisfied.
+        jacobian : array of floats
+            Derivatives of the values with respect to W/S and W/P, of shape (len(names), 2).
+
+        """
+        x = np.array(x, dtype=float)
+        if self._x is not None and np.array_equal(x, self._x):
+            return self._values, self._jacobian
+
+        W_S, W_P = x
+        takeoff = pf.TakeoffWingLoading(self.TOP, None, None, self.CLTO, W_S, sigma=self.sigma)
+        ceiling = pf.CeilingWingLoading(None, self.Vcruise, self.AR, self.e, self.CD0, W_S, sigma=self.sigma_ceiling)
+        values = np.array([limit - W_S for limit in self.limits.values()] + [takeoff - W_P, ceiling - W_P])
+
+        # vertical limits only depend on W/S, the curves reuse the W/P just computed
+        jacobian = np.zeros((len(values), 2))
+        jacobian[:len(self.limits), 0] = -1
+        jacobian[-2] = pf.TakeoffWingLoadingDerivative(self.TOP, None, None, self.CLTO, W_S, sigma=self.sigma,
+                                                       W_P=takeoff), -1
+        jacobian[-1] = pf.CeilingWingLoadingDerivative(None, self.Vcruise, self.AR, self.e, self.CD0, W_S,
+                                                       sigma=self.sigma_ceiling, W_P=ceiling), -1
+
+        self.evaluations += 1
+        it.Count('matchingchart.constraint_evaluations')
+        self._x, self._values, self._jacobian = x, values, jacobian
+        return values, jacobian
+
+    def values(self, x):
+        """Constraint values at x, the f_ieqcons of scipy.optimize.fmin_slsqp."""
+        return self.evaluate(x)[0]
+
+    def jacobian(self, x):
+        """Constraint Jacobian at x, the fprime_ieqcons of scipy.optimize.fmin_slsqp."""
+        return self.evaluate(x)[1]
+
+    def scipy(self):
+        """Constraint dict of scipy.optimize.minimize."""
+        return {'type': 'ineq', 'fun': self.values, 'jac': self.jacobian}
+
+
+def DistanceObjective(x):
+    """
+    Function to calculate the matching chart objective, the negative distance of x = (W/S, W/P) from the origin,
+    and its gradient.
+
+    Returns
+    -------
+    objective : float
+        Negative distance from the origin.
+    gradient : array of floats
+        Derivatives of the objective with respect to W/S and W/P.
+
+    """
+    x = np.asarray(x, dtype=float)
+    distance = np.sqrt(x @ x)
+    return -distance, -x / distance
+
+
+@it.Traced('matchingchart.slsqp')
+def SolveMatchingChartSLSQP(constraints, x0=(25.0, 25.0), bounds=BOUNDS, acc=1e-10, iter=100):
+    """
+    Function to find the matching chart design point of one case with SLSQP and analytic gradients, the gradient
+    based counterpart of SolveMatchingChart for warm started solves inside outer loops. SLSQP converges to the
+    local optimum nearest x0, SolveMatchingChart finds the global one.
+
+    Parameters
+    ----------
+    constraints : MatchingChartConstraintSet
+        Constraints of the case.
+    x0 : sequence of floats, optional
+        Initial W/S and W/P.
+    bounds : tuple, optional
+        (min, max) of W/S and of W/P.
+    acc, iter : optional
+        Accuracy and iteration limit of scipy.optimize.fmin_slsqp.
+
+    Returns
+    -------
+    MatchingChartSolution
+        Design point as one element arrays, with the constraints within 1e-6 of their limit reported active.
+
+    """
+    import scipy.optimize as opt
+
+    x, fx, iterations, mode, message = opt.fmin_slsqp(
+        lambda x: DistanceObjective(x)[0], np.asarray(x0, dtype=float),
+        fprime=lambda x: DistanceObjective(x)[1], f_ieqcons=constraints.values,
+        fprime_ieqcons=constraints.jacobian, bounds=bounds, acc=acc, iter=iter, iprint=0, full_output=True)
+    constraints.iterations += iterations
+    it.Count('matchingchart.slsqp_iterations', iterations)
+
+    values = constraints.values(x)
+    feasible = np.array([mode == 0 and bool(np.all(values >= -1e-6))])
+    active = {name: feasible & (abs(value) <= 1e-6) for name, value in zip(constraints.names, values)}
+    (W_Smin, W_Smax), (W_Pmin, W_Pmax) = bounds
+    active['W_S bound'] = feasible & (min(abs(x[0] - W_Smin), abs(x[0] - W_Smax)) <= 1e-6)
+    active['W_P bound'] = feasible & (min(abs(x[1] - W_Pmin), abs(x[1] - W_Pmax)) <= 1e-6)
+    return MatchingChartSolution(np.array([x[0]]), np.array([x[1]]), feasible, active)
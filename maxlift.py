@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Thu Oct 22 14:48:19 2026
+
+Maximum lift coefficient of moderate aspect ratio wings against sweep angle for each high lift system,
+interpolated from the digitized MaximumLiftCoef_moderateAR chart.
+@author: ardya
+"""
+
+import os
+import numpy as np
+
+CLMAX_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'MaximumLiftCoef_moderateAR.csv')
+
+# Loaded surfaces of each chart in this session
+_LOADED = {}
+
+
+def _PchipSlopes(x, y):
+    # Fritsch-Carlson slopes of a monotone piecewise cubic through every column of y
+    h = np.diff(x)[:, None]
+    delta = np.diff(y, axis=0) / h
+    slopes = np.zeros_like(y)
+
+    w1 = 2 * h[1:] + h[:-1]
+    w2 = h[1:] + 2 * h[:-1]
+    monotone = delta[:-1] * delta[1:] > 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        slopes[1:-1] = np.where(monotone, (w1 + w2) / (w1 / delta[:-1] + w2 / delta[1:]), 0)
+
+    # one-sided three point end slopes, limited to keep the ends monotone
+    for end, h0, h1, d0, d1 in ((0, h[0], h[1], delta[0], delta[1]), (-1, h[-1], h[-2], delta[-1], delta[-2])):
+        slope = ((2 * h0 + h1) * d0 - h0 * d1) / (h0 + h1)
+        slope = np.where(np.sign(slope) != np.sign(d0), 0, slope)
+        slope = np.where((np.sign(d0) != np.sign(d1)) & (np.abs(slope) > np.abs(3 * d0)), 3 * d0, slope)
+        slopes[end] = slope
+    return slopes
+
+
+class CLmaxSurface:
+    """
+    Wing maximum lift coefficient against sweep angle for each high lift system, smooth and monotone across sweep.
+
+    Attributes
+    ----------
+    sweep : array of floats
+        Sweep angles of the chart in degrees.
+    flaps : tuple of str
+        High lift system names.
+    values : array of floats
+        CLmax of shape (len(sweep), len(flaps)).
+
+    """
+
+    def __init__(self, sweep, flaps, values):
+        self.sweep = np.asarray(sweep, dtype=float)
+        self.flaps = tuple(flaps)
+        self.values = np.asarray(values, dtype=float)
+        self._slopes = _PchipSlopes(self.sweep, self.values)
+        self._flaps = {flap: j for j, flap in enumerate(self.flaps)}
+
+    def flap(self, name):
+        """Column of a high lift system name, raising KeyError with the valid names when it is unknown."""
+        try:
+            return self._flaps[name]
+        except KeyError:
+            raise KeyError(f'{name!r} is not a high lift system, expected one of: {", ".join(self.flaps)}') from None
+
+    def codes(self, flaps):
+        """Function to convert high lift system names, a name or an array of names, to column codes."""
+        if isinstance(flaps, str):
+            return self.flap(flaps)
+        flaps = np.asarray(flaps)
+        if flaps.dtype.kind == 'f' and np.all(flaps == np.round(flaps)):
+            # codes that went through a float grid
+            flaps = flaps.astype(int)
+        if flaps.dtype.kind in 'iu':
+            if np.any((flaps < 0) | (flaps >= len(self.flaps))):
+                raise KeyError(f'High lift system codes must be between 0 and {len(self.flaps) - 1}.')
+            return flaps
+        names, inverse = np.unique(flaps, return_inverse=True)
+        return np.array([self.flap(name) for name in names], dtype=int)[inverse.reshape(np.shape(flaps))]
+
+    def __call__(self, sweep, flap):
+        """
+        Function to interpolate the maximum lift coefficient, vectorized and broadcast over sweep and flap.
+
+        Parameters
+        ----------
+        sweep : float or array of floats
+            Wing sweep angle in degrees, within the chart.
+        flap : str, int or array of str or ints
+            High lift system names or their column codes.
+
+        Returns
+        -------
+        CLmax : float or array of floats
+            Maximum lift coefficient of the wing, for StallWingLoading and LandingWingLoading, and divided by
+            1.21 for TakeoffWingLoading.
+
+        """
+        sweep = np.asarray(sweep, dtype=float)
+        if np.any(sweep < self.sweep[0]) or np.any(sweep > self.sweep[-1]):
+            raise ValueError(f'Sweep must be between {self.sweep[0]:g} and {self.sweep[-1]:g} degrees.')
+        sweep, flap = np.broadcast_arrays(sweep, self.codes(flap))
+
+        i = np.clip(np.searchsorted(self.sweep, sweep, side='right') - 1, 0, len(self.sweep) - 2)
+        h = self.sweep[i + 1] - self.sweep[i]
+        t = (sweep - self.sweep[i]) / h
+        # cubic Hermite basis
+        h00 = (1 + 2 * t) * (1 - t)**2
+        h10 = t * (1 - t)**2
+        h01 = t**2 * (3 - 2 * t)
+        h11 = t**2 * (t - 1)
+        CLmax = (h00 * self.values[i, flap] + h10 * h * self._slopes[i, flap] +
+                 h01 * self.values[i + 1, flap] + h11 * h * self._slopes[i + 1, flap])
+        return CLmax[()]
+
+    def __repr__(self):
+        return f'CLmaxSurface(sweep {self.sweep[0]:g} to {self.sweep[-1]:g} deg, flaps: {", ".join(self.flaps)})'
+
+
+def LoadCLmax(filename=CLMAX_FILE):
+    """
+    Function to load the maximum lift coefficient chart, read once per session.
+
+    Parameters
+    ----------
+    filename : str, optional
+        Path to the digitized chart, sweep angle in the first column and CLmax of each high lift system in the
+        following columns, named in a commented header.
+
+    Returns
+    -------
+    CLmaxSurface
+        Interpolating lookup of the chart.
+
+    """
+    filename = os.path.abspath(filename)
+    if filename not in _LOADED:
+        with open(filename) as file:
+            header = file.readline().lstrip('#').split(',')
+        data = np.genfromtxt(filename, delimiter=',', skip_header=1)
+        _LOADED[filename] = CLmaxSurface(data[:, 0], [name.strip() for name in header[1:]], data[:, 1:])
+    return _LOADED[filename]
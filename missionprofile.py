@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 13:47:09 2026
+
+Mission profiles as sequences of typed segments, with fuel fractions evaluated for whole parameter grids at once.
+@author: ardya
+"""
+
+import numpy as np
+
+
+class Segment:
+    """
+    Mission segment with a weight fraction Wi/Wi-1. Fixed segments use Raymer's historical fraction.
+
+    Parameters
+    ----------
+    fraction : float or array of floats
+        Weight fraction of the segment.
+
+    """
+    name = 'segment'
+
+    def __init__(self, fraction):
+        self.weight_fraction = fraction
+
+    def log_fraction(self):
+        return np.log(self.weight_fraction)
+
+    def fraction(self):
+        return np.exp(self.log_fraction())
+
+    def __repr__(self):
+        return f'{type(self).__name__}()'
+
+
+class Takeoff(Segment):
+    """Warmup and takeoff segment."""
+    name = 'takeoff'
+
+    def __init__(self, fraction=0.97):
+        super().__init__(fraction)
+
+
+class Climb(Segment):
+    """Climb and accelerate segment."""
+    name = 'climb'
+
+    def __init__(self, fraction=0.985):
+        super().__init__(fraction)
+
+
+class Land(Segment):
+    """Landing segment."""
+    name = 'land'
+
+    def __init__(self, fraction=0.995):
+        super().__init__(fraction)
+
+
+class Cruise(Segment):
+    """
+    Cruise segment from the Breguet range equation.
+
+    Parameters
+    ----------
+    R : float or array of floats
+        Cruise range in ft.
+    C : float or array of floats
+        Specific fuel consumption at cruise in 1/s.
+    L_D : float or array of floats
+        Lift to drag ratio at cruise.
+    V : float or array of floats
+        Cruise speed in ft/s.
+
+    """
+    name = 'cruise'
+
+    def __init__(self, R, C, L_D, V):
+        self.R, self.C, self.L_D, self.V = R, C, L_D, V
+
+    def log_fraction(self):
+        return -(np.asarray(self.R) * self.C) / (np.asarray(self.V) * self.L_D)
+
+    def __repr__(self):
+        return f'Cruise(R={self.R!r}, C={self.C!r}, L_D={self.L_D!r}, V={self.V!r})'
+
+
+class Loiter(Segment):
+    """
+    Loiter segment from the Breguet endurance equation.
+
+    Parameters
+    ----------
+    E : float or array of floats
+        Loiter endurance in s.
+    C : float or array of floats
+        Specific fuel consumption at loiter in 1/s.
+    L_D : float or array of floats
+        Lift to drag ratio at loiter.
+
+    """
+    name = 'loiter'
+
+    def __init__(self, E, C, L_D):
+        self.E, self.C, self.L_D = E, C, L_D
+
+    def log_fraction(self):
+        return -(np.asarray(self.E) * self.C) / np.asarray(self.L_D)
+
+    def __repr__(self):
+        return f'Loiter(E={self.E!r}, C={self.C!r}, L_D={self.L_D!r})'
+
+
+# Segment types by the names the weight estimation script asks for
+SEGMENTS = {segment.name: segment for segment in (Takeoff, Climb, Cruise, Loiter, Land)}
+
+
+def MissionFuelFraction(segments, reserve=0.0):
+    """
+    Function to calculate the total fuel fraction of a mission profile. Every segment parameter may be an array,
+    the fractions of all segments broadcast against each other and are combined in one pass.
+
+    Parameters
+    ----------
+    segments : list of Segment
+        Mission segments in flight order. Reserve segments, e.g. a loiter at the destination, are listed like any
+        other segment.
+    reserve : float, optional
+        Reserve and trapped fuel allowance as a fraction of the mission fuel, typically 0.06.
+
+    Returns
+    -------
+    fuel_fraction : float or array of floats
+        Total fuel fraction Wf/W0.
+
+    """
+    log_fraction = sum(segment.log_fraction() for segment in segments)
+    return (1 + reserve) * -np.expm1(log_fraction)
+
+
+def MissionPayload(W0, We, W_crew, fuel_fraction):
+    """
+    Function to calculate the payload an aircraft carries for a given fuel fraction, for range-payload and
+    endurance-payload diagrams.
+
+    Parameters
+    ----------
+    W0 : float or array of floats
+        Takeoff weight in lbs.
+    We : float or array of floats
+        Empty weight in lbs.
+    W_crew : float or array of floats
+        Weight of the crew in lbs.
+    fuel_fraction : float or array of floats
+        Total fuel fraction of the mission.
+
+    Returns
+    -------
+    W_payload : float or array of floats
+        Payload weight in lbs, negative where the mission cannot be flown.
+
+    """
+    return W0 * (1 - fuel_fraction) - We - W_crew
+
+
+def LiftToDrag(K_LD, AR, WettedAreaRatio, engine='jet'):
+    """
+    Function to estimate the maximum L/D from Raymer's K_LD constant and the L/D flown at cruise and loiter, where
+    a jet cruises and a propeller aircraft loiters at 86.6% of the maximum.
+
+    Parameters
+    ----------
+    K_LD : float or array of floats
+        L/D constant of the aircraft type, from the K_LD sheet.
+    AR : float or array of floats
+        Wing aspect ratio.
+    WettedAreaRatio : float or array of floats
+        Wetted area over wing reference area.
+    engine : str or array of str, optional
+        jet or prop.
+
+    Returns
+    -------
+    L_D_max, L_D_cruise, L_D_loiter : float or array of floats
+        Maximum, cruise and loiter L/D.
+
+    """
+    L_D_max = K_LD * np.sqrt(AR / WettedAreaRatio)
+    jet = np.asarray(engine) == 'jet'
+    L_D_cruise = np.where(jet, 0.866 * L_D_max, L_D_max)[()]
+    L_D_loiter = np.where(jet, L_D_max, 0.866 * L_D_max)[()]
+    return L_D_max, L_D_cruise, L_D_loiter
+
+
+def SizingMission(R, C_cruise, L_D_cruise, Vcruise, E, C_loiter, L_D_loiter):
+    """
+    Function to build the mission of the sizing chain, takeoff, climb, cruise, loiter and landing.
+
+    Parameters
+    ----------
+    R : float or array of floats
+        Cruise range in ft.
+    C_cruise, C_loiter : float or array of floats
+        Specific fuel consumption at cruise and loiter in 1/s.
+    L_D_cruise, L_D_loiter : float or array of floats
+        L/D at cruise and loiter, see LiftToDrag.
+    Vcruise : float or array of floats
+        Cruise speed in ft/s.
+    E : float or array of floats
+        Loiter endurance in s.
+
+    Returns
+    -------
+    segments : list of Segment
+        Mission segments in flight order, see MissionFuelFraction.
+
+    """
+    return [Takeoff(), Climb(), Cruise(R, C_cruise, L_D_cruise, Vcruise), Loiter(E, C_loiter, L_D_loiter), Land()]
@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Fri Oct 23 09:26:51 2026
+
+Monte Carlo uncertainty propagation through the sizing chain, atmosphere, matching chart constraints, mission fuel
+fractions and takeoff weight convergence, in fixed-size vectorized chunks with streaming statistics.
+@author: ardya
+"""
+
+import numpy as np
+import performancesizing as pf
+import matchingchart as mc
+import missionprofile as mp
+import weightestimation as we
+import instrumentation as it
+
+
+class Normal:
+    """Normal distribution of a sizing input."""
+
+    def __init__(self, mean, std):
+        self.mean, self.std = mean, std
+
+    def __call__(self, rng, size):
+        return rng.normal(self.mean, self.std, size)
+
+    def __repr__(self):
+        return f'Normal({self.mean!r}, {self.std!r})'
+
+
+class Uniform:
+    """Uniform distribution of a sizing input between low and high."""
+
+    def __init__(self, low, high):
+        self.low, self.high = low, high
+
+    def __call__(self, rng, size):
+        return rng.uniform(self.low, self.high, size)
+
+    def __repr__(self):
+        return f'Uniform({self.low!r}, {self.high!r})'
+
+
+class Triangular:
+    """Triangular distribution of a sizing input, the usual three point estimate of a guessed coefficient."""
+
+    def __init__(self, low, mode, high):
+        self.low, self.mode, self.high = low, mode, high
+
+    def __call__(self, rng, size):
+        return rng.triangular(self.low, self.mode, self.high, size)
+
+    def __repr__(self):
+        return f'Triangular({self.low!r}, {self.mode!r}, {self.high!r})'
+
+
+class LogNormal:
+    """Log-normal distribution of a positive sizing input, with the median and the standard deviation of its log."""
+
+    def __init__(self, median, sigma):
+        self.median, self.sigma = median, sigma
+
+    def __call__(self, rng, size):
+        return self.median * np.exp(rng.normal(0, self.sigma, size))
+
+    def __repr__(self):
+        return f'LogNormal({self.median!r}, {self.sigma!r})'
+
+
+class RunningStats:
+    """
+    Streaming statistics of one output, updated chunk by chunk in bounded memory. Mean and variance are merged with
+    the parallel form of Welford's algorithm, percentiles come from a fixed number of histogram bins whose range
+    doubles, merging bin pairs exactly, whenever a value falls outside it. NaN values (infeasible or diverged
+    designs) are counted separately.
+
+    Parameters
+    ----------
+    bins : int, optional
+        Number of histogram bins, even.
+
+    """
+
+    def __init__(self, bins=1024):
+        self.bins = bins + bins % 2
+        self.count = 0
+        self.nan_count = 0
+        self.mean = 0.0
+        self._M2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+        self.counts = None
+        self.low = self.width = None
+
+    def update(self, values):
+        """Function to add a chunk of values."""
+        values = np.asarray(values, dtype=float).ravel()
+        finite = values[np.isfinite(values)]
+        self.nan_count += len(values) - len(finite)
+        if len(finite) == 0:
+            return
+
+        n = len(finite)
+        mean = finite.mean()
+        M2 = ((finite - mean)**2).sum()
+        total = self.count + n
+        delta = mean - self.mean
+        self.mean += delta * n / total
+        self._M2 += M2 + delta**2 * self.count * n / total
+        self.count = total
+        self.min = min(self.min, finite.min())
+        self.max = max(self.max, finite.max())
+
+        if self.counts is None:
+            # first chunk sets the range, with a margin for later chunks
+            span = finite.max() - finite.min()
+            span = span if span > 0 else max(abs(finite[0]), 1.0)
+            self.low = finite.min() - 0.25 * span
+            self.width = 1.5 * span / self.bins
+            self.counts = np.zeros(self.bins, dtype=np.int64)
+        while finite.min() < self.low:
+            self._Widen(left=True)
+        while finite.max() >= self.low + self.bins * self.width:
+            self._Widen(left=False)
+        index = ((finite - self.low) / self.width).astype(np.int64)
+        self.counts += np.bincount(np.minimum(index, self.bins - 1), minlength=self.bins)
+
+    def _Widen(self, left):
+        pairs = self.counts.reshape(-1, 2).sum(axis=1)
+        empty = np.zeros(self.bins // 2, dtype=np.int64)
+        if left:
+            self.low -= self.bins * self.width
+            self.counts = np.concatenate([empty, pairs])
+        else:
+            self.counts = np.concatenate([pairs, empty])
+        self.width *= 2
+
+    @property
+    def var(self):
+        return self._M2 / (self.count - 1) if self.count > 1 else np.nan
+
+    @property
+    def std(self):
+        return np.sqrt(self.var)
+
+    def histogram(self):
+        """Bin counts and the bin edges."""
+        return self.counts, self.low + self.width * np.arange(self.bins + 1)
+
+    def percentile(self, q):
+        """
+        Function to estimate percentiles from the histogram, interpolated within a bin.
+
+        Parameters
+        ----------
+        q : float or array of floats
+            Percentiles between 0 and 100.
+
+        Returns
+        -------
+        float or array of floats
+            Values at the percentiles, within one bin width.
+
+        """
+        if not self.count:
+            return np.full(np.shape(q), np.nan)[()]
+        counts, edges = self.histogram()
+        cumulative = np.concatenate([[0], np.cumsum(counts)]) / self.count
+        return np.clip(np.interp(np.asarray(q) / 100, cumulative, edges), self.min, self.max)[()]
+
+    def summary(self, percentiles=(5, 50, 95)):
+        """Dict of count, nan_count, mean, std, min, max and the given percentiles."""
+        summary = {'count': self.count, 'nan_count': self.nan_count, 'mean': self.mean, 'std': self.std,
+                   'min': self.min, 'max': self.max}
+        for q, value in zip(percentiles, np.atleast_1d(self.percentile(percentiles))):
+            summary[f'p{q:g}'] = value
+        return summary
+
+    def __repr__(self):
+        return f'RunningStats(count={self.count}, mean={self.mean:.6g}, std={self.std:.6g})'
+
+
+# Sizing inputs, in the units of the interactive scripts after conversion, and their defaults
+INPUTS = {
+    'altitude': None,           # runway altitude in m
+    'deltaT': 0.0,              # temperature difference from ISA
+    'Vs': np.nan,               # stall speed in ft/s, NaN for no stall requirement
+    'CLmax': None,              # maximum lift coefficient of the wing
+    'TOP': None,                # takeoff parameter, or criteria and TOdistance in ft
+    'Slanding': None,           # landing distance in ft
+    'Sa': 450.0,                # obstacle-clearance distance in ft
+    'ceiling': None,            # service ceiling in m
+    'Vcruise': None,            # cruise speed in ft/s, also the speed at service ceiling
+    'AR': None, 'e': None, 'CD0': None,
+    'K_LD': None,               # L/D constant of the K_LD sheet
+    'WettedAreaRatio': None,    # wetted area over reference area
+    'engine': 'jet',            # jet or prop, sets the L/D of cruise and loiter
+    'R': None,                  # cruise range in ft
+    'E': 0.0,                   # loiter endurance in s
+    'C_cruise': None,           # specific fuel consumption at cruise in 1/s
+    'C_loiter': None,           # specific fuel consumption at loiter in 1/s
+    'reserve': 0.0,             # reserve and trapped fuel allowance
+    'W_crew': None, 'W_payload': None,
+    'A': None, 'C': None,       # empty weight fraction coefficients of the aircraft type
+    'Kvs': 1.0,
+}
+
+OUTPUTS = ('W_S', 'W_P', 'L_D_max', 'fuel_fraction', 'W0', 'We')
+
+
+@it.Traced('montecarlo.sizing_chain')
+def SizingChain(inputs):
+    """
+    Function to push arrays of sizing inputs through the atmosphere, the matching chart, the mission fuel fractions
+    and the takeoff weight convergence.
+
+    Parameters
+    ----------
+    inputs : dict
+        INPUTS names to scalars or arrays of one value per sample.
+
+    Returns
+    -------
+    outputs : dict
+        OUTPUTS names to arrays, NaN for infeasible matching charts and diverged takeoff weights.
+
+    """
+    values = dict(INPUTS, **inputs)
+    if values['TOP'] is None and 'criteria' in values:
+        values['TOP'] = pf.TOP(values['criteria'], values['TOdistance'])
+    missing = [name for name, value in values.items() if value is None]
+    if missing:
+        raise KeyError(f'Missing sizing inputs: {", ".join(missing)}')
+
+    limits, curves = mc.MatchingChartConstraints(values['altitude'], values['deltaT'], values['CLmax'],
+                                                 values['TOP'], values['Slanding'], values['Sa'], values['ceiling'],
+                                                 values['Vcruise'], values['AR'], values['e'], values['CD0'],
+                                                 Vs=values['Vs'])
+    design = mc.SolveMatchingChart(limits, curves)
+
+    L_D_max, L_D_cruise, L_D_loiter = mp.LiftToDrag(values['K_LD'], values['AR'], values['WettedAreaRatio'],
+                                                    values['engine'])
+    mission = mp.SizingMission(values['R'], values['C_cruise'], L_D_cruise, values['Vcruise'], values['E'],
+                               values['C_loiter'], L_D_loiter)
+    fuel_fraction = mp.MissionFuelFraction(mission, values['reserve'])
+
+    W0, We, diverged = we.SolveTakeoffWeight(values['W_crew'], values['W_payload'], fuel_fraction,
+                                             values['A'], values['C'], values['Kvs'])
+    return {'W_S': design.W_S, 'W_P': design.W_P, 'L_D_max': L_D_max, 'fuel_fraction': fuel_fraction,
+            'W0': W0, 'We': We}
+
+
+def MonteCarlo(inputs, n_samples, chunksize=4096, seed=None, outputs=OUTPUTS, bins=1024, model=SizingChain):
+    """
+    Function to propagate input uncertainty through the sizing chain. Samples are drawn and evaluated chunk by
+    chunk, only the streaming statistics of each output are kept, so memory does not grow with n_samples.
+
+    Parameters
+    ----------
+    inputs : dict
+        Input name to a fixed value or a distribution (Normal, Uniform, Triangular, LogNormal or any callable
+        taking a numpy Generator and a size).
+    n_samples : int
+        Number of samples.
+    chunksize : int, optional
+        Number of samples evaluated together, bounding the memory of one chunk.
+    seed : int, optional
+        Seed of the random generator, for repeatable studies.
+    outputs : tuple of str, optional
+        Outputs of the model to keep statistics of.
+    bins : int, optional
+        Histogram bins of each output.
+    model : callable, optional
+        Function of the dict of input arrays returning a dict of output arrays, SizingChain by default.
+
+    Returns
+    -------
+    stats : dict
+        Output name to RunningStats, e.g. stats['W0'].percentile([5, 95]) for an uncertainty band.
+
+    """
+    rng = np.random.default_rng(seed)
+    stats = {name: RunningStats(bins) for name in outputs}
+    for start in range(0, n_samples, chunksize):
+        size = min(chunksize, n_samples - start)
+        with it.Span('montecarlo.chunk', size=size):
+            chunk = {name: value(rng, size) if callable(value) else value for name, value in inputs.items()}
+            results = model(chunk)
+            for name in outputs:
+                stats[name].update(np.broadcast_to(results[name], (size,)))
+    return stats
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Tue Oct 20 08:44:16 2026
+
+Linear-strength vortex panel method, a fast screening backend to XFOIL.
+Every angle of attack of a geometry comes from one factorization, and many geometries are solved at once.
+@author: ardya
+"""
+
+import numpy as np
+import instrumentation as it
+
+
+def CoordinatesFromSurfaces(x, y_u, y_l):
+    """
+    Function to build XFOIL ordered coordinates from the upper and lower surfaces, the same input aeropy's
+    create_input takes.
+
+    Parameters
+    ----------
+    x : list or array of floats
+        Chordwise stations from the leading edge to the trailing edge.
+    y_u : list or array of floats
+        Upper surface ordinates at x.
+    y_l : list or array of floats
+        Lower surface ordinates at x.
+
+    Returns
+    -------
+    coordinates : array of floats
+        Coordinates of shape (2*len(x) - 1, 2) from the trailing edge over the upper surface to the leading edge
+        and back over the lower surface, the leading edge point shared.
+
+    """
+    x, y_u, y_l = (np.asarray(value, dtype=float) for value in (x, y_u, y_l))
+    return np.stack([np.concatenate([x[::-1], x[1:]]), np.concatenate([y_u[::-1], y_l[1:]])], axis=-1)
+
+
+@it.Traced('panelmethod.polar')
+def PanelPolar(coordinates, alphas, reynolds=None, chunksize=64):
+    """
+    Function to calculate the lift, drag and moment coefficients of airfoils with a linear-strength vortex panel
+    method, with the Kutta condition at the trailing edge.
+
+    The panel influence matrix of each geometry is solved once for the two freestream components, every angle of
+    attack is a combination of those. With reynolds, a flat plate skin friction with a thickness form factor gives
+    a profile drag estimate, otherwise CD is zero.
+
+    Parameters
+    ----------
+    coordinates : array of floats
+        Airfoil coordinates of shape (n_points, 2), or (n_airfoils, n_points, 2) for a batch, in XFOIL order from
+        the trailing edge over the upper surface to the leading edge and back over the lower surface.
+    alphas : float or array of floats
+        Angles of attack in degrees.
+    reynolds : float, optional
+        Chord Reynolds number of the drag estimate.
+    chunksize : int, optional
+        Number of airfoils solved together, bounding the memory of the influence matrices.
+
+    Returns
+    -------
+    data : dict
+        alpha, CL, CD and CM (about the quarter chord) arrays, keyed like aeropy's output_reader, of shape
+        (n_alphas,) or (n_airfoils, n_alphas) for a batch.
+
+    """
+    coordinates = np.asarray(coordinates, dtype=float)
+    single = coordinates.ndim == 2
+    if single:
+        coordinates = coordinates[None]
+    alpha = np.radians(np.atleast_1d(np.asarray(alphas, dtype=float)))
+
+    chunks = [_SolvePanels(coordinates[i:i + chunksize], alpha, reynolds)
+              for i in range(0, len(coordinates), chunksize)]
+    data = {key: np.concatenate([chunk[key] for chunk in chunks]) for key in chunks[0]}
+    if single:
+        data = {key: value[0] for key, value in data.items()}
+    return data
+
+
+def _SolvePanels(coordinates, alpha, reynolds):
+    # normalize to unit chord from the leading edge at the origin
+    leading = np.argmin(coordinates[:, :, 0], axis=1)
+    trailing = 0.5 * (coordinates[:, 0] + coordinates[:, -1])
+    nose = np.take_along_axis(coordinates, leading[:, None, None], axis=1)[:, 0]
+    chord = np.linalg.norm(trailing - nose, axis=1)
+    points = (coordinates - nose[:, None]) / chord[:, None, None]
+
+    # clockwise nodes, from the trailing edge over the lower surface, and control points at the panel midpoints
+    X, Y = points[:, ::-1, 0], points[:, ::-1, 1]
+    dX, dY = np.diff(X, axis=1), np.diff(Y, axis=1)
+    S = np.hypot(dX, dY)
+    theta = np.arctan2(dY, dX)
+    x = X[:, :-1] + 0.5 * dX
+    y = Y[:, :-1] + 0.5 * dY
+    n_panels = S.shape[1]
+
+    # influence of the vortex strength at the start (1) and end (2) node of panel j on control point i
+    Xi, Yi = x[:, :, None] - X[:, None, :-1], y[:, :, None] - Y[:, None, :-1]
+    ti, tj = theta[:, :, None], theta[:, None, :]
+    Sj = S[:, None, :]
+    A = -Xi * np.cos(tj) - Yi * np.sin(tj)
+    B = Xi**2 + Yi**2
+    C = np.sin(ti - tj)
+    D = np.cos(ti - tj)
+    E = Xi * np.sin(tj) - Yi * np.cos(tj)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        F = np.log1p((Sj**2 + 2 * A * Sj) / B)
+    G = np.arctan2(E * Sj, B + A * Sj)
+    P = Xi * np.sin(ti - 2 * tj) + Yi * np.cos(ti - 2 * tj)
+    Q = Xi * np.cos(ti - 2 * tj) - Yi * np.sin(ti - 2 * tj)
+    Cn2 = D + 0.5 * Q * F / Sj - (A * C + D * E) * G / Sj
+    Cn1 = 0.5 * D * F + C * G - Cn2
+    Ct2 = C + 0.5 * P * F / Sj + (A * D - C * E) * G / Sj
+    Ct1 = 0.5 * C * F - D * G - Ct2
+    diagonal = np.arange(n_panels)
+    Cn1[:, diagonal, diagonal], Cn2[:, diagonal, diagonal] = -1, 1
+    Ct1[:, diagonal, diagonal], Ct2[:, diagonal, diagonal] = np.pi / 2, np.pi / 2
+
+    # node strengths are shared by neighbouring panels, the last row is the Kutta condition
+    n = len(coordinates)
+    An = np.zeros((n, n_panels + 1, n_panels + 1))
+    At = np.zeros((n, n_panels, n_panels + 1))
+    An[:, :-1, :-1] += Cn1
+    An[:, :-1, 1:] += Cn2
+    At[:, :, :-1] += Ct1
+    At[:, :, 1:] += Ct2
+    An[:, -1, 0] = An[:, -1, -1] = 1
+
+    # freestream components cos(alpha) and sin(alpha) as two right hand sides of one factorization
+    rhs = np.zeros((n, n_panels + 1, 2))
+    rhs[:, :-1, 0] = np.sin(theta)
+    rhs[:, :-1, 1] = -np.cos(theta)
+    gamma = np.linalg.solve(An, rhs)
+    tangential = np.stack([np.cos(theta), np.sin(theta)], axis=-1) + At @ gamma
+
+    V = tangential @ np.stack([np.cos(alpha), np.sin(alpha)])
+    Cp = 1 - V**2
+
+    # pressure force of each panel with the outward normal (-sin(theta), cos(theta))
+    Fx = (Cp * (np.sin(theta) * S)[:, :, None]).sum(axis=1)
+    Fy = (-Cp * (np.cos(theta) * S)[:, :, None]).sum(axis=1)
+    CL = Fy * np.cos(alpha) - Fx * np.sin(alpha)
+    CM = -(Cp * ((-(x - 0.25) * np.cos(theta) - y * np.sin(theta)) * S)[:, :, None]).sum(axis=1)
+
+    if reynolds:
+        thickness = _Thickness(points)
+        # turbulent flat plate skin friction less the laminar run up to transition, on both surfaces
+        Cf = 0.455 / np.log10(reynolds)**2.58 - 1700 / reynolds
+        CD = np.broadcast_to((2 * Cf * (1 + 2 * thickness + 60 * thickness**4))[:, None], CL.shape).copy()
+    else:
+        CD = np.zeros(CL.shape)
+
+    return {'alpha': np.broadcast_to(np.degrees(alpha), CL.shape).copy(), 'CL': CL, 'CD': CD, 'CM': CM}
+
+
+def _Thickness(points):
+    # maximum thickness to chord ratio, upper and lower surfaces interpolated on a common grid
+    leading = np.argmin(points[:, :, 0], axis=1)
+    grid = np.linspace(0, 1, 201)
+    thickness = np.empty(len(points))
+    for i, (airfoil, nose) in enumerate(zip(points, leading)):
+        upper = airfoil[nose::-1]
+        lower = airfoil[nose:]
+        thickness[i] = np.max(np.interp(grid, upper[:, 0], upper[:, 1]) - np.interp(grid, lower[:, 0], lower[:, 1]))
+    return thickness
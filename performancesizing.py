@@ -5,43 +5,57 @@ Created on Fri Jul 28 09:20:54 2023
 @author: ardya
 """
 
+import json
+import os
 import numpy as np
-from scipy.optimize import curve_fit
+import atmosphere as at
+import instrumentation as it
+
+TOP_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'TOP.csv')
+TOP_DIG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'TOP.dig')
+TOP_CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'TOP_coefficients.npz')
+
+# Takeoff criteria in the column order of TOP.csv
+TOP_CRITERIA = ('TO_Dist_Prop_GroundRoll',
+                'TO_Dist_Prop_50ft',
+                'TO_Dist_Jet_GroundRoll',
+                'TO_Dist_Jet_50ft',
+                'TO_Dist_Jet_2eng_BFL',
+                'TO_Dist_Jet_3eng_BFL',
+                'TO_Dist_Jet_4eng_BFL')
+
+_TOP_COEFFICIENTS = None
 
 def AirDensity(altitude, deltaT):
     """
     Function to calculate air density at a given temperature difference and altitude.
-    Limited to altitudes between 0 and 11000m or 33000ft.
+    Valid from -5000 m to 84852 m, see atmosphere.ISA.
 
     Parameters
     ----------
-    altitude : float
+    altitude : float or array of floats
         Altitude of reference in m.
-    deltaT : float
+    deltaT : float or array of floats
         Difference in sea level temperature from ISA standard of 15 degrees C.
 
     Returns
     -------
     rho0 : float
         Air density on sea level in kg/m3.
-    rho : float
+    rho : float or array of floats
         Air density on altitude of reference in kg/m3.
-    sigma : float
+    sigma : float or array of floats
         Ratio between rho and rho0.
 
     """
-    T0 = 288.15 + deltaT
-    lapserate = 6.5/1000 # lapse rate of normal troposphere air in K/1000 m
-    rho0 = 1.225  # air density on sea level in kg/m3
-    g = 9.80665 # m/s2
-    R = 287.053 # J/kgK 
-    
-    sigma = (1 - lapserate/T0*altitude)**(g/(R*lapserate))
-    
-    rho = sigma * rho0
-    return rho0, rho, sigma
+    state = at.ISA(altitude, deltaT)
+    return at.RHO0, state.rho, state.sigma
 
-def StallWingLoading(altitude, deltaT, Vs, CLmax):
+def _ZeroSlope(*inputs):
+    # zero derivative of a wing loading limit that does not depend on W/P, shaped like the limit of these inputs
+    return np.zeros(np.broadcast(*(np.asarray(x) for x in inputs if x is not None)).shape)
+
+def StallWingLoading(altitude, deltaT, Vs, CLmax, sigma=None):
     """
     Function to calculate the wing loading of the aircraft based on its intended stall speed and altitude.
 
@@ -53,6 +67,8 @@ def StallWingLoading(altitude, deltaT, Vs, CLmax):
         Stall speed of the aircraft in ft/s.
     CLmax : float
         Maximum lift coefficient of the wing.
+    sigma : float or array of floats, optional
+        Density ratio at the reference altitude, computed with AirDensity when not given.
 
     Returns
     -------
@@ -60,68 +76,145 @@ def StallWingLoading(altitude, deltaT, Vs, CLmax):
         Wing loading of the aircraft in lb/ft2.
 
     """
-    rho0, rho, sigma = AirDensity(altitude, deltaT)
-    rho = rho * 0.0019403203 # convert from kg/m3 to slug/ft3
+    if sigma is None:
+        rho0, rho, sigma = AirDensity(altitude, deltaT)
+    rho = sigma * 1.225 * 0.0019403203 # convert from kg/m3 to slug/ft3
     q = .5 * rho * Vs**2
     
     W_Sstall =  q * CLmax
     return W_Sstall
 
-def TOP():
+def StallWingLoadingDerivative(altitude, deltaT, Vs, CLmax, sigma=None):
+    """
+    Function to calculate the derivative of the stall wing loading with respect to W/P.
+    The limit does not depend on W/P, so the derivative is zero, shaped like StallWingLoading.
+
+    Returns
+    -------
+    dW_S_dW_P : float or array of floats
+        Derivative of the wing loading limit with respect to power loading, always zero.
+
+    """
+    return _ZeroSlope(altitude, deltaT, Vs, CLmax, sigma)
+
+@it.Traced('performancesizing.fit_top')
+def FitTOP(filename=TOP_FILE):
+    """
+    Function to fit the quadratic takeoff parameter curve of every takeoff criteria in the digitized TOP chart.
+
+    Parameters
+    ----------
+    filename : str, optional
+        Path to the digitized TOP chart, with TOP in the first column and the distance of each criteria
+        in thousands of ft in the following columns. An Engauge .dig document such as TOP_DIG_FILE is read
+        directly, its curves in TOP_CRITERIA order.
+
+    Returns
+    -------
+    coefficients : array of floats
+        Quadratic coefficients (a, b, c) of TOP = a*distance**2 + b*distance + c, one row per criteria in
+        TOP_CRITERIA order, with distance in ft.
+
+    """
+    if filename.lower().endswith('.dig'):
+        import digparser as dp
+        curves = list(dp.LoadDig(filename).curves.values())
+        if len(curves) != len(TOP_CRITERIA):
+            raise ValueError(f'{filename} has {len(curves)} curves, expected one per criteria in TOP_CRITERIA.')
+        points = [(curve[:,1] * 1000, curve[:,0]) for curve in curves]
+    else:
+        TOP_data = np.genfromtxt(filename, delimiter=',', skip_header=1, invalid_raise=False)
+        TO_Parameter = TOP_data[:,0]
+        points = []
+        for i in range(len(TOP_CRITERIA)):
+            distance = TOP_data[:,i+1] * 1000
+            valid = ~np.isnan(distance)
+            points.append((distance[valid], TO_Parameter[valid]))
+
+    coefficients = np.empty((len(TOP_CRITERIA), 3))
+    for i, (distance, TO_Parameter) in enumerate(points):
+        # quadratic least squares fit, identical to curve_fit on a*y**2 + b*y + c
+        coefficients[i] = np.polyfit(distance, TO_Parameter, 2)
+    return coefficients
+
+def LoadTOPCoefficients(filename=TOP_FILE, cache=None):
+    """
+    Function to load the TOP curve fit coefficients into the module table used by TOP.
+    With a cache file the coefficients are persisted with the path, modification time and size of the chart they
+    were fitted from, and refitted when the cache was fitted from another chart or the chart has changed.
+
+    Parameters
+    ----------
+    filename : str, optional
+        Path to the digitized TOP chart.
+    cache : str, optional
+        Path to the .npz file holding the fitted coefficients, TOP_CACHE is the default location.
+
+    Returns
+    -------
+    coefficients : array of floats
+        Quadratic coefficients of every takeoff criteria in TOP_CRITERIA order.
+
     """
-    Function to calculate takeoff parameter based on takeoff criteria and distance from input.
+    global _TOP_COEFFICIENTS
+
+    status = os.stat(filename)
+    stamp = {'source': os.path.abspath(filename), 'mtime_ns': status.st_mtime_ns, 'size': status.st_size}
+    coefficients = None
+    if cache is not None and os.path.exists(cache):
+        try:
+            with np.load(cache, allow_pickle=False) as data:
+                if json.loads(str(data['stamp'])) == stamp:
+                    coefficients = data['coefficients']
+        except (OSError, ValueError, KeyError):
+            coefficients = None
+    if coefficients is not None:
+        it.Count('performancesizing.top_cache_hits')
+    else:
+        coefficients = FitTOP(filename)
+        if cache is not None:
+            np.savez(cache, criteria=np.array(TOP_CRITERIA), coefficients=coefficients,
+                     stamp=np.array(json.dumps(stamp)))
+
+    _TOP_COEFFICIENTS = coefficients
+    return coefficients
+
+def TOP(criteria, distance):
+    """
+    Function to calculate takeoff parameter based on takeoff criteria and distance.
+    The curve fits are made once per session, see LoadTOPCoefficients.
+
+    Parameters
+    ----------
+    criteria : str or array of str
+        Takeoff distance criteria, one of TOP_CRITERIA.
+    distance : float or array of floats
+        Takeoff distance or balanced field length in ft.
 
     Returns
     -------
-    float
+    TOP : float or array of floats
         Takeoff parameter.
 
     """
-    # Load TOP data
-    TOP_data = np.genfromtxt('TOP.csv', delimiter=',', skip_header=1, invalid_raise=False)
-
-    # Extract data
-    TO_Parameter = TOP_data[:,0]
-    TO_Dist_Prop_GroundRoll = TOP_data[:,1] * 1000
-    TO_Dist_Prop_50ft = TOP_data[:,2] * 1000
-    TO_Dist_Jet_GroundRoll = TOP_data[:,3] * 1000
-    TO_Dist_Jet_50ft = TOP_data[:,4] * 1000
-    TO_Dist_Jet_2eng_BFL = TOP_data[:,5] * 1000
-    TO_Dist_Jet_3eng_BFL = TOP_data[:,6] * 1000
-    TO_Dist_Jet_4eng_BFL = TOP_data[:,7] * 1000
-
-    print('\nTO_Dist_Prop_GroundRoll')
-    print('TO_Dist_Prop_50ft')
-    print('TO_Dist_Jet_GroundRoll')
-    print('TO_Dist_Jet_50ft')
-    print('TO_Dist_Jet_2eng_BFL')
-    print('TO_Dist_Jet_3eng_BFL')
-    print('TO_Dist_Jet_4eng_BFL')
-    criteria = input('\nCopy the takeoff criteria from the list above : ')
-    distance = float(input('\nEnter the desired takeoff distance or balanced field length in m : ')) * 3.28084
-
-    def valid_indices(criteria):
-        return np.nonzero(~np.isnan(criteria))
-
-    # Valid indices of this takeoff distance criteria
-    criteria_indices = valid_indices(locals()[criteria])
-
-    # Value of valid indices
-    x = TO_Parameter[criteria_indices]
-    y = locals()[criteria][criteria_indices]
-    
-    # Define TOP fitting function as quadratic
-    def func(y, a, b, c):
-        return a * y**2 + b * y + c
-    
-    # Fit curve to valid data
-    popt, pcov = curve_fit(func, y, x)
+    coefficients = _TOP_COEFFICIENTS if _TOP_COEFFICIENTS is not None else LoadTOPCoefficients()
 
-    # TOP value based on fitted function
-    TOP = popt[0] * distance**2 + popt[1] * distance + popt[2]
+    names, inverse = np.unique(np.asarray(criteria), return_inverse=True)
+    unknown = set(names) - set(TOP_CRITERIA)
+    if unknown:
+        raise ValueError(f'Unknown takeoff criteria {", ".join(sorted(unknown))}, expected one of TOP_CRITERIA.')
+
+    if isinstance(criteria, str):
+        a, b, c = coefficients[TOP_CRITERIA.index(criteria)]
+    else:
+        rows = np.array([TOP_CRITERIA.index(name) for name in names])[inverse.reshape(np.shape(criteria))]
+        a, b, c = np.moveaxis(coefficients[rows], -1, 0)
+
+    distance = np.asarray(distance, dtype=float)
+    TOP = a * distance**2 + b * distance + c
     return TOP
 
-def TakeoffWingLoading(TOP, altitude, deltaT, CLTO, W_S):
+def TakeoffWingLoading(TOP, altitude, deltaT, CLTO, W_S, sigma=None):
     """
     Function to calculate the required wing loading for takeoff for a given power loading.
 
@@ -137,6 +230,8 @@ def TakeoffWingLoading(TOP, altitude, deltaT, CLTO, W_S):
         Lift coefficient at takeoff, typically maximum wing lift coefficient divided by 1.21.
     W_S : float or array of floats
         Wing loading of the aircraft in lb/ft2.
+    sigma : float or array of floats, optional
+        Density ratio at the reference altitude, computed with AirDensity when not given.
 
     Returns
     -------
@@ -144,12 +239,34 @@ def TakeoffWingLoading(TOP, altitude, deltaT, CLTO, W_S):
         Power loading required for takeoff requirements in lb/hp.
 
     """
-    rho0, rho, sigma = AirDensity(altitude, deltaT)
+    if sigma is None:
+        rho0, rho, sigma = AirDensity(altitude, deltaT)
     
     W_P = TOP * sigma * CLTO * (1/W_S)
     return W_P
 
-def LandingWingLoading(Slanding, Sa, altitude, deltaT, CLmax):
+def TakeoffWingLoadingDerivative(TOP, altitude, deltaT, CLTO, W_S, sigma=None, W_P=None):
+    """
+    Function to calculate the derivative of the takeoff power loading with respect to wing loading.
+
+    Parameters
+    ----------
+    TOP, altitude, deltaT, CLTO, W_S, sigma :
+        As in TakeoffWingLoading.
+    W_P : float or array of floats, optional
+        Power loading already computed by TakeoffWingLoading at W_S, reused when given.
+
+    Returns
+    -------
+    dW_P_dW_S : float or array of floats
+        Derivative of the power loading limit with respect to wing loading in hp/ft2.
+
+    """
+    if W_P is None:
+        W_P = TakeoffWingLoading(TOP, altitude, deltaT, CLTO, W_S, sigma=sigma)
+    return -W_P / W_S
+
+def LandingWingLoading(Slanding, Sa, altitude, deltaT, CLmax, sigma=None):
     """
     Function to calculate wing loading required for a given landing and approach distance.
 
@@ -165,6 +282,8 @@ def LandingWingLoading(Slanding, Sa, altitude, deltaT, CLmax):
         Difference in sea level temperature from ISA standard of 15 degrees C.        
     CLmax : float
         Maximum lift coefficient of the wing.
+    sigma : float or array of floats, optional
+        Density ratio at the reference altitude, computed with AirDensity when not given.
 
     Returns
     -------
@@ -172,12 +291,26 @@ def LandingWingLoading(Slanding, Sa, altitude, deltaT, CLmax):
         Wing loading required for landing requirements in lb/ft2.
 
     """
-    rho0, rho, sigma = AirDensity(altitude, deltaT)
+    if sigma is None:
+        rho0, rho, sigma = AirDensity(altitude, deltaT)
     
     W_Slanding = (Slanding - Sa) * sigma * CLmax / 80
     return W_Slanding
 
-def CruiseWingLoadingOpt(altitude, Vcruise, AR, e, CD0):
+def LandingWingLoadingDerivative(Slanding, Sa, altitude, deltaT, CLmax, sigma=None):
+    """
+    Function to calculate the derivative of the landing wing loading with respect to W/P.
+    The limit does not depend on W/P, so the derivative is zero, shaped like LandingWingLoading.
+
+    Returns
+    -------
+    dW_S_dW_P : float or array of floats
+        Derivative of the wing loading limit with respect to power loading, always zero.
+
+    """
+    return _ZeroSlope(Slanding, Sa, altitude, deltaT, CLmax, sigma)
+
+def CruiseWingLoadingOpt(altitude, Vcruise, AR, e, CD0, sigma=None):
     """
     Function to calculate wing loading required to maximize cruise range in a given cruise speed.
 
@@ -195,6 +328,8 @@ def CruiseWingLoadingOpt(altitude, Vcruise, AR, e, CD0):
         Oswald span efficiency factor, approximately 0.6 to 0.8 for fighter, and 0.8 for other aircraft.
     CD0 : float
         Zero-lift drag coefficient, approximately 0.015 for jet, 0.02 for clean propeller, 0.03 for fixed gear propeller.
+    sigma : float or array of floats, optional
+        Density ratio at the reference altitude, computed with AirDensity when not given.
 
     Returns
     -------
@@ -202,14 +337,28 @@ def CruiseWingLoadingOpt(altitude, Vcruise, AR, e, CD0):
         Wing loading required to optimize for cruise requirements in lb/ft2.
 
     """
-    rho0, rho, sigma = AirDensity(altitude, 0)
-    rho = rho * 0.0019403203 # convert from kg/m3 to slug/ft3
+    if sigma is None:
+        rho0, rho, sigma = AirDensity(altitude, 0)
+    rho = sigma * 1.225 * 0.0019403203 # convert from kg/m3 to slug/ft3
     q = 0.5 * rho * Vcruise**2
     
     W_Scruise = q * (np.pi*AR*e*CD0)**0.5
     return W_Scruise
 
-def LoiterWingLoadingOpt(altitude, Vloiter, AR, e, CD0):
+def CruiseWingLoadingOptDerivative(altitude, Vcruise, AR, e, CD0, sigma=None):
+    """
+    Function to calculate the derivative of the best cruise wing loading with respect to W/P.
+    The limit does not depend on W/P, so the derivative is zero, shaped like CruiseWingLoadingOpt.
+
+    Returns
+    -------
+    dW_S_dW_P : float or array of floats
+        Derivative of the wing loading limit with respect to power loading, always zero.
+
+    """
+    return _ZeroSlope(altitude, Vcruise, AR, e, CD0, sigma)
+
+def LoiterWingLoadingOpt(altitude, Vloiter, AR, e, CD0, sigma=None):
     """
     Function to calculate wing loading required to optimize loiter/minimum power required in a given loiter speed.
     
@@ -227,6 +376,8 @@ def LoiterWingLoadingOpt(altitude, Vloiter, AR, e, CD0):
         Oswald span efficiency factor, approximately 0.6 to 0.8 for fighter, and 0.8 for other aircraft.
     CD0 : float
         Zero-lift drag coefficient, approximately 0.015 for jet, 0.02 for clean propeller, 0.03 for fixed gear propeller.
+    sigma : float or array of floats, optional
+        Density ratio at the reference altitude, computed with AirDensity when not given.
 
     Returns
     -------
@@ -234,14 +385,28 @@ def LoiterWingLoadingOpt(altitude, Vloiter, AR, e, CD0):
         Wing loading required to optimize for loiter requirements in lb/ft2.
 
     """
-    rho0, rho, sigma = AirDensity(altitude, 0)
-    rho = rho * 0.0019403203 # convert from kg/m3 to slug/ft3
+    if sigma is None:
+        rho0, rho, sigma = AirDensity(altitude, 0)
+    rho = sigma * 1.225 * 0.0019403203 # convert from kg/m3 to slug/ft3
     q = 0.5 * rho * Vloiter**2
     
     W_Sloiter = q * (3*np.pi*AR*e*CD0)**0.5
     return W_Sloiter
 
-def InstantTurnWingLoading(altitude, turnrate, Vcorner, CLmaxcombat):
+def LoiterWingLoadingOptDerivative(altitude, Vloiter, AR, e, CD0, sigma=None):
+    """
+    Function to calculate the derivative of the best loiter wing loading with respect to W/P.
+    The limit does not depend on W/P, so the derivative is zero, shaped like LoiterWingLoadingOpt.
+
+    Returns
+    -------
+    dW_S_dW_P : float or array of floats
+        Derivative of the wing loading limit with respect to power loading, always zero.
+
+    """
+    return _ZeroSlope(altitude, Vloiter, AR, e, CD0, sigma)
+
+def InstantTurnWingLoading(altitude, turnrate, Vcorner, CLmaxcombat, sigma=None):
     """
     Function to calculate wing loading to meet a given instant turn rate requirement at a given altitude and speed.
 
@@ -255,6 +420,8 @@ def InstantTurnWingLoading(altitude, turnrate, Vcorner, CLmaxcombat):
         Speed at which the maximum lift available exactly equals the allowable load factor.
     CLmaxcombat : float
         Maximum lift coefficient at combat conditions, about 0.6 - 0.8 for simple fighter, 1.0 - 1.5 for complex fighter.
+    sigma : float or array of floats, optional
+        Density ratio at the reference altitude, computed with AirDensity when not given.
 
     Returns
     -------
@@ -263,15 +430,29 @@ def InstantTurnWingLoading(altitude, turnrate, Vcorner, CLmaxcombat):
 
     """
     g = 32.15223 # ft/s2
-    rho0, rho, sigma = AirDensity(altitude, 0)
-    rho = rho * 0.0019403203 # convert from kg/m3 to slug/ft3
+    if sigma is None:
+        rho0, rho, sigma = AirDensity(altitude, 0)
+    rho = sigma * 1.225 * 0.0019403203 # convert from kg/m3 to slug/ft3
     q = 0.5 * rho * Vcorner**2
     n = ((turnrate*Vcorner/g)**2 + 1)**0.5
     
     W_Sinstantturn = q * CLmaxcombat / n
     return W_Sinstantturn
 
-def SustainedTurnWingLoading(altitude, Vturn, n, AR, e, CD0, W_P):
+def InstantTurnWingLoadingDerivative(altitude, turnrate, Vcorner, CLmaxcombat, sigma=None):
+    """
+    Function to calculate the derivative of the instant turn wing loading with respect to W/P.
+    The limit does not depend on W/P, so the derivative is zero, shaped like InstantTurnWingLoading.
+
+    Returns
+    -------
+    dW_S_dW_P : float or array of floats
+        Derivative of the wing loading limit with respect to power loading, always zero.
+
+    """
+    return _ZeroSlope(altitude, turnrate, Vcorner, CLmaxcombat, sigma)
+
+def SustainedTurnWingLoading(altitude, Vturn, n, AR, e, CD0, W_P, sigma=None):
     """
     Function to calculate wing loading related to sustained turn requirements for a given altitude, speed, and load factor.
 
@@ -291,6 +472,8 @@ def SustainedTurnWingLoading(altitude, Vturn, n, AR, e, CD0, W_P):
         Zero-lift drag coefficient, approximately 0.015 for jet, 0.02 for clean propeller, 0.03 for fixed gear propeller.
     W_P : float
         Power loading, in lb/hp.
+    sigma : float or array of floats, optional
+        Density ratio at the reference altitude, computed with AirDensity when not given.
 
     Returns
     -------
@@ -298,8 +481,9 @@ def SustainedTurnWingLoading(altitude, Vturn, n, AR, e, CD0, W_P):
         Wing loading required for sustained turn requirements in lb/ft2.
         
     """
-    rho0, rho, sigma = AirDensity(altitude, 0)
-    rho = rho * 0.0019403203 # convert from kg/m3 to slug/ft3
+    if sigma is None:
+        rho0, rho, sigma = AirDensity(altitude, 0)
+    rho = sigma * 1.225 * 0.0019403203 # convert from kg/m3 to slug/ft3
 
     q = 0.5 * rho * Vturn**2
     propeff = .8 # propeller efficiency assumed 0.8
@@ -308,7 +492,33 @@ def SustainedTurnWingLoading(altitude, Vturn, n, AR, e, CD0, W_P):
     W_Ssustainedturn = (T_W + (T_W**2 - (4*n**2*CD0/(np.pi*AR*e))**.5)/(2*n**2/(q*np.pi*AR*e)))
     return W_Ssustainedturn
 
-def ClimbWingLoading(G, Vclimb, AR, e, CD0, W_S):
+def SustainedTurnWingLoadingDerivative(altitude, Vturn, n, AR, e, CD0, W_P, sigma=None):
+    """
+    Function to calculate the derivative of the sustained turn wing loading with respect to power loading.
+
+    Parameters
+    ----------
+    altitude, Vturn, n, AR, e, CD0, W_P, sigma :
+        As in SustainedTurnWingLoading.
+
+    Returns
+    -------
+    dW_S_dW_P : float or array of floats
+        Derivative of the wing loading limit with respect to power loading in hp/ft2.
+
+    """
+    if sigma is None:
+        rho0, rho, sigma = AirDensity(altitude, 0)
+    rho = sigma * 1.225 * 0.0019403203 # convert from kg/m3 to slug/ft3
+
+    q = 0.5 * rho * Vturn**2
+    propeff = .8 # propeller efficiency assumed 0.8
+    T_W = 550 * propeff/Vturn * 1/W_P
+
+    dW_S_dT_W = 1 + T_W * q*np.pi*AR*e / n**2
+    return -dW_S_dT_W * T_W / W_P
+
+def ClimbWingLoading(G, Vclimb, AR, e, CD0, W_S, sigma=None):
     """
     Function to calculate wing loading required to satisfy climb gradient in a given horizontal speed.
 
@@ -326,6 +536,8 @@ def ClimbWingLoading(G, Vclimb, AR, e, CD0, W_S):
         Zero-lift drag coefficient, approximately 0.015 for jet, 0.02 for clean propeller, 0.03 for fixed gear propeller.
     W_S : float
         Wing loading, in lb/ft.
+    sigma : float or array of floats, optional
+        Density ratio of the climb condition, sea level when not given.
 
     Returns
     -------
@@ -333,8 +545,9 @@ def ClimbWingLoading(G, Vclimb, AR, e, CD0, W_S):
         Power loading required for climb requirements in lb/hp.
 
     """
-    rho0, rho, sigma = AirDensity(0, 0)
-    rho = rho * 0.0019403203 # convert from kg/m3 to slug/ft3
+    if sigma is None:
+        rho0, rho, sigma = AirDensity(0, 0)
+    rho = sigma * 1.225 * 0.0019403203 # convert from kg/m3 to slug/ft3
 
     q = 0.5 * rho * Vclimb**2
     propeff = .8 # propeller efficiency assumed 0.8
@@ -343,7 +556,37 @@ def ClimbWingLoading(G, Vclimb, AR, e, CD0, W_S):
     
     return W_P
 
-def CeilingWingLoading(altitude, Vceiling, AR, e, CD0, W_S):
+def ClimbWingLoadingDerivative(G, Vclimb, AR, e, CD0, W_S, sigma=None, W_P=None):
+    """
+    Function to calculate the derivative of the climb power loading with respect to wing loading.
+
+    Parameters
+    ----------
+    G, Vclimb, AR, e, CD0, W_S, sigma :
+        As in ClimbWingLoading.
+    W_P : float or array of floats, optional
+        Power loading already computed by ClimbWingLoading at W_S, reused when given.
+
+    Returns
+    -------
+    dW_P_dW_S : float or array of floats
+        Derivative of the power loading limit with respect to wing loading in hp/ft2.
+
+    """
+    if sigma is None:
+        rho0, rho, sigma = AirDensity(0, 0)
+    if W_P is None:
+        W_P = ClimbWingLoading(G, Vclimb, AR, e, CD0, W_S, sigma=sigma)
+    rho = sigma * 1.225 * 0.0019403203 # convert from kg/m3 to slug/ft3
+
+    q = 0.5 * rho * Vclimb**2
+    propeff = .8 # propeller efficiency assumed 0.8
+
+    # W_P = 550*propeff/(V*T_W), so dW_P/dT_W = -W_P**2*V/(550*propeff)
+    dT_W_dW_S = -(q*CD0/W_S**2) + 1/(q*np.pi*AR*e)
+    return -W_P**2 * Vclimb / (550 * propeff) * dT_W_dW_S
+
+def CeilingWingLoading(altitude, Vceiling, AR, e, CD0, W_S, sigma=None):
     """
     Function to calculate wing loading required to fly at a certain speed and maximum altitude.
 
@@ -361,6 +604,8 @@ def CeilingWingLoading(altitude, Vceiling, AR, e, CD0, W_S):
         Zero-lift drag coefficient, approximately 0.015 for jet, 0.02 for clean propeller, 0.03 for fixed gear propeller.
     W_S : float
         Wing loading, in lb/ft2.
+    sigma : float or array of floats, optional
+        Density ratio at the reference altitude, computed with AirDensity when not given.
 
     Returns
     -------
@@ -368,8 +613,9 @@ def CeilingWingLoading(altitude, Vceiling, AR, e, CD0, W_S):
         Power loading required for maximum ceiling requirements in lb/hp.
 
     """
-    rho0, rho, sigma = AirDensity(altitude, 0)
-    rho = rho * 0.0019403203 # convert from kg/m3 to slug/ft3
+    if sigma is None:
+        rho0, rho, sigma = AirDensity(altitude, 0)
+    rho = sigma * 1.225 * 0.0019403203 # convert from kg/m3 to slug/ft3
 
     q = 0.5 * rho * Vceiling**2
     propeff = .8 # propeller efficiency assumed 0.8
@@ -378,4 +624,34 @@ def CeilingWingLoading(altitude, Vceiling, AR, e, CD0, W_S):
     T_W = (q*CD0/W_S) + (W_S/(q*np.pi*AR*e)) + G
     W_P = 550 * propeff/Vceiling * 1/T_W
     
-    return W_P
\ No newline at end of file
+    return W_P
+
+def CeilingWingLoadingDerivative(altitude, Vceiling, AR, e, CD0, W_S, sigma=None, W_P=None):
+    """
+    Function to calculate the derivative of the service ceiling power loading with respect to wing loading.
+
+    Parameters
+    ----------
+    altitude, Vceiling, AR, e, CD0, W_S, sigma :
+        As in CeilingWingLoading.
+    W_P : float or array of floats, optional
+        Power loading already computed by CeilingWingLoading at W_S, reused when given.
+
+    Returns
+    -------
+    dW_P_dW_S : float or array of floats
+        Derivative of the power loading limit with respect to wing loading in hp/ft2.
+
+    """
+    if sigma is None:
+        rho0, rho, sigma = AirDensity(altitude, 0)
+    if W_P is None:
+        W_P = CeilingWingLoading(altitude, Vceiling, AR, e, CD0, W_S, sigma=sigma)
+    rho = sigma * 1.225 * 0.0019403203 # convert from kg/m3 to slug/ft3
+
+    q = 0.5 * rho * Vceiling**2
+    propeff = .8 # propeller efficiency assumed 0.8
+
+    # W_P = 550*propeff/(V*T_W), so dW_P/dT_W = -W_P**2*V/(550*propeff)
+    dT_W_dW_S = -(q*CD0/W_S**2) + 1/(q*np.pi*AR*e)
+    return -W_P**2 * Vceiling / (550 * propeff) * dT_W_dW_S
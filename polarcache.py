@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 17:05:51 2026
+
+Persistent content-addressed cache of airfoil polars, keyed by the geometry and analysis settings.
+@author: ardya
+"""
+
+import hashlib
+import json
+import os
+import threading
+import numpy as np
+
+POLAR_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'polar_cache')
+
+
+class PolarCache:
+    """
+    On-disk cache of polars, one file per geometry and analysis settings, holding every angle of attack computed
+    for it so far. Angles XFOIL did not converge are remembered too, so they are not retried.
+
+    The least recently used files are evicted once the cache grows past max_bytes.
+
+    Parameters
+    ----------
+    directory : str, optional
+        Cache directory, created when missing.
+    max_bytes : int, optional
+        Size limit of the cache directory.
+    decimals : int, optional
+        Number of decimals the coordinates are rounded to before hashing, so round-off noise does not miss.
+
+    """
+
+    def __init__(self, directory=POLAR_CACHE_DIR, max_bytes=256 * 2**20, decimals=8):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.decimals = decimals
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, job):
+        """Hash of the normalized geometry and every analysis setting of a PolarJob except the angles of attack."""
+        coordinates = np.round(np.asarray(job.coordinates, dtype=float), self.decimals) + 0.0
+        settings = {'reynolds': float(job.reynolds), 'mach': float(job.mach), 'n_crit': float(job.n_crit),
+                    'iteration': int(job.iteration), 'pane': bool(job.pane), 'norm': bool(job.norm)}
+        digest = hashlib.sha256(np.ascontiguousarray(coordinates).tobytes())
+        digest.update(str(coordinates.shape).encode())
+        digest.update(json.dumps(settings, sort_keys=True).encode())
+        return digest.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, f'{key}.npz')
+
+    def _read(self, path):
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                return data['polar'], data['failed']
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def get(self, job):
+        """
+        Function to look up the cached part of a polar job.
+
+        Parameters
+        ----------
+        job : PolarJob
+            Geometry and analysis settings.
+
+        Returns
+        -------
+        polar : structured array or None
+            Cached rows of the requested angles of attack, None when nothing is cached.
+        missing : array of floats
+            Requested angles of attack that still have to be computed.
+
+        """
+        alphas = np.round(np.asarray(job.alphas, dtype=float), 6)
+        path = self._path(self.key(job))
+        cached = self._read(path)
+        if cached is None:
+            self.misses += len(alphas)
+            return None, alphas
+
+        polar, failed = cached
+        known = np.isin(alphas, np.round(polar['alpha'], 6)) | np.isin(alphas, failed)
+        self.hits += int(known.sum())
+        self.misses += int((~known).sum())
+        try:
+            # mark as recently used
+            os.utime(path)
+        except OSError:
+            pass
+        return polar[np.isin(np.round(polar['alpha'], 6), alphas)], alphas[~known]
+
+    def put(self, job, polar, attempted=None):
+        """
+        Function to merge newly computed rows into the cached polar of a job.
+
+        Parameters
+        ----------
+        job : PolarJob
+            Geometry and analysis settings.
+        polar : structured array
+            Computed polar rows.
+        attempted : array of floats, optional
+            Angles of attack the run attempted, the ones missing from polar are remembered as not converging.
+
+        """
+        path = self._path(self.key(job))
+        with self._lock:
+            cached = self._read(path)
+            if cached is not None and cached[0].dtype == polar.dtype:
+                merged = np.concatenate([cached[0], polar])
+                failed = cached[1]
+            else:
+                merged = polar
+                failed = np.zeros(0)
+            alphas = np.round(merged['alpha'], 6)
+            alphas, unique = np.unique(alphas[::-1], return_index=True)
+            # latest row of each angle, sorted by angle
+            merged = merged[::-1][unique]
+            if attempted is not None:
+                attempted = np.round(np.asarray(attempted, dtype=float), 6)
+                failed = np.union1d(failed, attempted[~np.isin(attempted, alphas)])
+            failed = failed[~np.isin(failed, alphas)]
+
+            temporary = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+            with open(temporary, 'wb') as file:
+                np.savez(file, polar=merged, failed=failed)
+            os.replace(temporary, path)
+            self._evict()
+
+    def _evict(self):
+        entries = []
+        total = 0
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith('.npz'):
+                status = entry.stat()
+                entries.append((status.st_mtime, status.st_size, entry.path))
+                total += status.st_size
+        for mtime, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+    def clear(self):
+        """Remove every cached polar."""
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith('.npz'):
+                os.remove(entry.path)
@@ -0,0 +1,382 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 31 09:44:18 2026
+
+Columnar results store of sizing sweeps, for studies of tens of millions of rows. A store is a directory with one
+raw little-endian file per column and a schema.json holding the column types, the committed row count, the input
+parameters and metadata of the sweep. Chunks are appended column by column, strings such as the takeoff criteria
+or the active constraints are stored as categorical codes, and columns are read back as read-only memory maps,
+without copying, and filtered a chunk at a time.
+
+    store = ResultsStore('sweep', inputs={'Sa': 1000}, metadata={'study': 'regional jet'})
+    store.append({'W_S': W_S, 'W_P': W_P, 'active': active, 'W0': W0})
+    store.select(['W_S', 'W_P'], W0__lt=60000, active__contains='Landing')
+@author: ardya
+"""
+
+import json
+import os
+import time
+import numpy as np
+import instrumentation as it
+
+SCHEMA_FILE = 'schema.json'
+COLUMN_EXTENSION = '.col'
+
+# Rows of a column filtered at once, bounding the temporaries of a query
+QUERY_CHUNK = 2 ** 20
+
+# Distinct strings of a chunk matched one by one before the rest are sorted
+CATEGORY_SCAN = 16
+
+# Stored type of each NumPy kind, strings are categorical codes
+DTYPES = {'b': '|b1', 'i': '<i8', 'u': '<i8', 'f': '<f8', 'U': '<i4', 'S': '<i4'}
+
+# Conditions of mask, where and select, as column__operator=value
+OPERATORS = {'eq': np.equal, 'ne': np.not_equal, 'lt': np.less, 'le': np.less_equal,
+             'gt': np.greater, 'ge': np.greater_equal, 'in': np.isin}
+
+
+def _Array(values):
+    # numbers with None as NaN, or strings with None as ''
+    array = np.asarray(values)
+    if array.dtype == object:
+        if any(isinstance(value, str) for value in array.ravel()):
+            array = np.array(['' if value is None else value for value in array.ravel()], dtype=str)
+        else:
+            array = np.array([np.nan if value is None else value for value in array.ravel()], dtype=float)
+    return array
+
+
+def _Columns(chunk):
+    if isinstance(chunk, np.ndarray) and chunk.dtype.names:
+        columns = {name: chunk[name] for name in chunk.dtype.names}
+    elif isinstance(chunk, dict):
+        columns = chunk
+    else:
+        records = list(chunk)
+        if not records:
+            return {}, 0
+        columns = {name: [record[name] for record in records] for name in records[0]}
+    columns = {name: _Array(values) for name, values in columns.items()}
+    lengths = [len(values) for values in columns.values() if values.ndim == 1]
+    n = lengths[0] if lengths else 1
+    for name, values in columns.items():
+        if values.ndim > 1:
+            raise ValueError(f'Column {name} must be 1-D, not of shape {values.shape}.')
+        # scalars of a chunk hold for every row of it
+        columns[name] = np.broadcast_to(values, (n,))
+    return columns, n
+
+
+def _JSONValue(value):
+    if isinstance(value, dict):
+        return {str(key): _JSONValue(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return [_JSONValue(item) for item in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+class ResultsStore:
+    """
+    Appendable columnar store of sizing results on disk, opened for appending when it exists and created otherwise.
+
+    Parameters
+    ----------
+    path : str
+        Directory of the store.
+    inputs : dict, optional
+        Input parameters held fixed over the sweep, e.g. the requirement case or the mission, added to the stored
+        ones. Inputs varying per row are columns.
+    metadata : dict, optional
+        Description of the sweep, added to the stored metadata.
+
+    Attributes
+    ----------
+    inputs, metadata : dict
+        Stored input parameters and metadata, with the creation time in metadata['created'].
+
+    """
+
+    def __init__(self, path, inputs=None, metadata=None):
+        self.path = path
+        self._maps = {}
+        schema = os.path.join(path, SCHEMA_FILE)
+        if os.path.exists(schema):
+            with open(schema) as file:
+                self.schema = json.load(file)
+        else:
+            os.makedirs(path, exist_ok=True)
+            self.schema = {'rows': 0, 'columns': {}, 'inputs': {}, 'metadata': {'created': time.time()}}
+        if inputs or metadata:
+            self.schema['inputs'].update(_JSONValue(inputs or {}))
+            self.schema['metadata'].update(_JSONValue(metadata or {}))
+            self._Commit()
+
+    @property
+    def inputs(self):
+        return self.schema['inputs']
+
+    @property
+    def metadata(self):
+        return self.schema['metadata']
+
+    @property
+    def columns(self):
+        """Column names, in the order of the first chunk."""
+        return list(self.schema['columns'])
+
+    def categories(self, name):
+        """Category names of a categorical column, indexed by its codes."""
+        return self.schema['columns'][name].get('categories')
+
+    def __len__(self):
+        return self.schema['rows']
+
+    def __contains__(self, name):
+        return name in self.schema['columns']
+
+    def _File(self, name):
+        return os.path.join(self.path, name + COLUMN_EXTENSION)
+
+    def _Commit(self):
+        # the row count is only raised once the column data is on disk, a torn append is cut off on the next one
+        temporary = os.path.join(self.path, f'{SCHEMA_FILE}.{os.getpid()}.tmp')
+        with open(temporary, 'w') as file:
+            json.dump(self.schema, file, indent=1)
+        os.replace(temporary, os.path.join(self.path, SCHEMA_FILE))
+
+    def _Declare(self, columns):
+        for name, values in columns.items():
+            dtype = DTYPES.get(values.dtype.kind)
+            if dtype is None:
+                raise ValueError(f'Column {name} of type {values.dtype} cannot be stored.')
+            self.schema['columns'][name] = {'dtype': dtype}
+            if values.dtype.kind in 'US':
+                self.schema['columns'][name]['categories'] = []
+
+    def _Encode(self, name, values):
+        # codes of a categorical column go with a new category list, stored only once the whole chunk has encoded
+        column = self.schema['columns'][name]
+        if column.get('categories') is None:
+            if values.dtype.kind in 'US':
+                raise ValueError(f'Column {name} holds numbers, not strings.')
+            try:
+                return values.astype(column['dtype'], casting='same_kind'), None
+            except TypeError:
+                raise ValueError(f'Column {name} of type {column["dtype"]} cannot hold {values.dtype}.') from None
+        if values.dtype.kind not in 'US':
+            raise ValueError(f'Column {name} is categorical and only holds strings.')
+        categories = list(column['categories'])
+        codes = {category: code for code, category in enumerate(categories)}
+
+        def Code(category):
+            if category not in codes:
+                codes[category] = len(categories)
+                categories.append(category)
+            return codes[category]
+
+        # sweeps have a few categories, match them one at a time and sort only what is left after that
+        remaining = np.asarray(values, dtype=str)
+        rows = np.arange(len(remaining))
+        encoded = np.empty(len(remaining), dtype=column['dtype'])
+        for _ in range(CATEGORY_SCAN):
+            if not len(remaining):
+                return encoded, categories
+            same = remaining == remaining[0]
+            encoded[rows[same]] = Code(str(remaining[0]))
+            remaining, rows = remaining[~same], rows[~same]
+        names, inverse = np.unique(remaining, return_inverse=True)
+        encoded[rows] = np.array([Code(category) for category in names.tolist()], dtype=column['dtype'])[inverse]
+        return encoded, categories
+
+    def append(self, chunk):
+        """
+        Function to append a chunk of rows to the store.
+
+        Parameters
+        ----------
+        chunk : dict, structured array or list of dict
+            Column name to array of one value per row, scalars are repeated over the chunk, or a structured array
+            such as an XFOIL polar, or records such as the results of batchsizing.SolveCases. The first chunk sets
+            the columns and their types, later chunks must have the same columns.
+
+        Returns
+        -------
+        rows : int
+            Number of rows appended.
+
+        """
+        columns, n = _Columns(chunk)
+        if not columns or n == 0:
+            return 0
+        if not self.schema['columns']:
+            self._Declare(columns)
+        if set(columns) != set(self.schema['columns']):
+            raise ValueError(f'Chunk columns {", ".join(sorted(columns))} do not match the store columns '
+                             f'{", ".join(self.columns)}.')
+
+        with it.Span('resultsstore.append', rows=n):
+            encoded = {name: self._Encode(name, columns[name]) for name in self.columns}
+            for name, (values, categories) in encoded.items():
+                if categories is not None:
+                    self.schema['columns'][name]['categories'] = categories
+            rows = self.schema['rows']
+            for name, (values, categories) in encoded.items():
+                filename = self._File(name)
+                committed = rows * np.dtype(self.schema['columns'][name]['dtype']).itemsize
+                with open(filename, 'r+b' if os.path.exists(filename) else 'wb') as file:
+                    if file.seek(0, os.SEEK_END) != committed:
+                        file.truncate(committed)
+                        file.seek(committed)
+                    file.write(np.ascontiguousarray(values).tobytes())
+            self.schema['rows'] = rows + n
+            self._maps.clear()
+            self._Commit()
+        it.Count('resultsstore.rows', n)
+        return n
+
+    def extend(self, records, chunksize=65536):
+        """
+        Function to append a stream of records, e.g. results yielded as they finish, in chunks.
+
+        Parameters
+        ----------
+        records : iterable of dict
+            Rows as column name to value.
+        chunksize : int, optional
+            Rows buffered before a chunk is appended.
+
+        Returns
+        -------
+        rows : int
+            Number of rows appended.
+
+        """
+        rows = 0
+        chunk = []
+        for record in records:
+            chunk.append(record)
+            if len(chunk) == chunksize:
+                rows += self.append(chunk)
+                chunk = []
+        return rows + self.append(chunk)
+
+    def __getitem__(self, name):
+        """Read-only memory map of a column, the codes of a categorical one."""
+        if name not in self.schema['columns']:
+            raise KeyError(f'{name!r} is not a column of the store, expected one of: {", ".join(self.columns)}')
+        rows = self.schema['rows']
+        dtype = np.dtype(self.schema['columns'][name]['dtype'])
+        if rows == 0:
+            return np.empty(0, dtype=dtype)
+        if name not in self._maps:
+            self._maps[name] = np.memmap(self._File(name), dtype=dtype, mode='r', shape=(rows,))
+        return self._maps[name]
+
+    def decode(self, name, codes=None):
+        """Category names of the codes of a categorical column, of every row by default."""
+        codes = self[name] if codes is None else np.asarray(codes)
+        return np.array(self.categories(name), dtype=str)[codes]
+
+    def _Condition(self, key, value):
+        name, _, operator = key.partition('__')
+        operator = operator or 'eq'
+        if name not in self.schema['columns']:
+            raise KeyError(f'{name!r} is not a column of the store, expected one of: {", ".join(self.columns)}')
+        categories = self.categories(name)
+        if operator == 'contains':
+            if categories is None:
+                raise ValueError(f'contains only applies to categorical columns, not {name}.')
+            # active constraints are stored joined by '|', match any of the names
+            return name, np.isin, [code for code, category in enumerate(categories) if value in category.split('|')]
+        if operator not in OPERATORS:
+            raise ValueError(f'Unknown operator {operator}, expected one of: {", ".join(OPERATORS)}, contains.')
+        if categories is not None:
+            if operator not in ('eq', 'ne', 'in'):
+                raise ValueError(f'Categorical column {name} only compares with eq, ne, in and contains.')
+            codes = {category: code for code, category in enumerate(categories)}
+            # a category never stored matches no row
+            value = [codes.get(item, -1) for item in value] if operator == 'in' else codes.get(value, -1)
+        return name, OPERATORS[operator], value
+
+    def mask(self, **conditions):
+        """
+        Function to evaluate conditions on every row, a chunk of rows at a time.
+
+        Parameters
+        ----------
+        **conditions
+            column__operator=value, with the operators of OPERATORS, eq when omitted, and contains, whether the
+            '|' joined names of a categorical column include value. Categorical columns compare by name.
+
+        Returns
+        -------
+        mask : array of bools
+            Whether each row satisfies every condition.
+
+        """
+        parsed = [self._Condition(key, value) for key, value in conditions.items()]
+        mask = np.ones(len(self), dtype=bool)
+        with it.Span('resultsstore.query', rows=len(self), conditions=len(parsed)):
+            for start in range(0, len(self), QUERY_CHUNK):
+                stop = min(start + QUERY_CHUNK, len(self))
+                for name, operator, value in parsed:
+                    part = mask[start:stop]
+                    part &= operator(self[name][start:stop], value)
+        return mask
+
+    def where(self, **conditions):
+        """Indices of the rows satisfying the conditions, see mask."""
+        return np.flatnonzero(self.mask(**conditions))
+
+    def select(self, columns=None, **conditions):
+        """
+        Function to read the rows satisfying conditions.
+
+        Parameters
+        ----------
+        columns : list of str, optional
+            Columns to read, every column by default.
+        **conditions
+            Conditions of mask.
+
+        Returns
+        -------
+        selection : dict
+            Column name to array of the selected rows, category names for categorical columns.
+
+        """
+        rows = self.where(**conditions) if conditions else slice(None)
+        selection = {}
+        for name in self.columns if columns is None else columns:
+            values = np.asarray(self[name][rows])
+            selection[name] = self.decode(name, values) if self.categories(name) is not None else values
+        return selection
+
+    def __repr__(self):
+        return f'ResultsStore({self.path!r}, {len(self)} rows, columns: {", ".join(self.columns)})'
+
+
+def PolarColumns(result):
+    """
+    Function to convert the polar of an xfoilrunner.PolarResult into a store chunk, one row per angle of attack
+    with the airfoil name, Reynolds number, Mach number and n_crit of the job.
+
+    Parameters
+    ----------
+    result : PolarResult
+        Result of xfoilrunner.RunPolar.
+
+    Returns
+    -------
+    chunk : dict
+        Column name to array, for ResultsStore.append.
+
+    """
+    job = result.job
+    chunk = {'name': job.name, 'reynolds': float(job.reynolds), 'mach': float(job.mach), 'n_crit': float(job.n_crit)}
+    chunk.update({name: result.polar[name] for name in result.polar.dtype.names})
+    return chunk
@@ -0,0 +1,412 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Wed Oct 21 09:12:40 2026
+
+OpenMDAO components of the sizing chain with analytic partials. Every component is vectorized over num_nodes
+design points, each output only depends on the inputs of its own node, so all partials are diagonal.
+@author: ardya
+"""
+
+import numpy as np
+import openmdao.api as om
+import atmosphere as at
+import performancesizing as pf
+import weightestimation as we
+
+SLUG_FT3 = 1.225 * 0.0019403203 # sea level air density in slug/ft3
+PROPEFF = .8 # propeller efficiency assumed 0.8, as in performancesizing
+
+
+class _NodeComponent(om.ExplicitComponent):
+    """Explicit component with num_nodes independent design points."""
+
+    def initialize(self):
+        self.options.declare('num_nodes', default=1, types=int, desc='Number of design points.')
+
+    def _add_inputs(self, inputs):
+        nn = self.options['num_nodes']
+        for name, (value, units) in inputs.items():
+            self.add_input(name, val=value * np.ones(nn), units=units)
+
+    def _declare_diagonal(self, of, wrt):
+        nn = self.options['num_nodes']
+        self.declare_partials(of, wrt, rows=np.arange(nn), cols=np.arange(nn))
+
+
+class AtmosphereComp(_NodeComponent):
+    """
+    International Standard Atmosphere with a temperature offset, see atmosphere.ISA.
+
+    Inputs altitude in m and deltaT, the temperature offset from standard, outputs sigma and rho in kg/m3.
+    """
+
+    def setup(self):
+        self._add_inputs({'altitude': (0.0, 'm'), 'deltaT': (0.0, 'degK')})
+        nn = self.options['num_nodes']
+        self.add_output('sigma', val=np.ones(nn))
+        self.add_output('rho', val=at.RHO0 * np.ones(nn), units='kg/m**3')
+        for output in ('sigma', 'rho'):
+            self._declare_diagonal(output, ['altitude', 'deltaT'])
+
+    def compute(self, inputs, outputs):
+        state = at.ISA(inputs['altitude'], inputs['deltaT'])
+        outputs['sigma'] = state.sigma
+        outputs['rho'] = state.rho
+
+    def compute_partials(self, inputs, partials):
+        altitude = inputs['altitude']
+        T_standard, p = at.StandardConditions(altitude)
+        T = T_standard + inputs['deltaT']
+        sigma = p / (at.R * T) / at.RHO0
+        # hydrostatic pressure of the standard atmosphere over the temperature of the offset one
+        partials['sigma', 'altitude'] = sigma * (-at.G0 / (at.R * T_standard) - at.LAPSE_RATES[at.Layer(altitude)] / T)
+        partials['sigma', 'deltaT'] = -sigma / T
+        partials['rho', 'altitude'] = at.RHO0 * partials['sigma', 'altitude']
+        partials['rho', 'deltaT'] = at.RHO0 * partials['sigma', 'deltaT']
+
+
+class StallComp(_NodeComponent):
+    """Wing loading of a stall speed requirement, see performancesizing.StallWingLoading."""
+
+    def setup(self):
+        self._add_inputs({'sigma': (1.0, None), 'Vs': (100.0, 'ft/s'), 'CLmax': (1.5, None)})
+        self.add_output('W_S', val=np.ones(self.options['num_nodes']), units='lbf/ft**2')
+        self._declare_diagonal('W_S', ['sigma', 'Vs', 'CLmax'])
+
+    def compute(self, inputs, outputs):
+        outputs['W_S'] = pf.StallWingLoading(None, None, inputs['Vs'], inputs['CLmax'], sigma=inputs['sigma'])
+
+    def compute_partials(self, inputs, partials):
+        sigma, Vs, CLmax = inputs['sigma'], inputs['Vs'], inputs['CLmax']
+        partials['W_S', 'sigma'] = .5 * SLUG_FT3 * Vs**2 * CLmax
+        partials['W_S', 'Vs'] = SLUG_FT3 * sigma * Vs * CLmax
+        partials['W_S', 'CLmax'] = .5 * SLUG_FT3 * sigma * Vs**2
+
+
+class TakeoffComp(_NodeComponent):
+    """Power loading of a takeoff requirement, see performancesizing.TakeoffWingLoading."""
+
+    def setup(self):
+        self._add_inputs({'TOP': (200.0, None), 'sigma': (1.0, None), 'CLTO': (1.2, None),
+                          'W_S': (20.0, 'lbf/ft**2')})
+        self.add_output('W_P', val=np.ones(self.options['num_nodes']), units='lbf/hp')
+        self._declare_diagonal('W_P', ['TOP', 'sigma', 'CLTO', 'W_S'])
+
+    def compute(self, inputs, outputs):
+        outputs['W_P'] = pf.TakeoffWingLoading(inputs['TOP'], None, None, inputs['CLTO'], inputs['W_S'],
+                                               sigma=inputs['sigma'])
+
+    def compute_partials(self, inputs, partials):
+        TOP, sigma, CLTO, W_S = inputs['TOP'], inputs['sigma'], inputs['CLTO'], inputs['W_S']
+        partials['W_P', 'TOP'] = sigma * CLTO / W_S
+        partials['W_P', 'sigma'] = TOP * CLTO / W_S
+        partials['W_P', 'CLTO'] = TOP * sigma / W_S
+        partials['W_P', 'W_S'] = -TOP * sigma * CLTO / W_S**2
+
+
+class LandingComp(_NodeComponent):
+    """Wing loading of a landing distance requirement, see performancesizing.LandingWingLoading."""
+
+    def setup(self):
+        self._add_inputs({'Slanding': (3000.0, 'ft'), 'Sa': (1000.0, 'ft'), 'sigma': (1.0, None),
+                          'CLmax': (1.5, None)})
+        self.add_output('W_S', val=np.ones(self.options['num_nodes']), units='lbf/ft**2')
+        self._declare_diagonal('W_S', ['Slanding', 'Sa', 'sigma', 'CLmax'])
+
+    def compute(self, inputs, outputs):
+        outputs['W_S'] = pf.LandingWingLoading(inputs['Slanding'], inputs['Sa'], None, None, inputs['CLmax'],
+                                               sigma=inputs['sigma'])
+
+    def compute_partials(self, inputs, partials):
+        distance = inputs['Slanding'] - inputs['Sa']
+        sigma, CLmax = inputs['sigma'], inputs['CLmax']
+        partials['W_S', 'Slanding'] = sigma * CLmax / 80
+        partials['W_S', 'Sa'] = -sigma * CLmax / 80
+        partials['W_S', 'sigma'] = distance * CLmax / 80
+        partials['W_S', 'CLmax'] = distance * sigma / 80
+
+
+class CruiseComp(_NodeComponent):
+    """
+    Wing loading of best cruise range, see performancesizing.CruiseWingLoadingOpt.
+
+    The loiter option gives the wing loading of minimum power required, see performancesizing.LoiterWingLoadingOpt.
+    """
+
+    def initialize(self):
+        super().initialize()
+        self.options.declare('loiter', default=False, types=bool, desc='Size for loiter instead of cruise.')
+
+    def setup(self):
+        self._add_inputs({'sigma': (1.0, None), 'V': (200.0, 'ft/s'), 'AR': (8.0, None), 'e': (.8, None),
+                          'CD0': (.02, None)})
+        self.add_output('W_S', val=np.ones(self.options['num_nodes']), units='lbf/ft**2')
+        self._declare_diagonal('W_S', ['sigma', 'V', 'AR', 'e', 'CD0'])
+
+    def compute(self, inputs, outputs):
+        function = pf.LoiterWingLoadingOpt if self.options['loiter'] else pf.CruiseWingLoadingOpt
+        outputs['W_S'] = function(None, inputs['V'], inputs['AR'], inputs['e'], inputs['CD0'],
+                                  sigma=inputs['sigma'])
+
+    def compute_partials(self, inputs, partials):
+        sigma, V, AR, e, CD0 = (inputs[name] for name in ('sigma', 'V', 'AR', 'e', 'CD0'))
+        factor = 3 if self.options['loiter'] else 1
+        W_S = .5 * SLUG_FT3 * sigma * V**2 * (factor*np.pi*AR*e*CD0)**0.5
+        partials['W_S', 'sigma'] = W_S / sigma
+        partials['W_S', 'V'] = 2 * W_S / V
+        partials['W_S', 'AR'] = .5 * W_S / AR
+        partials['W_S', 'e'] = .5 * W_S / e
+        partials['W_S', 'CD0'] = .5 * W_S / CD0
+
+
+class InstantTurnComp(_NodeComponent):
+    """Wing loading of an instant turn rate requirement, see performancesizing.InstantTurnWingLoading."""
+
+    def setup(self):
+        self._add_inputs({'sigma': (1.0, None), 'turnrate': (.2, 'rad/s'), 'Vcorner': (300.0, 'ft/s'),
+                          'CLmaxcombat': (1.0, None)})
+        self.add_output('W_S', val=np.ones(self.options['num_nodes']), units='lbf/ft**2')
+        self._declare_diagonal('W_S', ['sigma', 'turnrate', 'Vcorner', 'CLmaxcombat'])
+
+    def compute(self, inputs, outputs):
+        outputs['W_S'] = pf.InstantTurnWingLoading(None, inputs['turnrate'], inputs['Vcorner'],
+                                                   inputs['CLmaxcombat'], sigma=inputs['sigma'])
+
+    def compute_partials(self, inputs, partials):
+        g = 32.15223 # ft/s2
+        sigma, turnrate, V, CLmax = (inputs[name] for name in ('sigma', 'turnrate', 'Vcorner', 'CLmaxcombat'))
+        q = .5 * SLUG_FT3 * sigma * V**2
+        n = ((turnrate*V/g)**2 + 1)**0.5
+        W_S = q * CLmax / n
+        # dn/dx of n = sqrt((turnrate*V/g)**2 + 1)
+        dn_dturnrate = turnrate * (V/g)**2 / n
+        dn_dV = V * (turnrate/g)**2 / n
+        partials['W_S', 'sigma'] = W_S / sigma
+        partials['W_S', 'turnrate'] = -W_S / n * dn_dturnrate
+        partials['W_S', 'Vcorner'] = 2 * W_S / V - W_S / n * dn_dV
+        partials['W_S', 'CLmaxcombat'] = q / n
+
+
+class SustainedTurnComp(_NodeComponent):
+    """Wing loading of a sustained turn requirement, see performancesizing.SustainedTurnWingLoading."""
+
+    def setup(self):
+        self._add_inputs({'sigma': (1.0, None), 'Vturn': (300.0, 'ft/s'), 'n': (3.0, None), 'AR': (8.0, None),
+                          'e': (.8, None), 'CD0': (.02, None), 'W_P': (10.0, 'lbf/hp')})
+        self.add_output('W_S', val=np.ones(self.options['num_nodes']), units='lbf/ft**2')
+        self._declare_diagonal('W_S', ['sigma', 'Vturn', 'n', 'AR', 'e', 'CD0', 'W_P'])
+
+    def compute(self, inputs, outputs):
+        outputs['W_S'] = pf.SustainedTurnWingLoading(None, inputs['Vturn'], inputs['n'], inputs['AR'], inputs['e'],
+                                                     inputs['CD0'], inputs['W_P'], sigma=inputs['sigma'])
+
+    def compute_partials(self, inputs, partials):
+        sigma, V, n, AR, e, CD0, W_P = (inputs[name] for name in ('sigma', 'Vturn', 'n', 'AR', 'e', 'CD0', 'W_P'))
+        K = np.pi * AR * e
+        q = .5 * SLUG_FT3 * sigma * V**2
+        T_W = 550 * PROPEFF / V / W_P
+        r = (4*n**2*CD0/K)**.5
+        u = T_W**2 - r
+        # W_S = T_W + u*q*K/(2*n**2), chained through q, T_W, r and K
+        dW_dT = 1 + T_W * q * K / n**2
+        dW_dr = -q * K / (2 * n**2)
+        dW_dq = u * K / (2 * n**2)
+        dW_dK = u * q / (2 * n**2) - dW_dr * r / (2 * K)
+        partials['W_S', 'sigma'] = dW_dq * q / sigma
+        partials['W_S', 'Vturn'] = dW_dq * 2 * q / V - dW_dT * T_W / V
+        partials['W_S', 'n'] = -u * q * K / n**3 + dW_dr * r / n
+        partials['W_S', 'AR'] = dW_dK * K / AR
+        partials['W_S', 'e'] = dW_dK * K / e
+        partials['W_S', 'CD0'] = dW_dr * r / (2 * CD0)
+        partials['W_S', 'W_P'] = -dW_dT * T_W / W_P
+
+
+class ClimbComp(_NodeComponent):
+    """
+    Power loading of a climb gradient requirement, see performancesizing.ClimbWingLoading.
+
+    The ceiling option replaces the G input by the 100 ft/min service ceiling climb rate, see
+    performancesizing.CeilingWingLoading.
+    """
+
+    def initialize(self):
+        super().initialize()
+        self.options.declare('ceiling', default=False, types=bool, desc='Size for the service ceiling.')
+
+    def setup(self):
+        inputs = {'sigma': (1.0, None), 'V': (200.0, 'ft/s'), 'AR': (8.0, None), 'e': (.8, None),
+                  'CD0': (.02, None), 'W_S': (20.0, 'lbf/ft**2')}
+        if not self.options['ceiling']:
+            inputs['G'] = (.05, None)
+        self._add_inputs(inputs)
+        self.add_output('W_P', val=np.ones(self.options['num_nodes']), units='lbf/hp')
+        self._declare_diagonal('W_P', list(inputs))
+
+    def compute(self, inputs, outputs):
+        V, AR, e, CD0, W_S = (inputs[name] for name in ('V', 'AR', 'e', 'CD0', 'W_S'))
+        if self.options['ceiling']:
+            outputs['W_P'] = pf.CeilingWingLoading(None, V, AR, e, CD0, W_S, sigma=inputs['sigma'])
+        else:
+            outputs['W_P'] = pf.ClimbWingLoading(inputs['G'], V, AR, e, CD0, W_S, sigma=inputs['sigma'])
+
+    def compute_partials(self, inputs, partials):
+        sigma, V, AR, e, CD0, W_S = (inputs[name] for name in ('sigma', 'V', 'AR', 'e', 'CD0', 'W_S'))
+        K = np.pi * AR * e
+        q = .5 * SLUG_FT3 * sigma * V**2
+        G = (100/60) / V if self.options['ceiling'] else inputs['G']
+        T_W = (q*CD0/W_S) + (W_S/(q*K)) + G
+        W_P = 550 * PROPEFF / V / T_W
+        # W_P = 550*propeff/(V*T_W), chained through T_W
+        dW_dT = -W_P / T_W
+        dT_dq = CD0 / W_S - W_S / (q**2 * K)
+        dT_dK = -W_S / (q * K**2)
+        dT_dV = dT_dq * 2 * q / V
+        if self.options['ceiling']:
+            dT_dV = dT_dV - G / V
+        else:
+            partials['W_P', 'G'] = dW_dT
+        partials['W_P', 'sigma'] = dW_dT * dT_dq * q / sigma
+        partials['W_P', 'V'] = -W_P / V + dW_dT * dT_dV
+        partials['W_P', 'AR'] = dW_dT * dT_dK * K / AR
+        partials['W_P', 'e'] = dW_dT * dT_dK * K / e
+        partials['W_P', 'CD0'] = dW_dT * q / W_S
+        partials['W_P', 'W_S'] = dW_dT * (-q * CD0 / W_S**2 + 1 / (q * K))
+
+
+class BreguetComp(_NodeComponent):
+    """
+    Weight fraction of a cruise segment from the Breguet range equation, see missionprofile.Cruise.
+
+    The loiter option gives the Breguet endurance equation with the endurance E in s, see missionprofile.Loiter.
+    """
+
+    def initialize(self):
+        super().initialize()
+        self.options.declare('loiter', default=False, types=bool, desc='Loiter segment instead of cruise.')
+
+    def setup(self):
+        if self.options['loiter']:
+            inputs = {'E': (3600.0, 's'), 'C': (1e-4, '1/s'), 'L_D': (12.0, None)}
+        else:
+            inputs = {'R': (1e6, 'ft'), 'C': (1e-4, '1/s'), 'L_D': (12.0, None), 'V': (200.0, 'ft/s')}
+        self._add_inputs(inputs)
+        self.add_output('fraction', val=np.ones(self.options['num_nodes']))
+        self._declare_diagonal('fraction', list(inputs))
+
+    def _exponent(self, inputs):
+        if self.options['loiter']:
+            return -inputs['E'] * inputs['C'] / inputs['L_D']
+        return -inputs['R'] * inputs['C'] / (inputs['V'] * inputs['L_D'])
+
+    def compute(self, inputs, outputs):
+        outputs['fraction'] = np.exp(self._exponent(inputs))
+
+    def compute_partials(self, inputs, partials):
+        exponent = self._exponent(inputs)
+        fraction = np.exp(exponent)
+        # the exponent is a product of powers, d(exponent)/dx = exponent * power / x
+        powers = {'E': 1, 'R': 1, 'C': 1, 'L_D': -1, 'V': -1}
+        for name in inputs:
+            partials['fraction', name] = fraction * exponent * powers[name] / inputs[name]
+
+
+class FuelFractionComp(_NodeComponent):
+    """
+    Total fuel fraction of a mission from the weight fraction of every segment, see
+    missionprofile.MissionFuelFraction.
+    """
+
+    def initialize(self):
+        super().initialize()
+        self.options.declare('segments', types=(list, tuple), desc='Names of the segment fraction inputs.')
+        self.options.declare('reserve', default=0.0, desc='Reserve and trapped fuel allowance.')
+
+    def setup(self):
+        self._add_inputs({name: (1.0, None) for name in self.options['segments']})
+        self.add_output('fuel_fraction', val=np.zeros(self.options['num_nodes']))
+        self._declare_diagonal('fuel_fraction', list(self.options['segments']))
+
+    def compute(self, inputs, outputs):
+        product = np.prod([inputs[name] for name in self.options['segments']], axis=0)
+        outputs['fuel_fraction'] = (1 + self.options['reserve']) * (1 - product)
+
+    def compute_partials(self, inputs, partials):
+        segments = self.options['segments']
+        for name in segments:
+            others = np.prod([inputs[other] for other in segments if other != name], axis=0)
+            partials['fuel_fraction', name] = -(1 + self.options['reserve']) * others
+
+
+class EmptyWeightFractionComp(_NodeComponent):
+    """
+    Empty weight fraction We/W0 = A*W0**C*Kvs of Raymer's historical trend, see
+    weightestimation.EmptyWeightFraction. A, C and Kvs are options taken from the SizingData tables.
+    """
+
+    def initialize(self):
+        super().initialize()
+        self.options.declare('A', desc='Empty weight fraction trend coefficient A.')
+        self.options.declare('C', desc='Empty weight fraction trend exponent C.')
+        self.options.declare('Kvs', default=1.0, desc='Variable sweep constant, 1.04 for variable sweep.')
+
+    def setup(self):
+        self._add_inputs({'W0': (10000.0, 'lbf')})
+        self.add_output('We_W0', val=.5 * np.ones(self.options['num_nodes']))
+        self._declare_diagonal('We_W0', 'W0')
+
+    def compute(self, inputs, outputs):
+        outputs['We_W0'] = we.EmptyWeightFraction(inputs['W0'], self.options['A'], self.options['C'],
+                                                  self.options['Kvs'])
+
+    def compute_partials(self, inputs, partials):
+        W0 = inputs['W0']
+        partials['We_W0', 'W0'] = self.options['C'] * we.EmptyWeightFraction(W0, self.options['A'],
+                                                                               self.options['C'],
+                                                                               self.options['Kvs']) / W0
+
+
+class TakeoffWeightComp(_NodeComponent):
+    """
+    Takeoff weight W0 = (W_crew + W_payload)/(1 - Wf/W0 - We/W0), closed into a cycle with
+    EmptyWeightFractionComp by TakeoffWeightGroup.
+    """
+
+    def setup(self):
+        self._add_inputs({'W_crew': (0.0, 'lbf'), 'W_payload': (0.0, 'lbf'), 'fuel_fraction': (0.0, None),
+                          'We_W0': (0.5, None)})
+        self.add_output('W0', val=10000.0 * np.ones(self.options['num_nodes']), units='lbf')
+        self._declare_diagonal('W0', ['W_crew', 'W_payload', 'fuel_fraction', 'We_W0'])
+
+    def compute(self, inputs, outputs):
+        outputs['W0'] = (inputs['W_crew'] + inputs['W_payload']) / (1 - inputs['fuel_fraction'] - inputs['We_W0'])
+
+    def compute_partials(self, inputs, partials):
+        denominator = 1 - inputs['fuel_fraction'] - inputs['We_W0']
+        W0 = (inputs['W_crew'] + inputs['W_payload']) / denominator
+        partials['W0', 'W_crew'] = 1 / denominator
+        partials['W0', 'W_payload'] = 1 / denominator
+        partials['W0', 'fuel_fraction'] = W0 / denominator
+        partials['W0', 'We_W0'] = W0 / denominator
+
+
+class TakeoffWeightGroup(om.Group):
+    """
+    Takeoff weight of num_nodes designs, the fixed point of EmptyWeightFractionComp and TakeoffWeightComp solved
+    with Newton's method. Promotes W_crew, W_payload, fuel_fraction, We_W0 and W0.
+    """
+
+    def initialize(self):
+        self.options.declare('num_nodes', default=1, types=int, desc='Number of design points.')
+        self.options.declare('A', desc='Empty weight fraction trend coefficient A.')
+        self.options.declare('C', desc='Empty weight fraction trend exponent C.')
+        self.options.declare('Kvs', default=1.0, desc='Variable sweep constant, 1.04 for variable sweep.')
+
+    def setup(self):
+        nn = self.options['num_nodes']
+        self.add_subsystem('empty_weight', EmptyWeightFractionComp(num_nodes=nn, A=self.options['A'],
+                                                                   C=self.options['C'], Kvs=self.options['Kvs']),
+                           promotes=['*'])
+        self.add_subsystem('takeoff_weight', TakeoffWeightComp(num_nodes=nn), promotes=['*'])
+        self.nonlinear_solver = om.NewtonSolver(solve_subsystems=True, iprint=0, maxiter=50, atol=1e-8,
+                                                rtol=1e-12)
+        self.linear_solver = om.DirectSolver()
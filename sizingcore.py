@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 26 08:40:17 2026
+
+Headless compute layer of the sizing chain, for short sizing processes fanned out by the thousand. Importing it
+imports none of the sizing modules, every name below is imported from its module on first use (PEP 562), and none
+of them pulls in matplotlib, SciPy, pandas, PIL or OpenMDAO at import. Those load inside the functions that need
+them, SciPy for SolveMatchingChartSLSQP and pandas when the SizingData cache is rebuilt.
+
+    import sizingcore as sc
+    W0, We, diverged = sc.SolveTakeoffWeight(400, 2000, 0.2, 1.02, -0.06)
+@author: ardya
+"""
+
+import importlib
+
+# Module of each name of the compute layer
+_MODULES = {
+    'atmosphere': ('ISA', 'AtmosphereState', 'MIN_ALTITUDE', 'MAX_ALTITUDE'),
+    'performancesizing': ('AirDensity', 'TOP', 'TOP_CRITERIA', 'LoadTOPCoefficients', 'FitTOP',
+                          'StallWingLoading', 'TakeoffWingLoading', 'LandingWingLoading', 'CruiseWingLoadingOpt',
+                          'LoiterWingLoadingOpt', 'InstantTurnWingLoading', 'SustainedTurnWingLoading',
+                          'ClimbWingLoading', 'CeilingWingLoading',
+                          'StallWingLoadingDerivative', 'TakeoffWingLoadingDerivative',
+                          'LandingWingLoadingDerivative', 'CruiseWingLoadingOptDerivative',
+                          'LoiterWingLoadingOptDerivative', 'InstantTurnWingLoadingDerivative',
+                          'SustainedTurnWingLoadingDerivative', 'ClimbWingLoadingDerivative',
+                          'CeilingWingLoadingDerivative'),
+    'matchingchart': ('BOUNDS', 'MatchingChartSolution', 'MatchingChartConstraints', 'SolveMatchingChart',
+                      'MatchingChartConstraintSet', 'SolveMatchingChartSLSQP'),
+    'weightestimation': ('EmptyWeightFraction', 'SolveTakeoffWeight'),
+    'missionprofile': ('Segment', 'Takeoff', 'Climb', 'Cruise', 'Loiter', 'Land', 'SEGMENTS',
+                       'MissionFuelFraction', 'MissionPayload'),
+    'sizingdata': ('LoadSizingData', 'SizingTable'),
+    'maxlift': ('LoadCLmax', 'CLmaxSurface'),
+    'designsweep': ('DesignSpaceSweep', 'SweepResult'),
+    'montecarlo': ('MonteCarlo', 'SizingChain', 'RunningStats', 'Normal', 'Uniform', 'Triangular', 'LogNormal'),
+}
+_EXPORTS = {name: module for module, names in _MODULES.items() for name in names}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(importlib.import_module(module), name)
+    # later lookups find the name directly, without coming back here
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 10:12:20 2026
+
+Cached access to the lookup tables in SizingData.xlsx.
+The workbook is converted once into a binary .npz cache that is rebuilt when the workbook changes.
+@author: ardya
+"""
+
+import hashlib
+import json
+import os
+import numpy as np
+import instrumentation as it
+
+SIZING_DATA_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'SizingData.xlsx')
+
+# Loaded tables of each workbook in this session, with the source stamp they were read at
+_LOADED = {}
+
+
+class SizingTable:
+    """
+    Lookup table of one workbook sheet, rows indexed by name (engine, configuration or aircraft type) and columns
+    by coefficient name.
+
+    Attributes
+    ----------
+    name : str
+        Sheet name.
+    index : tuple of str
+        Row names.
+    columns : tuple of str
+        Column names.
+    values : array of floats
+        Table values of shape (len(index), len(columns)).
+
+    """
+
+    def __init__(self, name, index, columns, values):
+        self.name = name
+        self.index = tuple(index)
+        self.columns = tuple(columns)
+        self.values = values
+        self._rows = {row: i for i, row in enumerate(self.index)}
+        self._columns = {column: j for j, column in enumerate(self.columns)}
+
+    def row(self, name):
+        """Position of a row name, raising KeyError with the valid names when it is unknown."""
+        try:
+            return self._rows[name]
+        except KeyError:
+            raise KeyError(f'{name!r} is not in {self.name}, expected one of: {", ".join(self.index)}') from None
+
+    def __getitem__(self, key):
+        """Value of table[row, column], or the whole column array for table[column]."""
+        if isinstance(key, tuple):
+            row, column = key
+            return self.values[self.row(row), self._columns[column]]
+        return self.values[:, self._columns[key]]
+
+    def lookup(self, rows, column):
+        """
+        Function to look up a column for an array of row names.
+
+        Parameters
+        ----------
+        rows : str or array of str
+            Row names.
+        column : str
+            Column name.
+
+        Returns
+        -------
+        float or array of floats
+            Values with the shape of rows.
+
+        """
+        if isinstance(rows, str):
+            return self[rows, column]
+        names, inverse = np.unique(np.asarray(rows), return_inverse=True)
+        positions = np.array([self.row(name) for name in names], dtype=int)
+        return self.values[positions, self._columns[column]][inverse.reshape(np.shape(rows))]
+
+    def __repr__(self):
+        return f'SizingTable({self.name!r}, {len(self.index)} rows, columns: {", ".join(self.columns)})'
+
+
+def _FileHash(filename):
+    digest = hashlib.sha256()
+    with open(filename, 'rb') as file:
+        for block in iter(lambda: file.read(1 << 16), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+@it.Traced('sizingdata.read_workbook')
+def _ReadWorkbook(filename):
+    # the only place the workbook is parsed, pandas and openpyxl are only needed to rebuild the cache
+    import pandas as pd
+
+    tables = {}
+    for name, frame in pd.read_excel(filename, sheet_name=None, header=0, index_col=0).items():
+        tables[name] = SizingTable(name, [str(row) for row in frame.index], [str(column) for column in frame.columns],
+                                   frame.to_numpy(dtype=float))
+    return tables
+
+
+def _WriteCache(cache, tables, stamp):
+    arrays = {'__stamp__': np.array(json.dumps(stamp)), '__sheets__': np.array(list(tables))}
+    for name, table in tables.items():
+        arrays[f'{name}.index'] = np.array(table.index)
+        arrays[f'{name}.columns'] = np.array(table.columns)
+        arrays[f'{name}.values'] = table.values
+    # write beside and rename so a concurrent reader never sees a partial cache
+    temporary = f'{cache}.{os.getpid()}.tmp'
+    with open(temporary, 'wb') as file:
+        np.savez(file, **arrays)
+    os.replace(temporary, cache)
+
+
+def _ReadCache(cache):
+    with np.load(cache, allow_pickle=False) as data:
+        stamp = json.loads(str(data['__stamp__']))
+        tables = {str(name): SizingTable(str(name), data[f'{name}.index'].tolist(), data[f'{name}.columns'].tolist(),
+                                         data[f'{name}.values'])
+                  for name in data['__sheets__']}
+    return tables, stamp
+
+
+def LoadSizingData(filename=SIZING_DATA_FILE, cache=None):
+    """
+    Function to load every sheet of the sizing data workbook as a SizingTable.
+
+    The first call converts the workbook into a binary cache beside it. Later calls read the cache as long as the
+    workbook modification time and size are unchanged, or its SHA-256 hash still matches after a touch, and within
+    one session the tables are returned from memory.
+
+    Parameters
+    ----------
+    filename : str, optional
+        Path to the workbook.
+    cache : str, optional
+        Path to the .npz cache, the workbook path with an .npz extension by default.
+
+    Returns
+    -------
+    tables : dict
+        Sheet name to SizingTable, e.g. tables['EmptyWeightFraction']['Jet transport', 'A'].
+
+    """
+    filename = os.path.abspath(filename)
+    if cache is None:
+        cache = os.path.splitext(filename)[0] + '.npz'
+    status = os.stat(filename)
+    stamp = {'mtime_ns': status.st_mtime_ns, 'size': status.st_size}
+
+    loaded = _LOADED.get(filename)
+    if loaded is not None and loaded[1]['mtime_ns'] == stamp['mtime_ns'] and loaded[1]['size'] == stamp['size']:
+        it.Count('sizingdata.memory_hits')
+        return loaded[0]
+
+    tables = None
+    if os.path.exists(cache):
+        try:
+            with it.Span('sizingdata.read_cache'):
+                tables, cached = _ReadCache(cache)
+        except (OSError, ValueError, KeyError):
+            tables = None
+    if tables is not None and (cached['mtime_ns'], cached['size']) != (stamp['mtime_ns'], stamp['size']):
+        stamp['sha256'] = _FileHash(filename)
+        if cached.get('sha256') == stamp['sha256']:
+            # only touched, record the new modification time
+            _WriteCache(cache, tables, stamp)
+        else:
+            tables = None
+    elif tables is not None:
+        stamp = cached
+
+    if tables is None:
+        stamp['sha256'] = _FileHash(filename)
+        tables = _ReadWorkbook(filename)
+        _WriteCache(cache, tables, stamp)
+    else:
+        it.Count('sizingdata.cache_hits')
+
+    _LOADED[filename] = (tables, stamp)
+    return tables
@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Wed Oct 28 09:33:05 2026
+
+Reactive sizing model, the inputs, intermediates and outputs of the sizing chain as a dependency graph of memoized
+nodes. Changing an input only invalidates the nodes downstream of it, and they are recomputed when next read, so
+what-if questions do not rerun the whole chain.
+@author: ardya
+"""
+
+import numpy as np
+import performancesizing as pf
+import matchingchart as mc
+import missionprofile as mp
+import weightestimation as we
+import montecarlo as mcs
+
+
+def _Same(old, new):
+    # whether setting an input changes nothing downstream, NaN as in the Vs default equals itself
+    if type(old) is not type(new):
+        return False
+    try:
+        return bool(np.array_equal(old, new, equal_nan=True))
+    except (TypeError, ValueError):
+        # equal_nan needs numbers, strings such as engine compare without it
+        try:
+            return bool(np.array_equal(old, new))
+        except (TypeError, ValueError):
+            return old is new
+
+
+class SizingGraph:
+    """
+    Dependency graph of memoized nodes. Inputs are set, other nodes are functions of the nodes named by their
+    parameters, evaluated on first read and kept until an input upstream changes.
+
+        graph = SizingGraph()
+        graph.input('CLmax', 2.0)
+        graph.define('CLTO', lambda CLmax: CLmax / 1.21)
+        graph['CLTO']
+
+    Attributes
+    ----------
+    evaluations : dict
+        Node name to the number of times it was computed.
+
+    """
+
+    def __init__(self):
+        self._functions = {}
+        self._dependencies = {}
+        self._dependents = {}
+        self._values = {}
+        self.evaluations = {}
+
+    def input(self, name, value=None):
+        """Declare an input node, with its value when given."""
+        self._Declare(name, None, ())
+        if value is not None:
+            self[name] = value
+
+    def define(self, name, function, dependencies=None):
+        """
+        Function to declare a computed node.
+
+        Parameters
+        ----------
+        name : str
+            Node name.
+        function : callable
+            Function of the dependency values, in the order of dependencies.
+        dependencies : sequence of str, optional
+            Nodes the function reads, the names of its parameters by default.
+
+        """
+        if dependencies is None:
+            code = function.__code__
+            dependencies = code.co_varnames[:code.co_argcount]
+        unknown = [dependency for dependency in dependencies if dependency not in self._functions]
+        if unknown:
+            raise KeyError(f'Node {name} depends on undeclared nodes: {", ".join(unknown)}')
+        self._Declare(name, function, tuple(dependencies))
+
+    def _Declare(self, name, function, dependencies):
+        if name in self._functions:
+            # redefining a node invalidates what was computed from it
+            self._Invalidate(name)
+            for dependency in self._dependencies[name]:
+                self._dependents[dependency].discard(name)
+        self._functions[name] = function
+        self._dependencies[name] = dependencies
+        self._dependents.setdefault(name, set())
+        for dependency in dependencies:
+            self._dependents[dependency].add(name)
+
+    @property
+    def inputs(self):
+        """Names of the input nodes."""
+        return [name for name, function in self._functions.items() if function is None]
+
+    @property
+    def nodes(self):
+        """Names of every node, in declaration order."""
+        return list(self._functions)
+
+    def dependencies(self, name):
+        """Names of the nodes a node is computed from."""
+        return self._dependencies[name]
+
+    def downstream(self, name):
+        """Names of every node computed from a node, directly or not."""
+        found = []
+        pending = list(self._dependents[name])
+        while pending:
+            node = pending.pop()
+            if node not in found:
+                found.append(node)
+                pending.extend(self._dependents[node])
+        return found
+
+    def cached(self, name):
+        """Whether a node holds a value that is still valid."""
+        return name in self._values
+
+    def __contains__(self, name):
+        return name in self._functions
+
+    def __getitem__(self, name):
+        if name in self._values:
+            return self._values[name]
+        if name not in self._functions:
+            raise KeyError(f'{name!r} is not a node of the sizing graph.')
+        function = self._functions[name]
+        if function is None:
+            raise KeyError(f'Input {name!r} is not set.')
+        value = function(*[self[dependency] for dependency in self._dependencies[name]])
+        self._values[name] = value
+        self.evaluations[name] = self.evaluations.get(name, 0) + 1
+        return value
+
+    def __setitem__(self, name, value):
+        if self._functions.get(name, 0) is not None:
+            raise KeyError(f'{name!r} is not an input of the sizing graph.')
+        if name in self._values and _Same(self._values[name], value):
+            return
+        self._Invalidate(name)
+        self._values[name] = value
+
+    def update(self, **inputs):
+        """Set several inputs at once."""
+        for name, value in inputs.items():
+            self[name] = value
+
+    def _Invalidate(self, name):
+        self._values.pop(name, None)
+        for node in self.downstream(name):
+            self._values.pop(node, None)
+
+    def __repr__(self):
+        return f'SizingGraph({len(self._functions)} nodes, {len(self._values)} cached)'
+
+
+def SizingModel(**inputs):
+    """
+    Function to build the sizing chain as a SizingGraph, from the atmosphere through the matching chart design
+    point and the mission fuel fractions to the takeoff weight.
+
+    Parameters
+    ----------
+    **inputs
+        Values of the montecarlo.INPUTS names, with criteria and TOdistance in ft giving the takeoff parameter. The
+        defaults of INPUTS apply, the other inputs have to be set before the outputs depending on them are read.
+
+    Returns
+    -------
+    SizingGraph
+        With the intermediates sigma, sigma_ceiling, CLTO, TOP, the stall and landing W/S limits, the takeoff and
+        ceiling W/P curves, L/D, fuel_fraction and We_W0, and the outputs design, W_S, W_P, W0, We and diverged.
+
+    """
+    graph = SizingGraph()
+    for name, value in mcs.INPUTS.items():
+        if name != 'TOP':
+            graph.input(name, value)
+    graph.input('criteria')
+    graph.input('TOdistance')
+
+    # atmosphere and takeoff parameter
+    graph.define('sigma', lambda altitude, deltaT: pf.AirDensity(altitude, deltaT)[2])
+    graph.define('sigma_ceiling', lambda ceiling: pf.AirDensity(ceiling, 0)[2])
+    graph.define('CLTO', lambda CLmax: CLmax / 1.21)
+    graph.define('TOP', lambda criteria, TOdistance: pf.TOP(criteria, TOdistance))
+
+    # matching chart constraints and design point
+    def stall_limit(altitude, deltaT, Vs, CLmax, sigma):
+        # a missing stall requirement never limits the wing loading
+        return np.inf if np.isnan(Vs) else pf.StallWingLoading(altitude, deltaT, Vs, CLmax, sigma=sigma)
+
+    graph.define('stall_limit', stall_limit)
+    graph.define('landing_limit', lambda Slanding, Sa, altitude, deltaT, CLmax, sigma:
+                 pf.LandingWingLoading(Slanding, Sa, altitude, deltaT, CLmax, sigma=sigma))
+    graph.define('takeoff_curve', lambda TOP, CLTO, sigma:
+                 lambda W_S: pf.TakeoffWingLoading(TOP, None, None, CLTO, W_S, sigma=sigma))
+    graph.define('ceiling_curve', lambda Vcruise, AR, e, CD0, sigma_ceiling:
+                 lambda W_S: pf.CeilingWingLoading(None, Vcruise, AR, e, CD0, W_S, sigma=sigma_ceiling))
+    graph.define('design', lambda stall_limit, landing_limit, takeoff_curve, ceiling_curve:
+                 mc.SolveMatchingChart({'Stall': stall_limit, 'Landing': landing_limit},
+                                       {'Takeoff': takeoff_curve, 'Ceiling': ceiling_curve}))
+    graph.define('W_S', lambda design: design.W_S[0])
+    graph.define('W_P', lambda design: design.W_P[0])
+
+    # mission fuel fractions
+    graph.define('L_D', lambda K_LD, AR, WettedAreaRatio, engine: mp.LiftToDrag(K_LD, AR, WettedAreaRatio, engine))
+    graph.define('L_D_max', lambda L_D: L_D[0])
+    graph.define('L_D_cruise', lambda L_D: L_D[1])
+    graph.define('L_D_loiter', lambda L_D: L_D[2])
+    graph.define('fuel_fraction', lambda R, C_cruise, L_D_cruise, Vcruise, E, C_loiter, L_D_loiter, reserve:
+                 mp.MissionFuelFraction(mp.SizingMission(R, C_cruise, L_D_cruise, Vcruise, E, C_loiter, L_D_loiter),
+                                        reserve))
+
+    # takeoff weight convergence
+    graph.define('weights', lambda W_crew, W_payload, fuel_fraction, A, C, Kvs:
+                 we.SolveTakeoffWeight(W_crew, W_payload, fuel_fraction, A, C, Kvs))
+    graph.define('W0', lambda weights: weights[0])
+    graph.define('We', lambda weights: weights[1])
+    graph.define('diverged', lambda weights: weights[2])
+    graph.define('We_W0', lambda W0, We: We / W0)
+
+    graph.update(**inputs)
+    return graph
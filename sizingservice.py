@@ -0,0 +1,544 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Thu Oct 29 08:51:14 2026
+
+Long-running local sizing service, so design tools do not pay the interpreter startup, the workbook parse and
+the TOP fit on every query. The SizingData tables, the fitted TOP coefficients and the atmosphere table are loaded
+once, in the service and in every worker process, and JSON requests are answered over HTTP on a TCP port or a
+Unix socket.
+
+    POST /matchingchart     a batchsizing case, or {"cases": [...]}, gives W_S, W_P, feasible and active
+    POST /takeoffweight     W_crew, W_payload, fuel_fraction or segments, A and C or aircraft, gives W0 and We
+    POST /missionfraction   {"segments": [{"segment": "cruise", "R": ..., ...}], "reserve": 0.06}
+    GET  /status            request and batch counts of each endpoint
+
+Matching chart and takeoff weight requests arriving within a short window are solved together in one vectorized
+pass on a process pool, mission fractions are cheap enough to be answered at once.
+    python sizingservice.py --port 8765
+    python sizingservice.py --unix /tmp/sizing.sock
+@author: ardya
+"""
+
+import asyncio
+import http.client
+import json
+import os
+import socket
+import sys
+import time
+import numpy as np
+import atmosphere as at
+import performancesizing as pf
+import missionprofile as mp
+import weightestimation as we
+import sizingdata as sd
+import batchsizing as bs
+import instrumentation as it
+
+HOST = '127.0.0.1'
+PORT = 8765
+
+# Seconds a batch waits for more requests, and cases or designs solved together at most
+WINDOW = 0.002
+MAX_BATCH = 4096
+
+# Largest request body in bytes
+MAX_BODY = 16 * 2 ** 20
+
+_REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+            413: 'Payload Too Large', 500: 'Internal Server Error'}
+
+
+class _HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _Warm(TOP_cache):
+    # the tables every request reads, loaded once per process
+    at.AtmosphereTable()
+    pf.LoadTOPCoefficients(cache=TOP_cache)
+    return sd.LoadSizingData()
+
+
+@it.Traced('sizingservice.matchingchart')
+def _SolveMatchingCharts(cases):
+    return [{key: value for key, value in result.items() if key != 'case'} for result in bs._SolveIndexed((0, cases))]
+
+
+@it.Traced('sizingservice.takeoffweight')
+def _SolveWeights(designs):
+    columns = {key: np.array([design[key] for design in designs]) for key in designs[0]}
+    W0, We, diverged = we.SolveTakeoffWeight(columns['W_crew'], columns['W_payload'], columns['fuel_fraction'],
+                                             columns['A'], columns['C'], columns['Kvs'])
+    return [{'W0': W0[i], 'We': We[i], 'diverged': bool(diverged[i])} for i in range(len(designs))]
+
+
+def _JSON(value):
+    # numbers as plain floats and NaN as null, which strict JSON parsers refuse otherwise
+    if isinstance(value, dict):
+        return {key: _JSON(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return [_JSON(item) for item in value]
+    if isinstance(value, (bool, np.bool_)):
+        return bool(value)
+    if isinstance(value, (float, np.floating)):
+        return float(value) if np.isfinite(value) else None
+    if isinstance(value, np.integer):
+        return int(value)
+    return value
+
+
+def _Number(request, key, index, default=None, item='request'):
+    value = request.get(key, default)
+    if value is None:
+        raise ValueError(f'{item.capitalize()} {index} is missing {key}.')
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f'{key} of {item} {index} must be a number, not {value!r}.') from None
+
+
+def _Items(request, key):
+    # one item, or a list of them under key
+    if not isinstance(request, dict):
+        raise ValueError('The request must be a JSON object.')
+    if key not in request:
+        return [request], False
+    if not isinstance(request[key], list) or not request[key]:
+        raise ValueError(f'{key} must be a non-empty list.')
+    for i, item in enumerate(request[key]):
+        if not isinstance(item, dict):
+            raise ValueError(f'{key[:-1].capitalize()} {i} must be a JSON object.')
+    return request[key], True
+
+
+def MissionSegments(segments):
+    """
+    Function to build mission segments from their JSON description.
+
+    Parameters
+    ----------
+    segments : list of dict
+        Segments in flight order, the missionprofile.SEGMENTS name under 'segment' and the segment parameters,
+        e.g. {"segment": "cruise", "R": 6e6, "C": 1.4e-4, "L_D": 15, "V": 700}.
+
+    Returns
+    -------
+    list of Segment
+
+    """
+    if not isinstance(segments, list):
+        raise ValueError('segments must be a list.')
+    built = []
+    for i, segment in enumerate(segments):
+        if not isinstance(segment, dict):
+            raise ValueError(f'Segment {i} must be a JSON object.')
+        name = segment.get('segment')
+        if name not in mp.SEGMENTS:
+            raise ValueError(f'Segment {i} must be one of {", ".join(mp.SEGMENTS)}, not {name!r}.')
+        parameters = {key: _Number(segment, key, i, item='segment') for key in segment if key != 'segment'}
+        try:
+            built.append(mp.SEGMENTS[name](**parameters))
+        except TypeError as error:
+            # unknown or missing parameters of the segment
+            raise ValueError(f'Segment {i}: {error}') from None
+    return built
+
+
+class _Batcher:
+    # collects the items of concurrent requests and evaluates them together
+    def __init__(self, name, evaluate, service):
+        self.name = name
+        self.evaluate = evaluate
+        self.service = service
+        self.pending = []
+        self.size = 0
+        self.timer = None
+        self.batches = 0
+        self.items = 0
+
+    async def submit(self, items):
+        future = asyncio.get_running_loop().create_future()
+        self.pending.append((items, future))
+        self.size += len(items)
+        if self.size >= self.service.max_batch:
+            self.flush()
+        elif self.timer is None:
+            self.timer = asyncio.get_running_loop().call_later(self.service.window, self.flush)
+        return await future
+
+    def flush(self):
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        batch, self.pending, self.size = self.pending, [], 0
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._Run(batch))
+            self.service._tasks.add(task)
+            task.add_done_callback(self.service._tasks.discard)
+
+    async def _Run(self, batch):
+        items = [item for request, _ in batch for item in request]
+        self.batches += 1
+        self.items += len(items)
+        it.Count(f'sizingservice.{self.name}.batches')
+        it.Count(f'sizingservice.{self.name}.items', len(items))
+        try:
+            # timed where it runs, a span held across the await would interleave with the other batches
+            if self.service.pool is None:
+                results = self.evaluate(items)
+            else:
+                results = await asyncio.get_running_loop().run_in_executor(self.service.pool, self.evaluate, items)
+        except Exception as error:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        start = 0
+        for request, future in batch:
+            if not future.done():
+                future.set_result(results[start:start + len(request)])
+            start += len(request)
+
+
+class SizingService:
+    """
+    Sizing service answering JSON requests over HTTP, with warm lookup tables and micro-batched solves.
+
+        service = SizingService(port=8765)
+        asyncio.run(service.serve())
+
+    Parameters
+    ----------
+    host : str, optional
+        Address to listen on, the local host only by default.
+    port : int, optional
+        TCP port, 0 picks a free one.
+    unix : str, optional
+        Path of a Unix socket to listen on instead of a TCP port.
+    workers : int, optional
+        Number of worker processes, the CPU count by default. With 1 the batches are solved in the service process.
+    window : float, optional
+        Seconds a batch waits for more requests.
+    max_batch : int, optional
+        Cases or designs solved together at most, a full batch is solved without waiting.
+    TOP_cache : str, optional
+        Persisted TOP coefficient file shared by the workers, see performancesizing.LoadTOPCoefficients.
+
+    Attributes
+    ----------
+    address : tuple or str
+        Host and port, or the socket path, once listening.
+    requests : dict
+        Endpoint to the number of requests answered.
+
+    """
+
+    def __init__(self, host=HOST, port=PORT, unix=None, workers=None, window=WINDOW, max_batch=MAX_BATCH,
+                 TOP_cache=pf.TOP_CACHE):
+        self.host, self.port, self.unix = host, port, unix
+        self.workers = workers or os.cpu_count()
+        self.window = window
+        self.max_batch = max_batch
+        self.TOP_cache = TOP_cache
+        self.pool = None
+        self.server = None
+        self.address = None
+        self.requests = {}
+        self._tasks = set()
+        self._batchers = {'matchingchart': _Batcher('matchingchart', _SolveMatchingCharts, self),
+                          'takeoffweight': _Batcher('takeoffweight', _SolveWeights, self)}
+        self._routes = {'/matchingchart': ('POST', self._MatchingChart),
+                        '/takeoffweight': ('POST', self._TakeoffWeight),
+                        '/missionfraction': ('POST', self._MissionFraction),
+                        '/status': ('GET', self._Status)}
+
+    async def start(self):
+        """Warm the tables and the worker processes, and start listening."""
+        self.tables = _Warm(self.TOP_cache)
+        self.started = time.time()
+        if self.workers != 1:
+            from concurrent.futures import ProcessPoolExecutor
+
+            self.pool = ProcessPoolExecutor(self.workers, initializer=_Warm, initargs=(self.TOP_cache,))
+            # start every worker now, not on the first requests
+            loop = asyncio.get_running_loop()
+            await asyncio.gather(*[loop.run_in_executor(self.pool, os.getpid)
+                                   for _ in range(self.workers)])
+
+        if self.unix is not None:
+            if os.path.exists(self.unix):
+                os.remove(self.unix)
+            self.server = await asyncio.start_unix_server(self._Connection, self.unix)
+            self.address = self.unix
+        else:
+            self.server = await asyncio.start_server(self._Connection, self.host, self.port)
+            self.address = self.server.sockets[0].getsockname()[:2]
+        return self
+
+    async def close(self):
+        """Stop listening, finish the batches in flight and shut the workers down."""
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        for batcher in self._batchers.values():
+            batcher.flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+        if self.unix is not None and os.path.exists(self.unix):
+            os.remove(self.unix)
+
+    async def serve(self):
+        """Start the service and answer requests until cancelled."""
+        await self.start()
+        print(f'Sizing service listening on {self.address}', file=sys.stderr, flush=True)
+        try:
+            await self.server.serve_forever()
+        finally:
+            await self.close()
+
+    async def _Connection(self, reader, writer):
+        # HTTP/1.1 with keep-alive, one request after the other on a connection
+        try:
+            while True:
+                try:
+                    request = await _ReadRequest(reader)
+                except _HTTPError as error:
+                    _WriteResponse(writer, error.status, {'error': str(error)}, False)
+                    break
+                if request is None:
+                    break
+                method, path, headers, body = request
+                status, payload = await self._Dispatch(method, path, body)
+                keep_alive = headers.get('connection', '').lower() != 'close'
+                _WriteResponse(writer, status, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _Dispatch(self, method, path, body):
+        route = self._routes.get(path.split('?')[0].rstrip('/') or '/')
+        if route is None:
+            return 404, {'error': f'Unknown endpoint {path}, expected one of: {", ".join(self._routes)}'}
+        if method != route[0]:
+            return 405, {'error': f'{path} accepts {route[0]} requests.'}
+        self.requests[path] = self.requests.get(path, 0) + 1
+        it.Count('sizingservice.requests')
+        try:
+            request = json.loads(body) if body else {}
+            return 200, _JSON(await route[1](request))
+        except (ValueError, KeyError) as error:
+            return 400, {'error': str(error.args[0]) if error.args else type(error).__name__}
+        except Exception as error:
+            return 500, {'error': f'{type(error).__name__}: {error}'}
+
+    async def _MatchingChart(self, request):
+        items, many = _Items(request, 'cases')
+        cases = []
+        for i, item in enumerate(items):
+            if item.get('criteria') not in pf.TOP_CRITERIA:
+                raise ValueError(f'criteria of case {i} must be one of {", ".join(pf.TOP_CRITERIA)}.')
+            case = {field: _Number(item, field, i) for field in bs.CASE_FIELDS if field not in ('criteria', 'Vs')}
+            case['criteria'] = item['criteria']
+            case['Vs'] = None if item.get('Vs') is None else _Number(item, 'Vs', i)
+            cases.append(case)
+        results = await self._batchers['matchingchart'].submit(cases)
+        return {'results': [dict(result, case=i) for i, result in enumerate(results)]} if many else results[0]
+
+    async def _TakeoffWeight(self, request):
+        items, many = _Items(request, 'designs')
+        designs = []
+        for i, item in enumerate(items):
+            design = {'W_crew': _Number(item, 'W_crew', i), 'W_payload': _Number(item, 'W_payload', i)}
+            if 'segments' in item:
+                design['fuel_fraction'] = float(mp.MissionFuelFraction(MissionSegments(item['segments']),
+                                                                       _Number(item, 'reserve', i, 0.0)))
+            else:
+                design['fuel_fraction'] = _Number(item, 'fuel_fraction', i)
+            if 'aircraft' in item:
+                # Raymer's empty weight fraction of the aircraft type, from the warm SizingData tables
+                table = self.tables['EmptyWeightFraction']
+                design['A'], design['C'] = table[item['aircraft'], 'A'], table[item['aircraft'], 'C']
+            else:
+                design['A'], design['C'] = _Number(item, 'A', i), _Number(item, 'C', i)
+            design['Kvs'] = _Number(item, 'Kvs', i, 1.0)
+            designs.append(design)
+        results = await self._batchers['takeoffweight'].submit(designs)
+        results = [dict(result, fuel_fraction=design['fuel_fraction']) for result, design in zip(results, designs)]
+        return {'results': results} if many else results[0]
+
+    async def _MissionFraction(self, request):
+        items, many = _Items(request, 'missions')
+        results = []
+        for i, item in enumerate(items):
+            segments = MissionSegments(item.get('segments'))
+            results.append({'fuel_fraction': mp.MissionFuelFraction(segments, _Number(item, 'reserve', i, 0.0)),
+                            'segments': [segment.fraction() for segment in segments]})
+        return {'results': results} if many else results[0]
+
+    async def _Status(self, request):
+        return {'uptime': time.time() - self.started, 'pid': os.getpid(),
+                'workers': self.workers,
+                'requests': self.requests, 'tables': sorted(self.tables),
+                'batches': {name: {'batches': batcher.batches, 'items': batcher.items}
+                            for name, batcher in self._batchers.items()}}
+
+
+async def _ReadRequest(reader):
+    line = await reader.readline()
+    if not line:
+        return None
+    try:
+        method, path, _ = line.decode('latin-1').split()
+    except ValueError:
+        raise _HTTPError(400, 'Malformed request line.') from None
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+    try:
+        length = int(headers.get('content-length', 0))
+    except ValueError:
+        raise _HTTPError(400, 'Malformed Content-Length.') from None
+    if length > MAX_BODY:
+        raise _HTTPError(413, f'Request body larger than {MAX_BODY} bytes.')
+    body = await reader.readexactly(length) if length else b''
+    return method.upper(), path, headers, body
+
+
+def _WriteResponse(writer, status, payload, keep_alive):
+    body = json.dumps(payload).encode()
+    head = (f'HTTP/1.1 {status} {_REASONS[status]}\r\nContent-Type: application/json\r\n'
+            f'Content-Length: {len(body)}\r\nConnection: {"keep-alive" if keep_alive else "close"}\r\n\r\n')
+    writer.write(head.encode('latin-1') + body)
+
+
+class _UnixConnection(http.client.HTTPConnection):
+    def __init__(self, path, timeout):
+        super().__init__('localhost', timeout=timeout)
+        self.path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.path)
+
+
+class SizingClient:
+    """
+    Client of a running SizingService, keeping its connection open between requests.
+
+        client = SizingClient(port=8765)
+        client.takeoff_weight(W_crew=400, W_payload=2000, fuel_fraction=0.2, aircraft='Jet transport')
+
+    Parameters
+    ----------
+    host : str, optional
+        Address of the service.
+    port : int, optional
+        TCP port of the service.
+    unix : str, optional
+        Path of the Unix socket of the service, instead of host and port.
+    timeout : float, optional
+        Seconds to wait for an answer.
+
+    """
+
+    def __init__(self, host=HOST, port=PORT, unix=None, timeout=60.0):
+        self.connection = _UnixConnection(unix, timeout) if unix else http.client.HTTPConnection(host, port,
+                                                                                                 timeout=timeout)
+
+    def request(self, path, payload=None):
+        """
+        Function to send a request to an endpoint of the service.
+
+        Parameters
+        ----------
+        path : str
+            Endpoint, e.g. '/matchingchart'.
+        payload : dict, optional
+            JSON request, posted when given.
+
+        Returns
+        -------
+        dict
+            JSON answer, NaN results are None.
+
+        """
+        if payload is None:
+            self.connection.request('GET', path)
+        else:
+            self.connection.request('POST', path, json.dumps(_JSON(payload)),
+                                    {'Content-Type': 'application/json'})
+        response = self.connection.getresponse()
+        answer = json.loads(response.read())
+        if response.status != 200:
+            raise ValueError(f'{path}: {answer.get("error", response.reason)}')
+        return answer
+
+    def matching_chart(self, cases):
+        """Design point of a requirement case, or the list of results of a list of cases."""
+        if isinstance(cases, dict):
+            return self.request('/matchingchart', cases)
+        return self.request('/matchingchart', {'cases': list(cases)})['results']
+
+    def takeoff_weight(self, **design):
+        """Takeoff weight, empty weight and fuel fraction of a design."""
+        return self.request('/takeoffweight', design)
+
+    def mission_fraction(self, segments, reserve=0.0):
+        """Fuel fraction of a mission and the weight fraction of each segment."""
+        return self.request('/missionfraction', {'segments': segments, 'reserve': reserve})
+
+    def status(self):
+        """Request and batch counts of the service."""
+        return self.request('/status')
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Serve matching chart, takeoff weight and mission fraction '
+                                                 'requests with warm sizing tables.')
+    parser.add_argument('--host', default=HOST, help='address to listen on')
+    parser.add_argument('-p', '--port', type=int, default=PORT, help='TCP port')
+    parser.add_argument('--unix', help='Unix socket path to listen on instead of a TCP port')
+    parser.add_argument('-w', '--workers', type=int, default=None, help='number of worker processes')
+    parser.add_argument('--window', type=float, default=WINDOW * 1e3, help='milliseconds a batch waits for requests')
+    parser.add_argument('--max-batch', type=int, default=MAX_BATCH, help='cases or designs solved together at most')
+    parser.add_argument('--top-cache', default=pf.TOP_CACHE, help='persisted TOP coefficient file')
+    args = parser.parse_args(argv)
+
+    service = SizingService(args.host, args.port, args.unix, args.workers, args.window * 1e-3, args.max_batch,
+                            args.top_cache)
+
+    try:
+        asyncio.run(service.serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
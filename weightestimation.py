@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 08:31:45 2026
+
+Vectorized takeoff weight convergence for the initial weight estimation.
+@author: ardya
+"""
+
+import numpy as np
+import instrumentation as it
+
+
+def EmptyWeightFraction(W0, A, C, Kvs=1):
+    """
+    Function to calculate the empty weight fraction from the statistical fit We/W0 = A * W0**C * Kvs.
+
+    Parameters
+    ----------
+    W0 : float or array of floats
+        Takeoff weight in lbs.
+    A : float or array of floats
+        Empty weight fraction coefficient of the aircraft type.
+    C : float or array of floats
+        Empty weight fraction exponent of the aircraft type.
+    Kvs : float or array of floats, optional
+        Variable sweep factor, 1.04 for variable sweep and 1 otherwise.
+
+    Returns
+    -------
+    We_W0 : float or array of floats
+        Empty weight fraction.
+
+    """
+    return A * W0**C * Kvs
+
+
+@it.Traced('weightestimation.solve_takeoff_weight')
+def SolveTakeoffWeight(W_crew, W_payload, fuel_fraction, A, C, Kvs=1, rtol=1e-10, maxiter=100):
+    """
+    Function to converge the takeoff weight W0 = (W_crew + W_payload) / (1 - fuel_fraction - We/W0) of many designs
+    at once. Each design is solved with Newton's method safeguarded by a bisection bracket.
+
+    Parameters
+    ----------
+    W_crew : float or array of floats
+        Weight of the crew in lbs.
+    W_payload : float or array of floats
+        Weight of the payload in lbs.
+    fuel_fraction : float or array of floats
+        Total mission fuel fraction Wf/W0.
+    A : float or array of floats
+        Empty weight fraction coefficient of the aircraft type.
+    C : float or array of floats
+        Empty weight fraction exponent of the aircraft type.
+    Kvs : float or array of floats, optional
+        Variable sweep factor, 1.04 for variable sweep and 1 otherwise.
+    rtol : float, optional
+        Relative tolerance on W0.
+    maxiter : int, optional
+        Maximum number of Newton iterations.
+
+    Returns
+    -------
+    W0 : float or array of floats
+        Takeoff weight in lbs, NaN for divergent designs.
+    We : float or array of floats
+        Empty weight in lbs, NaN for divergent designs.
+    diverged : bool or array of bools
+        Designs without a takeoff weight, where 1 - fuel_fraction - We/W0 <= 0 or the iteration did not converge.
+
+    """
+    W_fixed, fuel_fraction, A, C, Kvs = np.broadcast_arrays(*(np.asarray(value, dtype=float) for value in
+                                                             (np.add(W_crew, W_payload), fuel_fraction, A, C, Kvs)))
+    scalar = W_fixed.ndim == 0
+    W_fixed, fuel_fraction, A, C, Kvs = (np.atleast_1d(value) for value in (W_fixed, fuel_fraction, A, C, Kvs))
+    K = A * Kvs
+    available = 1 - fuel_fraction
+
+    def residual(W0):
+        # W0 * (1 - fuel_fraction - We/W0) - W_fixed, zero at the converged takeoff weight
+        return W0 * (available - K * W0**C) - W_fixed
+
+    def slope(W0):
+        return available - K * (1 + C) * W0**C
+
+    with np.errstate(all='ignore'):
+        # W0 always exceeds W_fixed / (1 - fuel_fraction), where the residual is negative
+        diverged = ~(available > 0) | ~(W_fixed > 0)
+        lo = np.where(diverged, 1.0, W_fixed / available)
+
+        # residual is convex for C < 0 and increases past lo, for C > 0 it is concave and peaks at W0peak
+        W0peak = (available / (K * (1 + C)))**(1 / C)
+        concave = C > 0
+        diverged |= concave & ~(residual(W0peak) > 0)
+        diverged |= (C == 0) & ~(available - K > 0)
+        # W0 also exceeds the weight where We/W0 alone uses up the available fraction when C < 0
+        W0min = np.where(C < 0, (available / K)**(1 / C), 0)
+        hi = np.where(concave & ~diverged, W0peak, 2 * np.fmax(lo, W0min))
+        for i in range(1100):
+            grow = ~diverged & ~concave & (residual(hi) <= 0)
+            if not grow.any():
+                break
+            hi = np.where(grow, 2 * hi, hi)
+        diverged |= ~np.isfinite(hi)
+
+        # Newton iterates approach the root monotonically from the side where the residual is positive when convex
+        # and negative when concave
+        W0 = np.where(concave, lo, hi)
+        converged = diverged.copy()
+        it.Count('weightestimation.designs', W0.size)
+        for i in range(maxiter):
+            it.Count('weightestimation.newton_iterations')
+            F = residual(W0)
+            lo = np.where(F < 0, W0, lo)
+            hi = np.where(F < 0, hi, W0)
+            step = W0 - F / slope(W0)
+            # fall back to bisection when the Newton step leaves the bracket
+            step = np.where((step >= lo) & (step <= hi), step, 0.5 * (lo + hi))
+            W0, converged = np.where(converged, W0, step), converged | (np.abs(step - W0) <= rtol * np.abs(W0))
+            if converged.all():
+                break
+
+        diverged |= ~converged | ~(available - K * W0**C > 0)
+        W0 = np.where(diverged, np.nan, W0)
+        We = EmptyWeightFraction(W0, A, C, Kvs) * W0
+
+    if scalar:
+        return W0[0], We[0], bool(diverged[0])
+    return W0, We, diverged
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 15:20:33 2026
+
+Parallel XFOIL polar runner. Every job runs in its own temporary directory with a timeout,
+so any number of runs can share a working directory.
+@author: ardya
+"""
+
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+import os
+import shutil
+import signal
+import subprocess
+import tempfile
+import time
+import numpy as np
+import instrumentation as it
+
+if os.name == 'nt':
+    XFOIL = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'xfoil.exe')
+else:
+    XFOIL = shutil.which('xfoil') or 'xfoil'
+
+PolarJob = namedtuple('PolarJob', ['coordinates', 'reynolds', 'mach', 'n_crit', 'alphas', 'iteration', 'pane',
+                                   'norm', 'name'],
+                      defaults=(0.0, 9, tuple(np.arange(0, 20, .5)), 100, True, True, 'airfoil'))
+PolarJob.__doc__ = """
+XFOIL polar job.
+
+Parameters
+----------
+coordinates : array of floats
+    Airfoil coordinates of shape (n_points, 2) in XFOIL order, trailing edge over the upper surface to the
+    leading edge and back over the lower surface.
+reynolds : float
+    Reynolds number, 0 for an inviscid analysis.
+mach : float, optional
+    Mach number.
+n_crit : float, optional
+    Critical amplification factor of the e^n transition model.
+alphas : sequence of floats, optional
+    Angles of attack in degrees.
+iteration : int, optional
+    Maximum number of viscous iterations per angle of attack.
+pane : bool, optional
+    Whether XFOIL repanels the geometry.
+norm : bool, optional
+    Whether XFOIL normalizes the geometry to unit chord.
+name : str, optional
+    Airfoil name.
+"""
+
+PolarResult = namedtuple('PolarResult', ['job', 'polar', 'returncode', 'timed_out', 'output', 'cache_hits'],
+                         defaults=(0,))
+PolarResult.__doc__ = """
+Result of a polar job, polar is a structured array with the XFOIL polar columns (alpha, CL, CD, CDp, CM, Top_Xtr,
+Bot_Xtr), one row per converged angle of attack. cache_hits counts the angles of attack served from a PolarCache,
+returncode is None when XFOIL did not have to run.
+"""
+
+POLAR_FILE = 'polar.txt'
+GEOMETRY_FILE = 'airfoil.dat'
+POLAR_DTYPE = [(name, float) for name in ('alpha', 'CL', 'CD', 'CDp', 'CM', 'Top_Xtr', 'Bot_Xtr')]
+
+
+def _Commands(job):
+    commands = ['PLOP', 'G F', '', f'LOAD {GEOMETRY_FILE}']
+    if job.norm:
+        commands.append('NORM')
+    if job.pane:
+        commands.append('PANE')
+    commands += ['OPER']
+    if job.reynolds:
+        commands.append(f'VISC {job.reynolds:g}')
+    commands += [f'MACH {job.mach:g}', 'VPAR', f'N {job.n_crit:g}', '', f'ITER {job.iteration:d}',
+                 'PACC', POLAR_FILE, '']
+    commands += [f'ALFA {alpha:g}' for alpha in job.alphas]
+    commands += ['PACC', '', '', 'QUIT', '']
+    return '\n'.join(commands)
+
+
+def ReadPolar(filename):
+    """
+    Function to read an XFOIL polar file into a structured array.
+
+    Parameters
+    ----------
+    filename : str
+        Path to the polar file.
+
+    Returns
+    -------
+    polar : structured array
+        One row per angle of attack, with the fields of the polar column header.
+
+    """
+    with open(filename) as file:
+        lines = file.read().splitlines()
+    for i, line in enumerate(lines):
+        if line.strip().startswith('---'):
+            names = lines[i - 1].split()
+            rows = [line.split() for line in lines[i + 1:] if line.strip()]
+            break
+    else:
+        raise ValueError(f'{filename} is not an XFOIL polar file.')
+    dtype = [(name, float) for name in names]
+    return np.array([tuple(float(value) for value in row[:len(names)]) for row in rows], dtype=dtype)
+
+
+@it.Traced('xfoil.run')
+def _RunXfoil(job, executable, timeout):
+    command = [executable] if isinstance(executable, str) else list(executable)
+    with tempfile.TemporaryDirectory(prefix='xfoil-') as directory:
+        coordinates = np.asarray(job.coordinates, dtype=float)
+        with open(os.path.join(directory, GEOMETRY_FILE), 'w') as file:
+            file.write(f'{job.name}\n')
+            np.savetxt(file, coordinates, fmt='%12.8f')
+
+        # own process group so a hung run can be killed together with anything it spawned
+        options = {'start_new_session': True} if os.name != 'nt' else {}
+        process = subprocess.Popen(command, cwd=directory, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                   stderr=subprocess.STDOUT, universal_newlines=True, **options)
+        timed_out = False
+        start = time.perf_counter()
+        try:
+            output, _ = process.communicate(_Commands(job), timeout=timeout)
+        except subprocess.TimeoutExpired:
+            timed_out = True
+            if os.name != 'nt':
+                os.killpg(process.pid, signal.SIGKILL)
+            else:
+                process.kill()
+            output, _ = process.communicate()
+            it.Count('xfoil.timeouts')
+        it.Count('xfoil.runs')
+        it.Count('xfoil.wall_time', time.perf_counter() - start)
+
+        polar_file = os.path.join(directory, POLAR_FILE)
+        try:
+            polar = ReadPolar(polar_file)
+        except (OSError, ValueError):
+            polar = np.zeros(0, dtype=POLAR_DTYPE)
+    return PolarResult(job, polar, process.returncode, timed_out, output)
+
+
+def RunPolar(job, executable=XFOIL, timeout=60, cache=None):
+    """
+    Function to run one polar job through XFOIL in a temporary directory.
+
+    Parameters
+    ----------
+    job : PolarJob
+        Geometry and analysis settings.
+    executable : str or list of str, optional
+        XFOIL executable, or a command line whose first items start it.
+    timeout : float, optional
+        Wall time limit in seconds. A hung XFOIL is killed and the angles converged so far are returned.
+    cache : PolarCache, optional
+        Polar cache, only the angles of attack it does not hold yet are computed.
+
+    Returns
+    -------
+    PolarResult
+        Polar of the job, exit code, timeout flag and the console output of XFOIL.
+
+    """
+    if cache is None:
+        return _RunXfoil(job, executable, timeout)
+
+    cached, missing = cache.get(job)
+    hits = len(job.alphas) - len(missing)
+    it.Count('polarcache.hits', hits)
+    it.Count('polarcache.misses', len(missing))
+    if len(missing) == 0:
+        return PolarResult(job, cached, None, False, '', hits)
+
+    result = _RunXfoil(job._replace(alphas=tuple(missing)), executable, timeout)
+    # angles a killed run never reached are not remembered as failing
+    cache.put(job, result.polar, attempted=None if result.timed_out else missing)
+    polar = result.polar
+    if cached is not None and len(cached) and cached.dtype == polar.dtype:
+        polar = np.concatenate([cached, polar])
+        polar = polar[np.argsort(polar['alpha'], kind='stable')]
+    return result._replace(job=job, polar=polar, cache_hits=hits)
+
+
+@it.Traced('xfoil.run_polars')
+def RunPolars(jobs, executable=XFOIL, workers=None, timeout=60, cache=None):
+    """
+    Function to run many polar jobs in parallel, each XFOIL process in its own temporary directory.
+
+    Parameters
+    ----------
+    jobs : iterable of PolarJob
+        Geometry and analysis settings of each polar.
+    executable : str or list of str, optional
+        XFOIL executable, or a command line whose first items start it.
+    workers : int, optional
+        Number of XFOIL processes running at once, the CPU count by default.
+    timeout : float, optional
+        Wall time limit of each job in seconds.
+    cache : PolarCache, optional
+        Polar cache, only the angles of attack it does not hold yet are computed.
+
+    Returns
+    -------
+    results : list of PolarResult
+        Results in the order of the jobs.
+
+    """
+    workers = workers or os.cpu_count() or 1
+    # threads are enough, the work happens in the XFOIL processes
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(lambda job: RunPolar(job, executable, timeout, cache), jobs))